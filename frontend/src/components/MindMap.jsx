@@ -44,7 +44,9 @@ const MindMap = ({ boardData, onClose }) => {
         });
 
         return { nodes: processedNodes, links: boardData.links };
-    }, [boardData]);
+        // The server bumps version only when the graph changes
+        // eslint-disable-next-line react-hooks/exhaustive-deps
+    }, [boardData?.version ?? boardData]);
 
     if (!boardData || !boardData.nodes || boardData.nodes.length === 0) {
         return (
@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
+from typing import Any, Dict, List, Optional, Union
 from fastapi.middleware.cors import CORSMiddleware
 import sys
 import os
@@ -22,28 +23,60 @@ app.add_middleware(
 # Global Game Instance (Single Player for now)
 game_instance = Game()
 
+
+@app.on_event("shutdown")
+def close_game():
+    with game_instance.turn_lock:
+        game_instance.close()
+
 class ActionRequest(BaseModel):
-    input: str
+    # Either free text, or a structured action that skips the parser:
+    # {"choice_index": 0} or {"verb": "EXAMINE", "target": "desk"}
+    input: Optional[str] = None
+    choice_index: Optional[int] = None
+    verb: Optional[str] = None
+    target: Optional[str] = None
+
+    def to_action(self):
+        if self.input is not None:
+            return self.input
+        return {"choice_index": self.choice_index, "verb": self.verb, "target": self.target}
+
+class BatchRequest(BaseModel):
+    inputs: List[Union[str, Dict[str, Any]]]
+
+# Upper bound on commands per batch request
+MAX_BATCH_SIZE = 200
 
 @app.post("/api/start")
 def start_game():
-    output = game_instance.start_game()
-    return {
-        "output": output,
-        "state": game_instance.get_ui_state()
-    }
+    with game_instance.turn_lock:
+        output = game_instance.start_game()
+        return {
+            "output": output,
+            "state": game_instance.get_ui_state()
+        }
 
 @app.post("/api/action")
 def take_action(request: ActionRequest):
-    output = game_instance.step(request.input)
-    return {
-        "output": output,
-        "state": game_instance.get_ui_state()
-    }
+    with game_instance.turn_lock:
+        output = game_instance.step(request.to_action())
+        return {
+            "output": output,
+            "state": game_instance.get_ui_state()
+        }
+
+@app.post("/api/batch")
+def take_batch(request: BatchRequest):
+    """Run several commands in one round trip; UI state is returned once."""
+    if len(request.inputs) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {MAX_BATCH_SIZE} commands")
+    return game_instance.step_many(request.inputs)
 
 @app.get("/api/state")
 def get_state():
-    return game_instance.get_ui_state()
+    with game_instance.turn_lock:
+        return game_instance.get_ui_state()
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,310 @@
+"""
+Dialogue Graph Cache
+
+Parsed, validated dialogue trees shared by every DialogueManager in the
+process. Graphs are keyed by file path and modification time, so a
+conversation only hits the disk the first time its tree is used (or after
+the file is edited). Choice requirements and passive checks are compiled
+once per graph into small tuples that DialogueManager evaluates directly.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+EXIT_NODE = "EXIT_DIALOGUE"
+
+# A compiled requirement takes the DialogueManager and returns a block reason or None.
+# Each one also carries a `gate` tuple naming what it tests, for offline analysis:
+# ("skill", name, level), ("theory", id), ("theory_blocked", id),
+# ("relationship", npc_id), ("flag", name).
+Requirement = Callable[[Any], Optional[str]]
+
+
+# ---------------------------------------------------------------------------
+# Requirement compilation
+# ---------------------------------------------------------------------------
+
+def _skill_gate(skill_name, level_req):
+    def check(dm):
+        skill = dm.skill_system.get_skill(skill_name)
+        if not skill or skill.effective_level < level_req:
+            return f"[{skill_name} < {level_req}]"
+        return None
+    check.gate = ("skill", skill_name, level_req)
+    return check
+
+
+def _theory_required(theory_id):
+    def check(dm):
+        if not dm.board.is_theory_active(theory_id):
+            return f"[Requires Theory: {theory_id}]"
+        return None
+    check.gate = ("theory", theory_id)
+    return check
+
+
+def _theory_blocked(theory_id):
+    def check(dm):
+        if dm.board.is_theory_active(theory_id):
+            return f"[Blocked by Theory: {theory_id}]"
+        return None
+    check.gate = ("theory_blocked", theory_id)
+    return check
+
+
+# (gate key, npc attribute, is_maximum, reason label)
+_RELATIONSHIP_BOUNDS = (
+    ("trust_min", "trust", False, "Trust <"),
+    ("rapport_min", "rapport", False, "Rapport <"),
+    ("respect_min", "respect", False, "Respect <"),
+    ("fear_max", "fear", True, "Fear >"),
+)
+
+
+def _relationship_gate(gate):
+    npc_override = gate.get("npc_id")
+    bounds = tuple(
+        (attr, gate[key], is_max, f"[{label} {gate[key]}]")
+        for key, attr, is_max, label in _RELATIONSHIP_BOUNDS if key in gate
+    )
+
+    def check(dm):
+        if not (dm.npc_system and dm.current_npc_id):
+            return None
+        npc = dm.npc_system.get_npc(npc_override or dm.current_npc_id)
+        if not npc:
+            return None
+        for attr, limit, is_max, reason in bounds:
+            value = getattr(npc, attr)
+            if (value > limit) if is_max else (value < limit):
+                return reason
+        return None
+    check.gate = ("relationship", npc_override or "current")
+    return check
+
+
+def _emotional_flag(required_flag):
+    def check(dm):
+        if not (dm.npc_system and dm.current_npc_id):
+            return None
+        npc = dm.npc_system.get_npc(dm.current_npc_id)
+        if npc and required_flag not in npc.emotional_flags:
+            return f"[Requires: {required_flag}]"
+        return None
+    check.gate = ("flag", required_flag)
+    return check
+
+
+def compile_requirements(choice: dict) -> Tuple[Requirement, ...]:
+    """
+    Compile a choice's gates into an ordered tuple of checks.
+
+    Order matches DialogueManager's original evaluation order so the first
+    failing gate reports the same reason. Ungated choices compile to ().
+    """
+    checks: List[Requirement] = []
+
+    # 1. Skill Gates (Level check)
+    if "skill_gate" in choice:
+        gate = choice["skill_gate"]
+        checks.append(_skill_gate(gate.get("skill"), gate.get("level", 0)))
+
+    # 2. Theory conditions
+    if "theory_req" in choice or "require_theory" in choice:
+        checks.append(_theory_required(choice.get("theory_req", choice.get("require_theory"))))
+
+    # Week 12: Theory blocking
+    if "theory_blocked" in choice:
+        checks.append(_theory_blocked(choice["theory_blocked"]))
+
+    # Week 12: Relationship gates
+    if "relationship_gate" in choice:
+        checks.append(_relationship_gate(choice["relationship_gate"]))
+
+    # Week 12: Emotional flag requirements
+    if "emotional_flag_required" in choice:
+        checks.append(_emotional_flag(choice["emotional_flag_required"]))
+
+    return tuple(checks)
+
+
+def evaluate_requirements(checks: Tuple[Requirement, ...], dm) -> Tuple[bool, str]:
+    """Run compiled checks; returns (allowed, reason) like _check_requirements."""
+    for check in checks:
+        reason = check(dm)
+        if reason:
+            return False, reason
+    return True, ""
+
+
+# ---------------------------------------------------------------------------
+# Passive check compilation
+# ---------------------------------------------------------------------------
+
+class PassivePlan:
+    """Pre-extracted passive check inputs for one node."""
+
+    __slots__ = ("context_text", "explicit", "legacy")
+
+    def __init__(self, node: dict):
+        text_data = node.get("text", "")
+        if isinstance(text_data, dict):
+            self.context_text = text_data.get("base", "")
+        else:
+            self.context_text = text_data
+
+        # Explicit passives with their title-cased form for de-duplication
+        self.explicit: Tuple[Tuple[str, str], ...] = tuple(
+            (skill_name, skill_name.title()) for skill_name in node.get("passives", [])
+        )
+
+        # Old Format support: (skill, dc, interjection)
+        self.legacy: Tuple[Tuple[str, int, str], ...] = tuple(
+            (check.get("skill"), check.get("dc", 10), check.get("interjection", ""))
+            for check in node.get("passive_checks", [])
+        )
+
+
+# ---------------------------------------------------------------------------
+# Graphs
+# ---------------------------------------------------------------------------
+
+class DialogueGraph:
+    """A validated dialogue tree with its compiled requirements and passive plans."""
+
+    def __init__(self, dialogue_id: str, data: dict, path: str = "", mtime: int = 0):
+        self.dialogue_id = dialogue_id
+        self.path = path
+        self.mtime = mtime
+        self.npc_id = data.get("npc_id")
+
+        # Support both old 'nodes' and new 'lines' format
+        nodes_data = data.get("nodes", data.get("lines", []))
+        if not isinstance(nodes_data, list):
+            raise ValueError("'nodes' must be a list")
+
+        self.nodes: Dict[str, dict] = {}
+        for position, node in enumerate(nodes_data):
+            if not isinstance(node, dict) or "id" not in node:
+                raise ValueError(f"Node #{position} has no id")
+            self.nodes[node["id"]] = node
+
+        if not self.nodes:
+            raise ValueError("No nodes in dialogue file.")
+
+        # Start at root, 'start' or first node
+        start_node = data.get("start_node", "start")
+        if start_node not in self.nodes:
+            start_node = next(iter(self.nodes))
+        self.start_node = start_node
+
+        self.requirements: Dict[str, Tuple[Tuple[Requirement, ...], ...]] = {}
+        self.passives: Dict[str, PassivePlan] = {}
+        for node_id, node in self.nodes.items():
+            self.requirements[node_id] = tuple(compile_requirements(c) for c in node.get("choices", []))
+            self.passives[node_id] = PassivePlan(node)
+
+    def edges(self, node_id: str) -> List[str]:
+        """Every node id reachable in one step from node_id (choices, checks, topics, triggers)."""
+        node = self.nodes.get(node_id, {})
+        targets = [c.get("next") for c in node.get("choices", [])]
+        check = node.get("check")
+        if check:
+            targets += [check.get("success_next"), check.get("fail_next")]
+        targets += [t.get("next") for t in node.get("topics", [])]
+        targets += list(node.get("parser_triggers", {}).values())
+        return [t for t in targets if t in self.nodes]
+
+    @classmethod
+    def from_file(cls, dialogue_id: str, path: str) -> "DialogueGraph":
+        mtime = os.stat(path).st_mtime_ns
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(dialogue_id, data, path=path, mtime=mtime)
+
+
+class DialogueCache:
+    """
+    Process-wide cache of DialogueGraphs keyed by path.
+
+    Entries are revalidated against the file's mtime at most once every
+    `stat_interval` seconds (None disables revalidation entirely), so hot
+    conversations are served from memory without a stat per start.
+    """
+
+    def __init__(self, stat_interval: Optional[float] = 2.0):
+        self.stat_interval = stat_interval
+        self._graphs: Dict[str, DialogueGraph] = {}
+        self._checked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, dialogue_id: str, dialogues_dir: str) -> DialogueGraph:
+        """
+        Return the graph for dialogue_id, loading or reloading it as needed.
+
+        Raises FileNotFoundError if the file is missing and ValueError/
+        json.JSONDecodeError if it is malformed.
+        """
+        path = os.path.abspath(os.path.join(dialogues_dir, f"{dialogue_id}.json"))
+        now = time.monotonic()
+
+        with self._lock:
+            graph = self._graphs.get(path)
+            if graph is not None:
+                last = self._checked.get(path, 0.0)
+                if self.stat_interval is None or now - last < self.stat_interval:
+                    self.hits += 1
+                    return graph
+                try:
+                    fresh = os.stat(path).st_mtime_ns == graph.mtime
+                except OSError:
+                    fresh = False
+                if fresh:
+                    self._checked[path] = now
+                    self.hits += 1
+                    return graph
+
+            self.misses += 1
+            try:
+                graph = DialogueGraph.from_file(dialogue_id, path)
+            except Exception:
+                self._graphs.pop(path, None)
+                raise
+            self._graphs[path] = graph
+            self._checked[path] = now
+            return graph
+
+    def warmup(self, dialogue_ids: Iterable[str], dialogues_dir: str) -> int:
+        """Preload dialogues; missing or malformed files are skipped. Returns the number loaded."""
+        loaded = 0
+        for dialogue_id in set(filter(None, dialogue_ids)):
+            try:
+                self.get(dialogue_id, dialogues_dir)
+                loaded += 1
+            except (OSError, ValueError):
+                continue
+        return loaded
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop one cached path, or everything."""
+        with self._lock:
+            if path is None:
+                self._graphs.clear()
+                self._checked.clear()
+            else:
+                path = os.path.abspath(path)
+                self._graphs.pop(path, None)
+                self._checked.pop(path, None)
+
+    def __len__(self):
+        return len(self._graphs)
+
+
+# Shared by every DialogueManager in the process
+DIALOGUE_CACHE = DialogueCache()
@@ -3,21 +3,27 @@ import os
 import random
 from typing import Dict, List, Optional, Any, Tuple
 from engine.text_composer import TextComposer, DialogueTextComposer, Archetype
+from content.dialogue_graph import (
+    DIALOGUE_CACHE, PassivePlan, compile_requirements, evaluate_requirements
+)
 
 class DialogueManager:
-    def __init__(self, skill_system, board, player_state, npc_system=None):
+    def __init__(self, skill_system, board, player_state, npc_system=None, dialogue_cache=None,
+                 lens_system=None):
         self.skill_system = skill_system
         self.board = board
         self.player_state = player_state
         self.npc_system = npc_system  # Week 12: For relationship gates
         
-        # Initialize Text Composer (Week 25)
-        self.text_composer = TextComposer(skill_system, board, player_state)
+        # Initialize Text Composer (Week 25); lens_system is the game's shared lens
+        self.text_composer = TextComposer(skill_system, board, player_state, lens_system=lens_system)
         self.dialogue_composer = DialogueTextComposer(self.text_composer)
 
         self.current_dialogue_id = None
         self.current_npc_id = None  # Track which NPC we're talking to
         self.nodes = {}
+        self.graph = None  # Shared, compiled DialogueGraph for the current tree
+        self.dialogue_cache = dialogue_cache if dialogue_cache is not None else DIALOGUE_CACHE
         self.current_node_id = None
         self.active_interjections = []  # List of strings from passive checks
         
@@ -45,38 +51,37 @@ class DialogueManager:
                 print(f"ERROR loading interrupt_lines.json: {e}")
 
     def load_dialogue(self, dialogue_id: str, dialogues_dir: str, npc_id: str = None):
-        """Loads a dialogue tree from a JSON file."""
-        path = os.path.join(dialogues_dir, f"{dialogue_id}.json")
-        if not os.path.exists(path):
-            print(f"ERROR: Dialogue file not found: {path}")
-            return False
-            
+        """Loads a dialogue tree (from the shared graph cache when possible)."""
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            self.current_dialogue_id = dialogue_id
-            self.current_npc_id = npc_id or data.get("npc_id")  # Track NPC
-            
-            # Support both old 'nodes' and new 'lines' format
-            nodes_data = data.get("nodes", data.get("lines", []))
-            self.nodes = {node["id"]: node for node in nodes_data}
-            
-            # Start at root, 'start' or first node
-            if self.nodes:
-                start_node = data.get("start_node", "start")
-                if start_node not in self.nodes:
-                    start_node = list(self.nodes.keys())[0]
-                self.start_node(start_node)
-                return True
-            else:
-                print("ERROR: No nodes in dialogue file.")
-                return False
-                
+            graph = self.dialogue_cache.get(dialogue_id, dialogues_dir)
+        except FileNotFoundError:
+            print(f"ERROR: Dialogue file not found: {os.path.join(dialogues_dir, f'{dialogue_id}.json')}")
+            return False
         except Exception as e:
             print(f"ERROR loading dialogue {dialogue_id}: {e}")
             return False
 
+        self.graph = graph
+        self.current_dialogue_id = dialogue_id
+        self.current_npc_id = npc_id or graph.npc_id  # Track NPC
+        self.nodes = graph.nodes
+        self.start_node(graph.start_node)
+        return True
+
+    def warmup(self, dialogues_dir: str, dialogue_ids=()) -> int:
+        """
+        Preload every dialogue referenced by known NPCs (plus dialogue_ids) into
+        the shared cache. Returns the number of dialogues loaded.
+        """
+        ids = set(dialogue_ids)
+        if self.npc_system:
+            for npc in self.npc_system.npcs.values():
+                ids.update(npc.dialogue_trees.values())
+                for reaction in npc.reactions.values():
+                    if reaction.get("dialogue_override"):
+                        ids.add(reaction["dialogue_override"])
+        return self.dialogue_cache.warmup(ids, dialogues_dir)
+
     def start_node(self, node_id: str):
         """Transitions to a new node and runs entry logic."""
         if node_id not in self.nodes:
@@ -100,22 +105,21 @@ class DialogueManager:
 
     def _run_passive_checks(self, node: dict) -> List[str]:
         interjections = []
+
+        # Passive inputs are precompiled per node in the dialogue graph
+        plan = None
+        if self.graph and self.graph.nodes.get(node.get("id")) is node:
+            plan = self.graph.passives[node["id"]]
+        if plan is None:
+            plan = PassivePlan(node)
         
         # 1. Use SkillSystem's unified passive check logic
         # We construct a context string from the node text
-        text_data = node.get("text", "")
-        if isinstance(text_data, dict):
-            context_text = text_data.get("base", "")
-        else:
-            context_text = text_data
+        context_text = plan.context_text
         # Get current time if possible (stub for now as player_state doesn't have it explicitly updated every tick in test env)
         current_time = 0.0
         sanity = self.player_state.get("sanity", 100.0)
         
-        # We only check skills that are RELEVANT or explicitly listed
-        # Explicit passives get a bonus or forced check
-        explicit_passives = node.get("passives", [])
-        
         # Standard random passives from SkillSystem
         # We might want to limit this to avoid spamming every node
         # But let's allow it for "reactive dialogue" feel
@@ -128,10 +132,12 @@ class DialogueManager:
                 interjections.append(f"[{interrupt['skill']}] {interrupt['text']}")
 
         # 2. Explicit Passives (Legacy support + forced checks)
-        for skill_name in explicit_passives:
+        # Explicit passives get a bonus or forced check
+        interrupted = {i.get('skill', '').title() for i in system_interrupts}
+        for skill_name, title in plan.explicit:
             # Check if we already have this skill in system_interrupts to avoid dupes?
             # explicit ones usually have specific triggers or lower DCs
-            if any(i.get('skill', '').title() == skill_name.title() for i in system_interrupts):
+            if title in interrupted:
                 continue
 
             res = self.skill_system.roll_check(skill_name, 9)
@@ -147,12 +153,7 @@ class DialogueManager:
                 interjections.append(f"[DEBUG FAIL {skill_name}]")
 
         # 3. Old Format support
-        old_checks = node.get("passive_checks", [])
-        for check in old_checks:
-            skill_name = check.get("skill")
-            dc = check.get("dc", 10)
-            text = check.get("interjection", "")
-            
+        for skill_name, dc, text in plan.legacy:
             res = self.skill_system.roll_check(skill_name, dc)
             if res["success"]:
                 interjections.append(text)
@@ -241,8 +242,8 @@ class DialogueManager:
 
         # Filter/Process choices
         visible_choices = []
-        for choice in node.get("choices", []):
-            req_met, reason = self._check_requirements(choice)
+        for index, choice in enumerate(node.get("choices", [])):
+            req_met, reason = self._check_choice(index, choice)
             visible_choices.append({
                 "text": choice.get("text", "..."),
                 "enabled": req_met,
@@ -258,52 +259,16 @@ class DialogueManager:
         }
 
     def _check_requirements(self, choice: dict) -> (bool, str):
-        # 1. Skill Gates (Level check)
-        if "skill_gate" in choice:
-            gate = choice["skill_gate"]
-            skill_name = gate.get("skill")
-            level_req = gate.get("level", 0)
-            
-            skill = self.skill_system.get_skill(skill_name)
-            if not skill or skill.effective_level < level_req:
-                return False, f"[{skill_name} < {level_req}]"
-                
-        # 2. Theory conditions
-        if "theory_req" in choice or "require_theory" in choice:
-            t_id = choice.get("theory_req", choice.get("require_theory"))
-            if not self.board.is_theory_active(t_id):
-                return False, f"[Requires Theory: {t_id}]"
-        
-        # Week 12: Theory blocking
-        if "theory_blocked" in choice:
-            t_id = choice["theory_blocked"]
-            if self.board.is_theory_active(t_id):
-                return False, f"[Blocked by Theory: {t_id}]"
-        
-        # Week 12: Relationship gates
-        if "relationship_gate" in choice and self.npc_system and self.current_npc_id:
-            gate = choice["relationship_gate"]
-            npc_id = gate.get("npc_id", self.current_npc_id)
-            npc = self.npc_system.get_npc(npc_id)
-            
-            if npc:
-                if "trust_min" in gate and npc.trust < gate["trust_min"]:
-                    return False, f"[Trust < {gate['trust_min']}]"
-                if "rapport_min" in gate and npc.rapport < gate["rapport_min"]:
-                    return False, f"[Rapport < {gate['rapport_min']}]"
-                if "respect_min" in gate and npc.respect < gate["respect_min"]:
-                    return False, f"[Respect < {gate['respect_min']}]"
-                if "fear_max" in gate and npc.fear > gate["fear_max"]:
-                    return False, f"[Fear > {gate['fear_max']}]"
-        
-        # Week 12: Emotional flag requirements
-        if "emotional_flag_required" in choice and self.npc_system and self.current_npc_id:
-            required_flag = choice["emotional_flag_required"]
-            npc = self.npc_system.get_npc(self.current_npc_id)
-            if npc and required_flag not in npc.emotional_flags:
-                return False, f"[Requires: {required_flag}]"
-                
-        return True, ""
+        """Evaluate a choice's gates (skill, theory, relationship, emotional flag)."""
+        return evaluate_requirements(compile_requirements(choice), self)
+
+    def _check_choice(self, index: int, choice: dict) -> (bool, str):
+        """Like _check_requirements, using the graph's precompiled gates for the current node."""
+        if self.graph and self.current_node_id in self.graph.requirements:
+            compiled = self.graph.requirements[self.current_node_id]
+            if index < len(compiled):
+                return evaluate_requirements(compiled[index], self)
+        return self._check_requirements(choice)
 
     def select_choice(self, index: int):
         """Executes the choice at the given index from the last rendered list."""
@@ -319,7 +284,7 @@ class DialogueManager:
         choice = choices[index]
         
         # Double check requirement
-        allowed, _ = self._check_requirements(choice)
+        allowed, _ = self._check_choice(index, choice)
         if not allowed:
             return False, "Requirement not met."
             
@@ -3,8 +3,13 @@ Attention System - Entity Awareness Tracker.
 Gamifies indigenous taboos around the aurora.
 """
 
+import math
 from typing import Dict, Optional, Tuple
 
+# Attention levels where threshold effects (26/51/76/100) or integration speed (40/60/80) change
+ATTENTION_BANDS = (26, 40, 51, 60, 76, 80, 100)
+
+
 class AttentionSystem:
     """Tracks how much the Entity is aware of the player."""
     
@@ -163,6 +168,28 @@ class AttentionSystem:
         decay_amount = self.decay_rate * hours
         self.attention_level = max(0, self.attention_level - decay_amount)
     
+    def minutes_until_band_change(self, gain_per_hour: float = 0) -> Optional[float]:
+        """
+        Game minutes until attention leaves its current band, or None.
+
+        gain_per_hour is any steady income on top of decay (the mental-load
+        beacon); when it outweighs decay attention climbs to the next band.
+        """
+        net_per_hour = gain_per_hour - self.decay_rate
+        if net_per_hour < 0:
+            floors = [band for band in ATTENTION_BANDS if band <= self.attention_level]
+            if not floors:
+                return None
+            # First whole minute strictly below the band floor
+            return int((self.attention_level - floors[-1]) * 60 / -net_per_hour) + 1
+        if net_per_hour > 0:
+            ceilings = [band for band in ATTENTION_BANDS if band > self.attention_level]
+            if not ceilings:
+                return None
+            # First whole minute at or above the next band
+            return math.ceil((ceilings[0] - self.attention_level) * 60 / net_per_hour)
+        return None
+
     def _get_warning_message(self) -> Optional[str]:
         """Returns contextual warning based on attention level."""
         if self.attention_level < 30:
@@ -1,7 +1,69 @@
-from typing import Dict, List, Optional, Tuple
+import itertools
+from typing import Dict, List, Optional, Set, Tuple, Union
 from theories import THEORY_DATA
+from trigger_index import TriggerIndex
+
+# Theories shown on the frontend graph
+GRAPH_STATUSES = ("active", "internalizing", "closed")
+
+STATUS_COLORS = {
+    "active": "#00ff00",       # Green
+    "internalizing": "#ffff00", # Yellow
+    "closed": "#ff0000",       # Red
+    "proven": "#00ffff",       # Cyan
+    "disproven": "#ff00ff",    # Magenta
+    "gathered": "#cccccc"      # Grey (Evidence)
+}
+
+# Shared across boards so a reloaded board never reuses a version a client has cached
+_GRAPH_VERSIONS = itertools.count(1)
+
+
+class _GraphField:
+    """Theory attribute whose changes mark the theory's board graph node dirty."""
+
+    def __set_name__(self, owner, name):
+        self.slot = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.slot)
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+        if obj._board is not None:
+            obj._board._on_theory_changed(obj)
+
+
+_NO_REQUIREMENTS = {
+    "clues_required": [],
+    "flags_required": [],
+    "scenes_visited": [],
+    "theories_active": [],
+    "min_skill": {}
+}
+
+_NO_UNLOCKS = {
+    "dialogue_options": [],
+    "scene_inserts": [],
+    "check_bonuses": {}
+}
+
+
+class TheoryDefinition:
+    """
+    Content-pack data for a theory. Built once per theory and shared by every
+    Board (and so every session); treat it as read-only.
+    """
+
+    __slots__ = (
+        "id", "name", "category", "description", "hidden_effects", "effects",
+        "conflicts_with", "internalize_time_hours", "active_case", "critical_for_endgame",
+        "requirements", "unlocks", "on_internalize_effects", "lens_bias",
+        "degradation_rate", "auto_locks", "initial_status",
+    )
 
-class Theory:
     def __init__(self, id_key: str, data: dict):
         self.id = id_key
         self.name = data["name"]
@@ -13,56 +75,284 @@ class Theory:
         self.internalize_time_hours = data.get("internalize_time_hours", 4)
         self.active_case = data.get("active_case", False)
         self.critical_for_endgame = data.get("critical_for_endgame", False)
-        
+
         # Week 14: Requirements for discovery
-        self.requirements = data.get("requirements", {
-            "clues_required": [],
-            "flags_required": [],
-            "scenes_visited": [],
-            "theories_active": [],
-            "min_skill": {}
-        })
-        
+        self.requirements = data.get("requirements", _NO_REQUIREMENTS)
+
         # Week 14: Unlocks when theory is active
-        self.unlocks = data.get("unlocks", {
-            "dialogue_options": [],
-            "scene_inserts": [],
-            "check_bonuses": {}
-        })
-        
+        self.unlocks = data.get("unlocks", _NO_UNLOCKS)
+
         # Week 14: Effects applied when internalization completes
         self.on_internalize_effects = data.get("on_internalize_effects", [])
-        
+
         # Week 14: Lens bias for narrative filtering
         self.lens_bias = data.get("lens_bias", "neutral")  # believer, skeptic, haunted, neutral
-        
+
         # Degradation mechanics
         self.degradation_rate = data.get("degradation_rate", 10)  # % health lost per contradiction
         self.auto_locks = data.get("auto_locks", [])  # Theories locked when this is internalized
+
+        self.initial_status = data.get("status", "available")
+
+
+_DEFINITIONS: Dict[str, TheoryDefinition] = {}
+
+
+def theory_definitions() -> Dict[str, TheoryDefinition]:
+    """Definitions for THEORY_DATA, built on first use."""
+    if not _DEFINITIONS:
+        for key, data in THEORY_DATA.items():
+            _DEFINITIONS[key] = TheoryDefinition(key, data)
+    return _DEFINITIONS
+
+
+class _FromDefinition:
+    """Read-only Theory attribute served from its shared TheoryDefinition."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj.definition, self.name)
+
+
+class Theory:
+    """Per-session state of one theory on a Board, backed by a shared TheoryDefinition."""
+
+    __slots__ = (
+        "definition", "_board", "_status", "_friction_level",
+        "_health", "_proven", "_linked_evidence",
+        "internalization_progress_minutes", "evidence_count", "contradictions",
+    )
+
+    id = _FromDefinition()
+    name = _FromDefinition()
+    category = _FromDefinition()
+    description = _FromDefinition()
+    hidden_effects = _FromDefinition()
+    effects = _FromDefinition()
+    conflicts_with = _FromDefinition()
+    internalize_time_hours = _FromDefinition()
+    active_case = _FromDefinition()
+    critical_for_endgame = _FromDefinition()
+    requirements = _FromDefinition()
+    unlocks = _FromDefinition()
+    on_internalize_effects = _FromDefinition()
+    lens_bias = _FromDefinition()
+    degradation_rate = _FromDefinition()
+    auto_locks = _FromDefinition()
+
+    health = _GraphField()
+    proven = _GraphField()
+    linked_evidence = _GraphField()
+
+    def __init__(self, id_key: str, data: Union[TheoryDefinition, dict]):
+        """data is a shared TheoryDefinition, or a raw THEORY_DATA-style dict."""
+        self.definition = data if isinstance(data, TheoryDefinition) else TheoryDefinition(id_key, data)
+
+        # Owning board, told about status and friction changes so it can keep its aggregates current
+        self._board: Optional["Board"] = None
+        self._status = self.definition.initial_status  # active, internalizing, available, locked, closed
+        self._friction_level = 0
+
         self.health = 100.0  # Theory integrity (0-100)
-        
-        # State
-        self.status = data.get("status", "available")  # active, internalizing, available, locked, closed
         self.internalization_progress_minutes = 0
-        
+
         # Resolution tracking (for endgame)
-        self.proven: Optional[bool] = None  # None = unresolved, True = proven, False = disproven
-        self.evidence_count: int = 0  # Supporting evidence
-        self.contradictions: int = 0  # Contradicting evidence
-        self.linked_evidence: List[str] = []  # Evidence IDs
-        
+        self.proven = None  # None = unresolved, True = proven, False = disproven
+        self.evidence_count = 0  # Supporting evidence
+        self.contradictions = 0  # Contradicting evidence
+        self.linked_evidence = []  # Evidence IDs
+
         # Week 20: Epistemic Friction
         self.friction_level = 0  # 0-100, representing the mental cost of this belief
 
+    def get_state(self) -> dict:
+        """Session state for saving."""
+        return {
+            "status": self.status,
+            "internalization_progress_minutes": self.internalization_progress_minutes,
+            "health": self.health,
+            "proven": self.proven,
+            "evidence_count": self.evidence_count,
+            "contradictions": self.contradictions,
+            "linked_evidence": self.linked_evidence,
+            "friction_level": self.friction_level
+        }
+
+    def is_pristine(self) -> bool:
+        """True if nothing has happened to this theory since the board was created."""
+        return (self.status == self.definition.initial_status
+                and not self.internalization_progress_minutes
+                and self.health == 100.0
+                and self.proven is None
+                and not self.evidence_count
+                and not self.contradictions
+                and not self.linked_evidence
+                and not self.friction_level)
+
+    def restore_state(self, state: dict):
+        self.status = state.get("status", "available")
+        self.internalization_progress_minutes = state.get("internalization_progress_minutes", 0)
+        self.health = state.get("health", 100.0)
+        self.proven = state.get("proven")
+        self.evidence_count = state.get("evidence_count", 0)
+        self.contradictions = state.get("contradictions", 0)
+        self.linked_evidence = state.get("linked_evidence", [])
+        self.friction_level = state.get("friction_level", 0)
+
+    def discovery_dependencies(self) -> List[Tuple]:
+        """Keys of the game state that the discovery requirements read (see Board.discovery_index)."""
+        reqs = self.requirements
+        keys = [("clue", c) for c in reqs.get("clues_required", [])]
+        keys += [("flag", f) for f in reqs.get("flags_required", [])]
+        keys += [("scene", s) for s in reqs.get("scenes_visited", [])]
+        keys += [("theory", t) for t in reqs.get("theories_active", [])]
+        keys += [("skill", name, level) for name, level in reqs.get("min_skill", {}).items()]
+        return keys
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str):
+        old = self._status
+        self._status = value
+        if self._board is not None and old != value:
+            self._board._on_status_changed(self, old, value)
+
+    @property
+    def friction_level(self) -> int:
+        return self._friction_level
+
+    @friction_level.setter
+    def friction_level(self, value: int):
+        old = self._friction_level
+        self._friction_level = value
+        if self._board is not None and old != value:
+            self._board._on_friction_changed(self, old, value)
+
+def _discovery_probe(key, game_state: dict):
+    """Probe a Theory.discovery_dependencies() key against the discovery game state."""
+    kind = key[0]
+    if kind == "clue":
+        inventory = game_state.get("inventory_system")
+        return bool(inventory and inventory.has_item(key[1]))
+    if kind == "flag":
+        return key[1] in game_state.get("player_flags", set())
+    if kind == "scene":
+        return key[1] in game_state.get("visited_scenes", set())
+    if kind == "theory":
+        board = game_state.get("board")
+        return bool(board and board.is_theory_active(key[1]))
+    if kind == "skill":
+        skill_system = game_state.get("skill_system")
+        return bool(skill_system and skill_system.get_skill_total(key[1]) >= key[2])
+    raise KeyError(key)
+
+
 class Board:
     def __init__(self):
         self.max_slots = 3
-        self.theories: Dict[str, Theory] = {}
+        self._theories: Dict[str, Theory] = {}
+        # Aggregates kept current by Theory status/friction setters
+        self._by_status: Dict[str, Set[str]] = {}
+        self._position: Dict[str, int] = {}
+        self._active_modifiers: Dict[str, int] = {}
+        self._modifier_sources: Dict[str, int] = {}
+        self._active_friction = 0
+        # Bumped on every status change; lets derived values (the lens) cache against theory state
+        self.status_version = 0
+        # Frontend graph: per-theory fragments, rebuilt only when dirty
+        self._graph_fragments: Dict[str, dict] = {}
+        self._graph_dirty: Set[str] = set()
+        self._graph_model_version = 0
+        self._graph_view: Optional[dict] = None
+        self._graph_view_key = None
+        # Locked theories indexed by the clues, flags, scenes, theories and skills they wait on
+        self.discovery_index = TriggerIndex(_discovery_probe)
         self._load_theories()
-        
+
+    @property
+    def theories(self) -> Dict[str, Theory]:
+        return self._theories
+
+    @theories.setter
+    def theories(self, value: Dict[str, Theory]):
+        for theory in self._theories.values():
+            if theory._board is self:
+                theory._board = None
+        self._theories = value
+        self.rebuild_aggregates()
+
     def _load_theories(self):
-        for key, data in THEORY_DATA.items():
-            self.theories[key] = Theory(key, data)
+        self.theories = {key: Theory(key, definition) for key, definition in theory_definitions().items()}
+
+    def rebuild_aggregates(self):
+        """
+        Recompute the status index, active modifiers, friction total and graph from scratch.
+        Only needed after mutating the theories dict or a theory's effects in place.
+        """
+        self._by_status = {}
+        self._position = {}
+        self._active_modifiers = {}
+        self._modifier_sources = {}
+        self._active_friction = 0
+        self._graph_fragments = {}
+        self._graph_dirty = set(self._theories)
+        self._graph_model_version += 1
+        self.discovery_index.clear()
+        for position, theory in enumerate(self._theories.values()):
+            theory._board = self
+            self._position[theory.id] = position
+            self._on_status_changed(theory, None, theory.status)
+
+    def _on_theory_changed(self, theory: Theory):
+        self._graph_dirty.add(theory.id)
+
+    def _on_status_changed(self, theory: Theory, old: Optional[str], new: str):
+        self.status_version += 1
+        self._graph_dirty.add(theory.id)
+        if old in GRAPH_STATUSES or new in GRAPH_STATUSES:
+            # Entering or leaving the graph changes the view even if the theory isn't rebuilt
+            self._graph_model_version += 1
+        if old is not None:
+            self._by_status.get(old, set()).discard(theory.id)
+        self._by_status.setdefault(new, set()).add(theory.id)
+
+        if old == "locked":
+            self.discovery_index.unregister(theory.id)
+        if new == "locked":
+            self.discovery_index.register(
+                theory.id, theory.discovery_dependencies(),
+                lambda state, t_id=theory.id: self.can_discover_theory(t_id, state))
+
+        if old == "active":
+            self._active_friction -= theory.friction_level
+            for skill, val in theory.effects.items():
+                self._active_modifiers[skill] -= val
+                self._modifier_sources[skill] -= 1
+                if not self._modifier_sources[skill]:
+                    del self._active_modifiers[skill]
+                    del self._modifier_sources[skill]
+        if new == "active":
+            self._active_friction += theory.friction_level
+            for skill, val in theory.effects.items():
+                self._active_modifiers[skill] = self._active_modifiers.get(skill, 0) + val
+                self._modifier_sources[skill] = self._modifier_sources.get(skill, 0) + 1
+
+    def _on_friction_changed(self, theory: Theory, old: int, new: int):
+        self._graph_dirty.add(theory.id)
+        if theory.status == "active":
+            self._active_friction += new - old
+
+    def theories_with_status(self, status: str) -> List[Theory]:
+        """Theories currently in the given status, in board order."""
+        ids = self._by_status.get(status, ())
+        return [self._theories[t_id] for t_id in sorted(ids, key=self._position.__getitem__)]
 
     def get_theory(self, theory_id: str) -> Optional[Theory]:
         return self.theories.get(theory_id)
@@ -80,8 +370,8 @@ class Board:
             
         # Check conflicts
         conflicting_theories = []
-        for other_id, other_t in self.theories.items():
-            if other_t.status == "active" and (other_id in theory.conflicts_with or theory_id in other_t.conflicts_with):
+        for other_t in self.theories_with_status("active"):
+            if other_t.id in theory.conflicts_with or theory_id in other_t.conflicts_with:
                 conflicting_theories.append(other_t.name)
         
         if conflicting_theories:
@@ -106,8 +396,8 @@ class Board:
         if force or reason == "FORCED":
             # Baseline friction: 15 per conflict
             conflicts = 0
-            for other_id, other_t in self.theories.items():
-                if other_t.status == "active" and (other_id in theory.conflicts_with or theory_id in other_t.conflicts_with):
+            for other_t in self.theories_with_status("active"):
+                if other_t.id in theory.conflicts_with or theory_id in other_t.conflicts_with:
                     conflicts += 1
             
             theory.friction_level = 20 * conflicts
@@ -126,41 +416,34 @@ class Board:
 
     def on_time_passed(self, minutes: int) -> List[str]:
         messages = []
-        for theory in self.theories.values():
-            if theory.status == "internalizing":
-                theory.internalization_progress_minutes += minutes
-                required_minutes = theory.internalize_time_hours * 60
-                
-                if theory.internalization_progress_minutes >= required_minutes:
-                    theory.status = "active"
-                    messages.append(f"Theory Internalized: '{theory.name}'")
-                    
+        for theory in self.theories_with_status("internalizing"):
+            theory.internalization_progress_minutes += minutes
+            required_minutes = theory.internalize_time_hours * 60
+
+            if theory.internalization_progress_minutes >= required_minutes:
+                theory.status = "active"
+                messages.append(f"Theory Internalized: '{theory.name}'")
+
         return messages
 
+    def minutes_until_internalized(self) -> Optional[float]:
+        """Game minutes until the next internalizing theory completes, or None."""
+        remaining = [
+            t.internalize_time_hours * 60 - t.internalization_progress_minutes
+            for t in self.theories_with_status("internalizing")
+        ]
+        return min(remaining) if remaining else None
+
     def get_all_modifiers(self) -> Dict[str, int]:
-        combined_effects = {}
-        for theory in self.theories.values():
-            if theory.status == "active":
-                for skill, val in theory.effects.items():
-                    combined_effects[skill] = combined_effects.get(skill, 0) + val
-            # Optionally: internalizing theories might have partial or different effects? 
-            # For now, only active ones apply.
-        return combined_effects
-        
+        # Only active theories apply; internalizing ones have no effect yet.
+        return dict(self._active_modifiers)
+
     def get_active_or_internalizing_count(self) -> int:
-        count = 0
-        for t in self.theories.values():
-            if t.status in ["active", "internalizing"]:
-                count += 1
-        return count
+        return len(self._by_status.get("active", ())) + len(self._by_status.get("internalizing", ()))
 
     def get_total_friction(self) -> int:
         """Returns the sum of friction levels for all active theories."""
-        total = 0
-        for t in self.theories.values():
-            if t.status == "active":
-                total += t.friction_level
-        return total
+        return self._active_friction
 
     def discover_theory(self, theory_id: str) -> bool:
         """Unlocks a theory, making it available for internalization."""
@@ -195,6 +478,7 @@ class Board:
         
         if evidence_id not in theory.linked_evidence:
             theory.linked_evidence.append(evidence_id)
+            self._on_theory_changed(theory)
             theory.evidence_count += 1
             print(f"[BOARD] Evidence linked to '{theory.name}' ({theory.evidence_count} total)")
             return True
@@ -208,6 +492,7 @@ class Board:
         
         if evidence_id not in theory.linked_evidence:
             theory.linked_evidence.append(evidence_id)
+            self._on_theory_changed(theory)
             theory.contradictions += 1
             print(f"[BOARD] Contradiction found for '{theory.name}' ({theory.contradictions} total)")
             
@@ -255,14 +540,13 @@ class Board:
         disproven = 0
         unresolved = 0
         
-        for theory in self.theories.values():
-            if theory.status == "active":
-                if theory.proven is True:
-                    proven += 1
-                elif theory.proven is False:
-                    disproven += 1
-                else:
-                    unresolved += 1
+        for theory in self.theories_with_status("active"):
+            if theory.proven is True:
+                proven += 1
+            elif theory.proven is False:
+                disproven += 1
+            else:
+                unresolved += 1
         
         return {
             "proven": proven,
@@ -324,121 +608,128 @@ class Board:
         Returns graph data for the frontend visualization.
         Nodes: Theories and Evidence
         Links: Relationships
+
+        The archetype-independent graph is patched per theory as it changes;
+        glitch labels and link friction are applied on top. The result is
+        cached until either changes, and "version" only moves when it does,
+        so clients can skip redrawing. Treat the returned dict as read-only.
         """
+        archetype = archetype.lower()
+        self._refresh_graph()
+
+        view_key = (self._graph_model_version, archetype, score_ratio)
+        if self._graph_view is None or self._graph_view_key != view_key:
+            self._graph_view = self._build_graph_view(archetype, score_ratio)
+            self._graph_view["version"] = next(_GRAPH_VERSIONS)
+            self._graph_view_key = view_key
+        return self._graph_view
+
+    def _refresh_graph(self):
+        """Rebuild the graph fragments of visible theories that changed since the last call."""
+        for theory in self._graph_theories():
+            fragment = self._graph_fragments.get(theory.id)
+            # Board methods mark evidence links dirty; the length check catches
+            # outside callers appending to linked_evidence in place
+            if theory.id in self._graph_dirty or fragment is None \
+                    or fragment["evidence_count"] != len(theory.linked_evidence):
+                self._graph_fragments[theory.id] = self._build_graph_fragment(theory)
+                self._graph_dirty.discard(theory.id)
+                self._graph_model_version += 1
+
+    def _graph_theories(self) -> List[Theory]:
+        ids = set()
+        for status in GRAPH_STATUSES:
+            ids |= self._by_status.get(status, set())
+        return [self._theories[t_id] for t_id in sorted(ids, key=self._position.__getitem__)]
+
+    def _build_graph_fragment(self, theory: Theory) -> dict:
+        """Archetype-independent node and links for one theory."""
+        # Determine color
+        color = STATUS_COLORS.get(theory.status, "#ffffff")
+        if theory.proven is True: color = STATUS_COLORS["proven"]
+        elif theory.proven is False: color = STATUS_COLORS["disproven"]
+        elif theory.health < 20: color = "#ff4444" # Critical health red
+
+        node = {
+            "id": theory.id,
+            "label": theory.name,
+            "type": "theory",
+            "status": theory.status,
+            "health": theory.health,
+            "friction": theory.friction_level,
+            "proven": theory.proven,
+            "color": color,
+            "shape": "rect",
+            "is_glitched": False,
+            "is_strained": theory.friction_level > 0
+        }
+        return {
+            "node": node,
+            "evidence": list(theory.linked_evidence),
+            "evidence_count": len(theory.linked_evidence),
+            "closed": theory.status == "closed",
+            "lens_bias": theory.lens_bias,
+            "can_glitch": theory.lens_bias == "believer" and theory.health < 50,
+        }
+
+    def _build_graph_view(self, archetype: str, score_ratio: int) -> dict:
         nodes = []
         links = []
-        
-        # Helper for statuses
-        status_colors = {
-            "active": "#00ff00",       # Green
-            "internalizing": "#ffff00", # Yellow
-            "closed": "#ff0000",       # Red
-            "proven": "#00ffff",       # Cyan
-            "disproven": "#ff00ff",    # Magenta
-            "gathered": "#cccccc"      # Grey (Evidence)
-        }
+        seen = set()
 
-        archetype = archetype.lower()
+        # Extreme believers dismiss evidence
+        ev_glitched = archetype == "believer" and score_ratio < -10
+        ev_label = "[TRIVIAL MATTER]" if ev_glitched else None
 
-        # Add Active/Internalizing Theories as Nodes
-        for t_id, theory in self.theories.items():
-            if theory.status not in ["active", "internalizing", "closed"]:
-                continue
-                
-            # Determine color
-            color = status_colors.get(theory.status, "#ffffff")
-            if theory.proven is True: color = status_colors["proven"]
-            elif theory.proven is False: color = status_colors["disproven"]
-            elif theory.health < 20: color = "#ff4444" # Critical health red
+        for theory in self._graph_theories():
+            fragment = self._graph_fragments[theory.id]
+            node = fragment["node"]
 
             # Glitch detection
-            is_glitched = False
-            label = theory.name
-            if archetype == "skeptic" and theory.lens_bias == "believer" and theory.health < 50:
-                is_glitched = True
-                label = "█" * 8 + " [LOGICAL ERROR] "
-
-            nodes.append({
-                "id": t_id,
-                "label": label,
-                "type": "theory",
-                "status": theory.status,
-                "health": theory.health,
-                "friction": theory.friction_level,
-                "proven": theory.proven,
-                "color": color,
-                "shape": "rect",
-                "is_glitched": is_glitched,
-                "is_strained": theory.friction_level > 0
-            })
-            
-            # Add Linked Evidence as Nodes and Links
-            for ev_id in theory.linked_evidence:
-                # Add evidence node if not already present
-                if not any(n["id"] == ev_id for n in nodes):
-                    ev_glitched = False
-                    ev_label = ev_id
-                    if archetype == "believer" and score_ratio < -10: # Extreme believer
-                        ev_glitched = True
-                        ev_label = "[TRIVIAL MATTER]"
+            if archetype == "skeptic" and fragment["can_glitch"]:
+                node = dict(node, label="█" * 8 + " [LOGICAL ERROR] ", is_glitched=True)
+            nodes.append(node)
+            seen.add(node["id"])
 
+            # Check for friction in this theory's links
+            has_friction = (fragment["lens_bias"] == "believer" and score_ratio > 3) or \
+                           (fragment["lens_bias"] == "skeptic" and score_ratio < -3)
+            link_color = "#ff0000" if (fragment["closed"] or has_friction) else "#ffffff"
+
+            # Add Linked Evidence as Nodes and Links
+            for ev_id in fragment["evidence"]:
+                if ev_id not in seen:
+                    seen.add(ev_id)
                     nodes.append({
                         "id": ev_id,
-                        "label": ev_label,
+                        "label": ev_label or ev_id,
                         "type": "evidence",
                         "status": "gathered",
-                        "color": status_colors["gathered"],
+                        "color": STATUS_COLORS["gathered"],
                         "shape": "circle",
                         "is_glitched": ev_glitched
                     })
-                
-                # Check for friction in this link
-                has_friction = False
-                if (theory.lens_bias == "believer" and score_ratio > 3) or \
-                   (theory.lens_bias == "skeptic" and score_ratio < -3):
-                    has_friction = True
 
                 links.append({
                     "source": ev_id,
-                    "target": t_id,
-                    "type": "supporting", 
-                    "color": "#ff0000" if (theory.status == "closed" or has_friction) else "#ffffff",
+                    "target": node["id"],
+                    "type": "supporting",
+                    "color": link_color,
                     "has_friction": has_friction
                 })
-    def to_dict(self) -> dict:
-        """Serialize board state to dictionary."""
-        theories_data = {}
-        for t_id, theory in self.theories.items():
-            theories_data[t_id] = {
-                "status": theory.status,
-                "internalization_progress_minutes": theory.internalization_progress_minutes,
-                "health": theory.health,
-                "proven": theory.proven,
-                "evidence_count": theory.evidence_count,
-                "contradictions": theory.contradictions,
-                "linked_evidence": theory.linked_evidence
-            }
-        return {"theories": theories_data}
-
-    @staticmethod
-    def from_dict(data: dict) -> 'Board':
-        """Deserialize board state from dictionary."""
-        board = Board()
-        if "theories" in data:
-            for t_id, t_data in data["theories"].items():
-                theory = board.get_theory(t_id)
-                if theory:
-                    theory.status = t_data.get("status", "available")
-                    theory.internalization_progress_minutes = t_data.get("internalization_progress_minutes", 0)
-                    theory.health = t_data.get("health", 100.0)
-                    theory.proven = t_data.get("proven")
-                    theory.evidence_count = t_data.get("evidence_count", 0)
-                    theory.contradictions = t_data.get("contradictions", 0)
-                    theory.linked_evidence = t_data.get("linked_evidence", [])
-        return board
+
+        return {"nodes": nodes, "links": links}
 
     # Week 14: New Methods
     
+    def discoverable_theories(self, game_state: dict) -> List[str]:
+        """
+        Locked theories whose requirements are now met.
+        Only theories waiting on a clue, flag, scene, theory or skill that
+        changed since the last call are re-checked.
+        """
+        return self.discovery_index.update(game_state)
+
     def can_discover_theory(self, theory_id: str, game_state: dict) -> bool:
         """Check if theory requirements are met for discovery."""
         theory = self.get_theory(theory_id)
@@ -528,33 +819,26 @@ class Board:
             "check_bonuses": {}
         }
         
-        for theory in self.theories.values():
-            if theory.status == "active":
-                # Dialogue options
-                unlocks["dialogue_options"].extend(theory.unlocks.get("dialogue_options", []))
-                
-                # Scene inserts
-                unlocks["scene_inserts"].extend(theory.unlocks.get("scene_inserts", []))
-                
-                # Check bonuses
-                for skill, bonus in theory.unlocks.get("check_bonuses", {}).items():
-                    unlocks["check_bonuses"][skill] = unlocks["check_bonuses"].get(skill, 0) + bonus
+        for theory in self.theories_with_status("active"):
+            # Dialogue options
+            unlocks["dialogue_options"].extend(theory.unlocks.get("dialogue_options", []))
+
+            # Scene inserts
+            unlocks["scene_inserts"].extend(theory.unlocks.get("scene_inserts", []))
+
+            # Check bonuses
+            for skill, bonus in theory.unlocks.get("check_bonuses", {}).items():
+                unlocks["check_bonuses"][skill] = unlocks["check_bonuses"].get(skill, 0) + bonus
         
         return unlocks
 
     def to_dict(self) -> dict:
-        """Serialize board state for saving."""
-        theories_data = {}
-        for t_id, theory in self.theories.items():
-            theories_data[t_id] = {
-                "status": theory.status,
-                "internalization_progress_minutes": theory.internalization_progress_minutes,
-                "health": theory.health,
-                "proven": theory.proven,
-                "evidence_count": theory.evidence_count,
-                "contradictions": theory.contradictions,
-                "linked_evidence": theory.linked_evidence
-            }
+        """Serialize board state for saving. Theories still in their initial state are omitted."""
+        theories_data = {
+            t_id: theory.get_state()
+            for t_id, theory in self.theories.items()
+            if not theory.is_pristine()
+        }
 
         return {
             "theories": theories_data,
@@ -570,12 +854,6 @@ class Board:
         for t_id, state in theories_data.items():
             theory = board.get_theory(t_id)
             if theory:
-                theory.status = state.get("status", "available")
-                theory.internalization_progress_minutes = state.get("internalization_progress_minutes", 0)
-                theory.health = state.get("health", 100.0)
-                theory.proven = state.get("proven")
-                theory.evidence_count = state.get("evidence_count", 0)
-                theory.contradictions = state.get("contradictions", 0)
-                theory.linked_evidence = state.get("linked_evidence", [])
+                theory.restore_state(state)
 
         return board
@@ -16,6 +16,26 @@ from typing import Dict, List, Any, Optional, Set
 from collections import defaultdict
 
 
+def collect_parser_keywords(content: Any) -> Set[str]:
+    """
+    Every keyword named by a parser_keywords condition anywhere in content
+    (scene dicts, lists of them, nested branches). Game watches these at load
+    so ParserMemory keeps exact counts for them from the first command.
+    """
+    keywords: Set[str] = set()
+    stack = [content]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            found = node.get("parser_keywords")
+            if isinstance(found, list):
+                keywords.update(kw.lower() for kw in found if isinstance(kw, str))
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return keywords
+
+
 class BranchController:
     """Evaluates scene conditions and filters choices based on game state."""
     
@@ -346,6 +366,10 @@ class BranchController:
         parser_memory = game_state.get("parser_memory")
         if not parser_memory:
             return False
+
+        # Normally already watched at load; covers conditions built at runtime
+        if hasattr(parser_memory, "watch_keywords"):
+            parser_memory.watch_keywords(keywords)
             
         for keyword in keywords:
             if not parser_memory.has_mentioned(keyword):
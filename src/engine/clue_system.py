@@ -6,7 +6,7 @@ No pixel hunting - clues appear automatically when thresholds are met.
 
 import json
 import os
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Callable, Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -95,12 +95,72 @@ class ClueState:
         )
 
 
+def compile_visibility_conditions(conditions: dict) -> Callable[[dict], bool]:
+    """
+    Turn a passive clue's visible_when block into a predicate over player_state.
+    Only the checks the block actually uses are kept, so evaluating it is a
+    few lookups with no re-parsing of the conditions dict.
+    """
+    checks = []
+
+    skill_gte = tuple((conditions or {}).get("skill_gte", {}).items())
+    if skill_gte:
+        def check_skills(player_state):
+            skills = player_state.get("skills", {})
+            return all(skills.get(name, 0) >= threshold for name, threshold in skill_gte)
+        checks.append(check_skills)
+
+    equipment = (conditions or {}).get("equipment")
+    if equipment:
+        def check_equipment(player_state):
+            return equipment in player_state.get("inventory", []) or equipment in player_state.get("equipped", [])
+        checks.append(check_equipment)
+
+    theory_active = (conditions or {}).get("theory_active")
+    if theory_active:
+        def check_theory(player_state):
+            return theory_active in player_state.get("active_theories", [])
+        checks.append(check_theory)
+
+    flag_set = (conditions or {}).get("flag_set")
+    if flag_set:
+        def check_flag(player_state):
+            return bool(player_state.get("flags", {}).get(flag_set, False))
+        checks.append(check_flag)
+
+    if not checks:
+        return lambda player_state: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda player_state: all(check(player_state) for check in checks)
+
+
 @dataclass
 class PassiveClueCheck:
     """Definition of a passive clue check in a scene."""
     clue_id: str
     reveal_text: Optional[str]
     conditions: dict = field(default_factory=dict)
+    is_visible: Callable[[dict], bool] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.is_visible is None:
+            self.is_visible = compile_visibility_conditions(self.conditions)
+
+    @classmethod
+    def from_scene_entry(cls, data: dict) -> 'PassiveClueCheck':
+        return cls(
+            clue_id=data.get("clue_id"),
+            reveal_text=data.get("reveal_text"),
+            conditions=data.get("visible_when", {})
+        )
+
+
+@dataclass
+class PassiveClueIndex:
+    """Compiled passive clue checks for one scene, minus clues already acquired."""
+    source: list  # The scene's passive_clues list the index was built from
+    pending: Dict[str, List[PassiveClueCheck]] = field(default_factory=dict)
 
 
 class ClueSystem:
@@ -120,6 +180,10 @@ class ClueSystem:
         self.acquired_clues: Dict[str, ClueState] = {}
         self.board = board
 
+        # Per-scene passive clue checks, built on first evaluation of each scene
+        self.passive_indexes: Dict[str, PassiveClueIndex] = {}
+        self._passive_scenes_for_clue: Dict[str, Set[str]] = {}
+
         if clues_dir:
             self.load_clues(clues_dir)
 
@@ -213,6 +277,12 @@ class ClueSystem:
         self.acquired_clues[clue_id] = state
         print(f"[CLUE] Acquired: {clue_def.title} (Lens: {lens})")
 
+        # Never a passive candidate again
+        for scene_id in self._passive_scenes_for_clue.pop(clue_id, ()):
+            index = self.passive_indexes.get(scene_id)
+            if index:
+                index.pending.pop(clue_id, None)
+
         # Add to Board if available
         if self.board:
             self._add_clue_to_board(clue_def)
@@ -255,8 +325,23 @@ class ClueSystem:
         for tag in clue.tags:
             print(f"[BOARD] Tagged clue with: {tag}")
 
+    def get_passive_index(self, scene_id: str, scene_passive_clues: List[dict]) -> PassiveClueIndex:
+        """Return the (cached) passive clue index for a scene, rebuilding it if the scene's list changed."""
+        index = self.passive_indexes.get(scene_id)
+        if index is None or index.source is not scene_passive_clues:
+            index = PassiveClueIndex(source=scene_passive_clues)
+            for pc_data in scene_passive_clues:
+                check = PassiveClueCheck.from_scene_entry(pc_data)
+                if not check.clue_id or self.has_clue(check.clue_id):
+                    continue
+                index.pending.setdefault(check.clue_id, []).append(check)
+                self._passive_scenes_for_clue.setdefault(check.clue_id, set()).add(scene_id)
+            self.passive_indexes[scene_id] = index
+        return index
+
     def evaluate_passive_clues(self, scene_passive_clues: List[dict],
-                                player_state: dict, lens_system=None) -> List[Tuple[ClueState, str]]:
+                                player_state: dict, lens_system=None,
+                                scene_id: str = None, lens: str = None) -> List[Tuple[ClueState, str]]:
         """
         Evaluate passive clue checks for a scene.
 
@@ -264,6 +349,8 @@ class ClueSystem:
             scene_passive_clues: List of passive clue definitions from scene
             player_state: Dict with skills, inventory, equipment, active_theories, flags
             lens_system: Optional LensSystem to determine interpretation
+            scene_id: Optional scene id; compiled checks are then cached per scene
+            lens: Optional lens already computed for this turn (skips lens_system)
 
         Returns:
             List of (ClueState, reveal_text) tuples for clues that should be revealed
@@ -272,62 +359,35 @@ class ClueSystem:
 
         # Determine lens
         current_lens = "neutral"
-        if lens_system:
+        if lens:
+            current_lens = lens
+        elif lens_system:
             current_lens = lens_system.calculate_lens()
         elif "archetype" in player_state:
              current_lens = player_state["archetype"].lower()
 
-        for pc_data in scene_passive_clues:
-            clue_id = pc_data.get("clue_id")
+        if scene_id is not None:
+            pending = self.get_passive_index(scene_id, scene_passive_clues).pending
+            candidates = [check for checks in list(pending.values()) for check in checks]
+        else:
+            candidates = [PassiveClueCheck.from_scene_entry(pc_data) for pc_data in scene_passive_clues]
+
+        for check in candidates:
+            clue_id = check.clue_id
             if not clue_id or self.has_clue(clue_id):
                 continue
 
-            conditions = pc_data.get("visible_when", {})
-
-            if self._check_visibility_conditions(conditions, player_state):
+            if check.is_visible(player_state):
                 state = self.acquire_clue(clue_id, current_lens)
                 if state:
-                    clue_def = self.get_clue(clue_id)
-                    reveal_text = pc_data.get("reveal_text") or state.current_interpretation
+                    reveal_text = check.reveal_text or state.current_interpretation
                     revealed.append((state, reveal_text))
 
         return revealed
 
     def _check_visibility_conditions(self, conditions: dict, player_state: dict) -> bool:
         """Check if visibility conditions are met for a passive clue."""
-        if not conditions:
-            return True
-
-        # Skill threshold check
-        skill_gte = conditions.get("skill_gte", {})
-        for skill_name, threshold in skill_gte.items():
-            player_skill = player_state.get("skills", {}).get(skill_name, 0)
-            if player_skill < threshold:
-                return False
-
-        # Equipment check
-        equipment = conditions.get("equipment")
-        if equipment:
-            inventory = player_state.get("inventory", [])
-            equipped = player_state.get("equipped", [])
-            if equipment not in inventory and equipment not in equipped:
-                return False
-
-        # Theory active check
-        theory_active = conditions.get("theory_active")
-        if theory_active:
-            active_theories = player_state.get("active_theories", [])
-            if theory_active not in active_theories:
-                return False
-
-        # Flag set check
-        flag_set = conditions.get("flag_set")
-        if flag_set:
-            flags = player_state.get("flags", {})
-            if not flags.get(flag_set, False):
-                return False
-
-        return True
+        return compile_visibility_conditions(conditions)(player_state)
 
     def format_revealed_clues(self, revealed: List[Tuple[ClueState, str]], lens: str = "neutral") -> str:
         """Format revealed clues for narrative insertion."""
@@ -439,6 +499,9 @@ class ClueSystem:
     def restore_state(self, state: dict):
         """Restore clue state from saved data."""
         self.acquired_clues = {}
+        # Candidate sets depend on what has been acquired
+        self.passive_indexes = {}
+        self._passive_scenes_for_clue = {}
 
         # Handle new format
         if "acquired_clues" in state:
@@ -0,0 +1,139 @@
+"""
+Command Registry
+
+Table-driven dispatch for typed commands. Handlers register under a
+canonical name plus aliases; resolving an input is one dictionary lookup
+instead of a walk down a chain of `if clean in [...]` branches.
+
+Every command also declares a cost class and whether it mutates game state,
+so callers can tell read-only commands (board, map, help ...) apart from
+ones that advance time or touch the save slots. Game uses the mutates flag
+to skip passive mechanics after read-only commands. Anything that rolls
+dice or records history counts as mutating.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Cost classes, cheapest first
+COST_TRIVIAL = "trivial"    # Pure display of existing state
+COST_NORMAL = "normal"      # Ordinary state change, no time passes
+COST_HEAVY = "heavy"        # Advances the clock, loads scenes or touches disk
+
+# Argument policies
+ARGS_NONE = "none"          # "board"
+ARGS_REQUIRED = "required"  # "save <slot>"
+ARGS_OPTIONAL = "optional"  # "wait" / "wait 30"
+
+
+class CommandSpec:
+    """Metadata and handler for one registered command."""
+
+    __slots__ = ("name", "handler", "aliases", "cost", "mutates", "args", "debug")
+
+    def __init__(self, name: str, handler: Callable[..., Any], aliases: Iterable[str] = (),
+                 cost: str = COST_NORMAL, mutates: bool = True,
+                 args: str = ARGS_NONE, debug: bool = False):
+        self.name = name
+        self.handler = handler
+        self.aliases = tuple(aliases)
+        self.cost = cost
+        self.mutates = mutates
+        self.args = args
+        self.debug = debug
+
+    @property
+    def read_only(self) -> bool:
+        return not self.mutates
+
+    def __repr__(self):
+        return f"CommandSpec({self.name!r}, cost={self.cost!r}, mutates={self.mutates})"
+
+
+class CommandRegistry:
+    """
+    Maps command words to CommandSpecs.
+
+    Bare commands ("board", "q") live in one table and commands that take
+    arguments ("save slot1", "prove theory_x") are keyed by their first word
+    in another, so "save" and "save slot1" can route to different handlers.
+    Words are matched case-insensitively.
+    """
+
+    def __init__(self):
+        self._bare: Dict[str, CommandSpec] = {}
+        self._with_args: Dict[str, CommandSpec] = {}
+        self._specs: Dict[str, CommandSpec] = {}
+
+    def register(self, name: str, handler: Callable[..., Any], aliases: Iterable[str] = (),
+                 cost: str = COST_NORMAL, mutates: bool = True,
+                 args: str = ARGS_NONE, debug: bool = False) -> CommandSpec:
+        """Register a handler under name and aliases. Re-registering a word is an error."""
+        spec = CommandSpec(name, handler, aliases, cost, mutates, args, debug)
+        words = [name.lower()] + [a.lower() for a in spec.aliases]
+
+        tables = []
+        if args in (ARGS_NONE, ARGS_OPTIONAL):
+            tables.append(self._bare)
+        if args in (ARGS_REQUIRED, ARGS_OPTIONAL):
+            tables.append(self._with_args)
+        if not tables:
+            raise ValueError(f"Unknown argument policy '{args}' for command '{name}'")
+
+        for table in tables:
+            for word in words:
+                if word in table:
+                    raise ValueError(f"Command word '{word}' is already registered to '{table[word].name}'")
+                table[word] = spec
+
+        self._specs[name] = spec
+        return spec
+
+    def command(self, name: str, aliases: Iterable[str] = (), **options):
+        """Decorator form of register()."""
+        def decorator(func):
+            self.register(name, func, aliases, **options)
+            return func
+        return decorator
+
+    def resolve(self, text: str, debug_enabled: bool = False) -> Tuple[Optional[CommandSpec], str]:
+        """
+        Resolve raw input to (spec, argument_string).
+
+        Returns (None, "") when no command matches; debug-only commands are
+        invisible unless debug_enabled.
+        """
+        clean = text.strip().lower()
+        if not clean:
+            return None, ""
+
+        spec = self._bare.get(clean)
+        rest = ""
+        if spec is None:
+            head, _, rest = clean.partition(" ")
+            rest = rest.strip()
+            spec = self._with_args.get(head) if rest else None
+
+        if spec is None or (spec.debug and not debug_enabled):
+            return None, ""
+        return spec, rest
+
+    def get(self, word: str) -> Optional[CommandSpec]:
+        """Look up a command by canonical name or alias (bare or with arguments)."""
+        if word in self._specs:
+            return self._specs[word]
+        word = word.lower()
+        return self._bare.get(word) or self._with_args.get(word)
+
+    def is_read_only(self, word: str) -> bool:
+        spec = self.get(word)
+        return spec is not None and spec.read_only
+
+    def specs(self) -> List[CommandSpec]:
+        return list(self._specs.values())
+
+    def __contains__(self, word: str) -> bool:
+        return self.get(word) is not None
+
+    def __len__(self) -> int:
+        return len(self._specs)
@@ -197,15 +197,9 @@ class EnvironmentalEffects:
     
     def apply_to_skill_system(self, skill_system):
         """Apply environmental modifiers to skill system."""
-        # Clear old environmental modifiers
-        for skill in skill_system.skills.values():
-            skill.set_modifier("Environment", 0)
-        
-        # Apply new modifiers
-        for skill_name, modifier in self.active_modifiers.items():
-            skill = skill_system.get_skill(skill_name)
-            if skill:
-                skill.set_modifier("Environment", modifier)
+        # Clear old / apply new environmental modifiers in one pass
+        for skill_name, skill in skill_system.skills.items():
+            skill.set_modifier("Environment", self.active_modifiers.get(skill_name, 0))
     
     def random_weather_change(self) -> Optional[str]:
         """Randomly change weather (for dynamic world)."""
@@ -8,6 +8,40 @@ import os
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
+from engine.game_clock import WALL_CLOCK
+from engine.trigger_index import TriggerIndex
+
+# Game state entries behind the attention/sanity thresholds
+FEAR_STAT_KEYS = {"attention": "attention_level", "sanity": "sanity"}
+
+
+def _probe(key, game_state):
+    """Probe a FearEvent.dependencies() key against the fear game state."""
+    kind = key[0]
+    if kind == "location":
+        return game_state.get("current_location", "")
+    if kind == "location_type":
+        return (game_state.get("location_data") or {}).get("type", "")
+    if kind == "flag":
+        return key[1] in game_state.get("player_flags", set())
+    if kind == "above":
+        return game_state.get(key[1], 100 if key[1] == "sanity" else 0) > key[2]
+    if kind == "below":
+        return game_state.get(key[1], 100 if key[1] == "sanity" else 0) < key[2]
+    if kind == "time_of_day":
+        current_time = game_state.get("time", None)
+        if not current_time:
+            return True
+        hour = current_time.hour
+        if key[1] == "night":
+            return 20 <= hour or hour < 6
+        if key[1] == "day":
+            return 6 <= hour < 20
+        return True
+    if kind == "weather":
+        return game_state.get("current_weather", "")
+    raise KeyError(key)
+
 
 class FearEvent:
     """Represents a single fear event with triggers and effects."""
@@ -27,22 +61,72 @@ class FearEvent:
         self.cooldown_minutes = data.get("cooldown_minutes", 30)
         self.last_triggered = None
     
-    def can_trigger(self, game_state: dict) -> bool:
+    def can_trigger(self, game_state: dict, now: Optional[datetime] = None) -> bool:
         """
         Check if this fear event's conditions are met.
         
         Args:
             game_state: Current game state dict
+            now: Current game time for the cooldown (defaults to game_state["time"])
             
         Returns:
             True if event can trigger
         """
-        # Check cooldown
+        if self.on_cooldown(now or game_state.get("time") or WALL_CLOCK.now()):
+            return False
+        if not self.conditions_met(game_state):
+            return False
+        return self.roll_chance()
+
+    def on_cooldown(self, now: datetime) -> bool:
+        """True while the event is still cooling down from its last trigger (game time)."""
         if self.last_triggered:
-            time_since = (datetime.now() - self.last_triggered).total_seconds() / 60
+            time_since = (now - self.last_triggered).total_seconds() / 60
             if time_since < self.cooldown_minutes:
+                return True
+        return False
+
+    def roll_chance(self) -> bool:
+        """Roll the optional random chance (if specified)."""
+        if "chance" in self.trigger_conditions:
+            import random
+            if random.random() > self.trigger_conditions["chance"]:
                 return False
+        return True
+
+    def dependencies(self) -> List[tuple]:
+        """State keys conditions_met() reads, for the FearManager trigger index."""
+        conditions = self.trigger_conditions
+        keys = []
+        if "location" in conditions:
+            keys.append(("location",))
+        if "location_type" in conditions:
+            keys.append(("location_type",))
+        flags = conditions.get("flags", [])
+        if isinstance(flags, str):
+            flags = [flags]
+        keys += [("flag", flag) for flag in flags]
+        for stat in ("attention", "sanity"):
+            if f"{stat}_above" in conditions:
+                keys.append(("above", FEAR_STAT_KEYS[stat], conditions[f"{stat}_above"]))
+            if f"{stat}_below" in conditions:
+                keys.append(("below", FEAR_STAT_KEYS[stat], conditions[f"{stat}_below"]))
+        if "time_of_day" in conditions:
+            keys.append(("time_of_day", conditions["time_of_day"]))
+        if "weather" in conditions:
+            keys.append(("weather",))
+        return keys
+
+    def conditions_met(self, game_state: dict) -> bool:
+        """
+        Check the deterministic trigger conditions (no cooldown, no chance roll).
         
+        Args:
+            game_state: Current game state dict
+            
+        Returns:
+            True if every condition holds
+        """
         conditions = self.trigger_conditions
         
         # Location check
@@ -56,7 +140,7 @@ class FearEvent:
         
         # Location type check (e.g., "outdoor")
         if "location_type" in conditions:
-            loc_data = game_state.get("location_data", {})
+            loc_data = game_state.get("location_data") or {}
             loc_type = loc_data.get("type", "")
             if loc_type != conditions["location_type"]:
                 return False
@@ -112,32 +196,39 @@ class FearEvent:
             if current_weather not in required_weather:
                 return False
         
-        # Random chance (if specified)
-        if "chance" in conditions:
-            import random
-            if random.random() > conditions["chance"]:
-                return False
-        
         return True
     
-    def trigger(self) -> Dict:
+    def trigger(self, now: datetime) -> Dict:
         """
         Mark event as triggered and return effects.
         
+        Args:
+            now: Current game time, the start of the cooldown
+            
         Returns:
             Dict containing effects to apply
         """
-        self.last_triggered = datetime.now()
+        self.last_triggered = now
         return self.effects.copy()
 
 
 class FearManager:
     """Manages fear events and their triggering."""
     
-    def __init__(self):
-        """Initialize the fear manager."""
+    def __init__(self, clock=None):
+        """
+        Initialize the fear manager.
+        
+        Args:
+            clock: Game clock (anything with now() -> datetime, e.g. TimeSystem).
+                Cooldowns are measured on it; defaults to wall-clock time.
+        """
+        self.clock = clock or WALL_CLOCK
         self.fear_events: Dict[str, FearEvent] = {}
         self.enabled = True  # Can be toggled for debugging
+        # Events indexed by the state their conditions read; rebuilt after loading
+        self.index = TriggerIndex(_probe)
+        self._index_dirty = True
     
     def load_fear_events(self, directory_path: str):
         """
@@ -165,6 +256,7 @@ class FearManager:
                         else:
                             event = FearEvent(data)
                             self.fear_events[event.id] = event
+                        self._index_dirty = True
                     
                     print(f"[FearManager] Loaded fear events from {filename}")
                 except Exception as e:
@@ -182,6 +274,7 @@ class FearManager:
                 data = json.load(f)
                 event = FearEvent(data)
                 self.fear_events[event.id] = event
+                self._index_dirty = True
                 print(f"[FearManager] Loaded fear event: {event.id}")
         except Exception as e:
             print(f"[FearManager] Error loading fear event from {filepath}: {e}")
@@ -199,17 +292,29 @@ class FearManager:
         if not self.enabled:
             return []
         
+        if self._index_dirty or len(self.index) != len(self.fear_events):
+            self._build_index()
+
         triggered_events = []
+        now = self.clock.now()
         
-        for event in self.fear_events.values():
-            if event.can_trigger(game_state):
-                effects = event.trigger()
+        # Only events whose conditions hold are considered; cooldown and chance are per check
+        for event_id in self.index.update(game_state):
+            event = self.fear_events[event_id]
+            if not event.on_cooldown(now) and event.roll_chance():
+                effects = event.trigger(now)
                 effects["event_id"] = event.id
                 effects["event_name"] = event.name
                 triggered_events.append(effects)
         
         return triggered_events
     
+    def _build_index(self):
+        self.index.clear()
+        for event_id, event in self.fear_events.items():
+            self.index.register(event_id, event.dependencies(), event.conditions_met)
+        self._index_dirty = False
+
     def force_trigger_event(self, event_id: str) -> Optional[Dict]:
         """
         Force trigger a specific event (for debugging/testing).
@@ -222,7 +327,7 @@ class FearManager:
         """
         event = self.fear_events.get(event_id)
         if event:
-            return event.trigger()
+            return event.trigger(self.clock.now())
         return None
     
     def reset_cooldowns(self):
@@ -269,7 +374,7 @@ class FearManager:
         }
         
         if event.last_triggered:
-            time_since = (datetime.now() - event.last_triggered).total_seconds() / 60
+            time_since = (self.clock.now() - event.last_triggered).total_seconds() / 60
             status["minutes_since_trigger"] = time_since
             status["can_trigger_again_in"] = max(0, event.cooldown_minutes - time_since)
         
@@ -278,3 +383,21 @@ class FearManager:
     def get_all_events_status(self) -> List[Dict]:
         """Get status of all fear events."""
         return [self.get_event_status(event_id) for event_id in self.fear_events.keys()]
+
+    def to_dict(self) -> dict:
+        """Serialize cooldown state (game-clock times)."""
+        return {
+            "enabled": self.enabled,
+            "last_triggered": {
+                event_id: event.last_triggered.isoformat()
+                for event_id, event in self.fear_events.items() if event.last_triggered
+            }
+        }
+
+    def restore_state(self, data: dict):
+        """Restore cooldown state saved by to_dict."""
+        self.enabled = data.get("enabled", True)
+        self.reset_cooldowns()
+        for event_id, stamp in data.get("last_triggered", {}).items():
+            if event_id in self.fear_events:
+                self.fear_events[event_id].last_triggered = datetime.fromisoformat(stamp)
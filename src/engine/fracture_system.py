@@ -16,6 +16,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
+from engine.game_clock import WALL_CLOCK
+
 
 class FractureType(Enum):
     TIMESTAMP_CORRUPTION = "timestamp"
@@ -78,8 +80,10 @@ class FractureSystem:
     - Serve the narrative of unreliable reality
     """
 
-    def __init__(self, game_state=None):
+    def __init__(self, game_state=None, clock=None):
         self.game_state = game_state
+        # Fracture events are stamped with game time when a game clock is given
+        self.clock = clock or WALL_CLOCK
         self.fracture_effects: Dict[str, FractureEffect] = {}
         self.fracture_history: List[FractureEvent] = []
         self.active_fractures: List[str] = []
@@ -349,7 +353,7 @@ class FractureSystem:
 
         event = FractureEvent(
             effect_id=effect.id,
-            timestamp=datetime.now(),
+            timestamp=self.clock.now(),
             trigger_source=source,
             attention_level=self.current_attention,
             day=self.current_day
@@ -0,0 +1,37 @@
+"""
+Game Clock
+
+Engine code that needs "now" for gameplay rules (cooldowns, in-game
+timestamps) asks an injected clock instead of calling datetime.now(), so
+those rules follow game time and can be fast-forwarded, replayed or
+simulated in bulk.
+
+A clock is any object with a now() -> datetime method. TimeSystem is the
+game's clock; WALL_CLOCK is the fallback for systems used on their own,
+and ManualClock is for tests and headless simulations.
+"""
+
+from datetime import datetime, timedelta
+
+
+class WallClock:
+    """Real time. Only for systems constructed without a game clock."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class ManualClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self, start: datetime = None):
+        self.current_time = start or datetime(1995, 10, 14, 8, 0)
+
+    def now(self) -> datetime:
+        return self.current_time
+
+    def advance(self, minutes: float):
+        self.current_time += timedelta(minutes=minutes)
+
+
+WALL_CLOCK = WallClock()
@@ -1,7 +1,106 @@
 
 import re
 from typing import List, Tuple, Optional, Dict
-from typing import List, Tuple, Optional
+
+
+def levenshtein_distance(s1: str, s2: str) -> int:
+    """Calculates Levenshtein distance between two strings."""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    if len(s2) == 0:
+        return len(s1)
+
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+class VerbTrie:
+    """
+    Token trie over verb synonyms ("pick up", "look around", "use with").
+
+    Finds the longest synonym that prefixes a command in time proportional
+    to the number of tokens in the synonym, not the vocabulary size.
+    """
+
+    def __init__(self):
+        self.root: Dict = {}
+
+    def insert(self, phrase: str, canonical: str):
+        node = self.root
+        for token in phrase.split():
+            node = node.setdefault(token, {})
+        node[None] = canonical  # Terminal marker
+
+    def longest_match(self, tokens: List[str]) -> Tuple[Optional[str], int]:
+        """Returns (canonical_verb, tokens_consumed) for the longest matching synonym."""
+        node = self.root
+        best_verb, best_len = None, 0
+        for i, token in enumerate(tokens):
+            node = node.get(token)
+            if node is None:
+                break
+            if None in node:
+                best_verb, best_len = node[None], i + 1
+        return best_verb, best_len
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree keyed on Levenshtein distance.
+
+    Answers "all words within distance d" while only visiting the branches
+    the triangle inequality allows, instead of comparing against every word.
+    """
+
+    def __init__(self):
+        self.root = None  # [word, order, {distance: child}]
+        self._count = 0
+
+    def add(self, word: str):
+        node = [word, self._count, {}]
+        self._count += 1
+        if self.root is None:
+            self.root = node
+            return
+        current = self.root
+        while True:
+            dist = levenshtein_distance(word, current[0])
+            if dist == 0:
+                return
+            child = current[2].get(dist)
+            if child is None:
+                current[2][dist] = node
+                return
+            current = child
+
+    def search(self, word: str, max_dist: int) -> List[Tuple[int, int, str]]:
+        """Returns (distance, insertion_order, word) for every word within max_dist, closest first."""
+        if self.root is None:
+            return []
+        results = []
+        stack = [self.root]
+        while stack:
+            node_word, order, children = stack.pop()
+            # Exact distance is required for the triangle-inequality pruning
+            dist = levenshtein_distance(word, node_word)
+            if dist <= max_dist:
+                results.append((dist, order, node_word))
+            for child_dist, child in children.items():
+                if dist - max_dist <= child_dist <= dist + max_dist:
+                    stack.append(child)
+        results.sort()
+        return results
+
 
 class InputMode:
     DIALOGUE = "DIALOGUE"
@@ -53,6 +152,13 @@ class CommandParser:
             for syn in synonyms:
                 self.verb_map[syn] = canonical
 
+        # Shared lookup structures for normalize, fuzzy match and suggestions
+        self.verb_trie = VerbTrie()
+        self.synonym_tree = BKTree()
+        for syn, canonical in self.verb_map.items():
+            self.verb_trie.insert(syn, canonical)
+            self.synonym_tree.add(syn)
+
     def set_memory(self, parser_memory):
         """Inject parser memory after initialization if needed."""
         self.parser_memory = parser_memory
@@ -93,43 +199,18 @@ class CommandParser:
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """Calculates Levenshtein distance between two strings."""
-        if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
-
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
+        return levenshtein_distance(s1, s2)
 
     def _fuzzy_match_verb(self, input_word: str) -> Tuple[Optional[str], float]:
         """
         Attempts to find a matching verb using fuzzy string matching.
         Returns (canonical_verb, score) where score is similarity (0-1).
         """
-        best_verb = None
-        best_dist = float('inf')
         input_len = len(input_word)
 
         if input_len < 3: # Don't fuzzy match very short words
             return None, 0.0
 
-        for syn, canonical in self.verb_map.items():
-            dist = self._levenshtein_distance(input_word, syn)
-            if dist < best_dist:
-                best_dist = dist
-                best_verb = canonical
-
-        # Calculate similarity score
         # Using a simple cutoff: allow 1 error for length 3-4, 2 for 5+
         max_allowed = 1 if input_len <= 4 else 2
 
@@ -142,8 +223,10 @@ class CommandParser:
                  freq_bonus = 0.5 # Allow slightly more errors for frequent words
                  max_allowed += 1
 
-        if best_dist <= max_allowed:
-            return best_verb, 1.0 - (best_dist / max(input_len, 1)) + freq_bonus
+        matches = self.synonym_tree.search(input_word, max_allowed)
+        if matches:
+            best_dist, _, best_syn = matches[0]
+            return self.verb_map[best_syn], 1.0 - (best_dist / max(input_len, 1)) + freq_bonus
 
         return None, 0.0
 
@@ -151,21 +234,13 @@ class CommandParser:
         """Internal helper to parse a single normalized command string."""
         clean_input = re.sub(r'\s+', ' ', clean_input).strip()
         
-        # Verb matching (Exact)
-        best_verb = None
-        best_len = 0
-        
-        # 1. Try exact matching first (existing logic)
-        for syn, canonical in self.verb_map.items():
-            # Check for exact match or start of string
-            if clean_input == syn or clean_input.startswith(syn + " "):
-                if len(syn) > best_len:
-                    best_len = len(syn)
-                    best_verb = canonical
+        # 1. Try exact matching first: longest synonym prefix, token by token
+        tokens = clean_input.split(' ')
+        best_verb, consumed = self.verb_trie.longest_match(tokens)
                     
         if best_verb:
             # Extract target
-            raw_target = clean_input[best_len:].strip()
+            raw_target = ' '.join(tokens[consumed:])
             return self._finalize_command(best_verb, raw_target)
 
         # 2. Try fuzzy matching on the first word
@@ -186,7 +261,7 @@ class CommandParser:
         if raw_target:
             raw_target = re.sub(r'^(at|to|the|a|an)\s+', '', raw_target).strip()
 
-        return None, None
+        return verb, raw_target if raw_target else None
 
     def get_suggestion(self, invalid_input: str) -> Optional[str]:
         """
@@ -197,37 +272,10 @@ class CommandParser:
         if not clean_input:
             return None
 
-        def levenshtein(s1, s2):
-            if len(s1) < len(s2):
-                return levenshtein(s2, s1)
-            if len(s2) == 0:
-                return len(s1)
-            previous_row = range(len(s2) + 1)
-            for i, c1 in enumerate(s1):
-                current_row = [i + 1]
-                for j, c2 in enumerate(s2):
-                    insertions = previous_row[j + 1] + 1
-                    deletions = current_row[j] + 1
-                    substitutions = previous_row[j] + (c1 != c2)
-                    current_row.append(min(insertions, deletions, substitutions))
-                previous_row = current_row
-            return previous_row[-1]
-
-        best_match = None
-        min_dist = float('inf')
-
-        # Check all synonyms
-        for syn in self.verb_map.keys():
-            dist = levenshtein(clean_input, syn)
-            # Threshold: Allow distance of 1 for short words (len <= 4), 2 for longer
+        # Threshold: Allow distance of 1 for short words (len <= 4), 2 for longer
+        for dist, _, syn in self.synonym_tree.search(clean_input, 2):
             threshold = 1 if len(syn) <= 4 else 2
-
-            if dist <= threshold and dist < min_dist:
-                min_dist = dist
-                best_match = syn
-
-        if best_match:
-            return best_match
+            if dist <= threshold:
+                return syn
 
         return None
-        return verb, raw_target if raw_target else None
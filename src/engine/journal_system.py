@@ -3,6 +3,8 @@ from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from engine.game_clock import WALL_CLOCK
+
 @dataclass
 class JournalEntry:
     """Narrative or discovery log entry."""
@@ -48,7 +50,9 @@ class Annotation:
     timestamp: str
 
 class JournalManager:
-    def __init__(self):
+    def __init__(self, clock=None):
+        # Entry and note timestamps are game time when a game clock is given
+        self.clock = clock or WALL_CLOCK
         self.entries: List[JournalEntry] = []  # Week 6: Narrative entries
         self.suspects: Dict[str, Suspect] = {}
         self.timeline: List[TimelineEvent] = []
@@ -59,7 +63,7 @@ class JournalManager:
     def add_entry(self, title: str, body: str, tags: List[str] = None, timestamp: str = None):
         """Add a narrative journal entry."""
         if timestamp is None:
-            timestamp = datetime.now().isoformat()
+            timestamp = self.clock.now().isoformat()
         entry = JournalEntry(timestamp=timestamp, title=title, body=body, tags=tags or [])
         self.entries.append(entry)
         print(f"[Journal] Entry added: {title}")
@@ -125,7 +129,7 @@ class JournalManager:
 
     def add_annotation(self, target_id: str, text: str):
         """Adds a player note."""
-        timestamp = datetime.now().isoformat()
+        timestamp = self.clock.now().isoformat()
         note = Annotation(target_id=target_id, text=text, timestamp=timestamp)
         self.annotations.append(note)
         print(f"[Journal] Note added for {target_id}")
@@ -3,7 +3,23 @@ Lens System - Dual Narration Engine.
 Filters narrative text based on the player's dominant worldview.
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+
+
+def lens_inputs_version(skill_system, board) -> Optional[Tuple]:
+    """
+    Version key for everything a lens calculation reads: the skill system's
+    state version and the board's theory status version (plus which objects
+    they are, since Game swaps both on load). Two equal keys mean the lens
+    cannot have changed. None if either side doesn't track versions, in which
+    case callers must recompute.
+    """
+    skill_version = getattr(skill_system, "state_version", None)
+    status_version = getattr(board, "status_version", None)
+    if skill_version is None or status_version is None:
+        return None
+    return (id(skill_system), skill_version, id(board), status_version)
+
 
 class LensSystem:
     def __init__(self, skill_system, board):
@@ -11,15 +27,23 @@ class LensSystem:
         self.board = board
         self.locked = False # Permanent worldview commitment (endgame)
         self.current_lens = "neutral" # neutral, believer, skeptic, haunted
+        self._lens_key = None  # lens_inputs_version() current_lens was computed at
         
     def calculate_lens(self) -> str:
         """
         Determines the current lens based on skill levels and active theories.
         Believer Skills: Paranormal Sensitivity, Instinct
         Skeptic Skills: Logic, Skepticism
+
+        Memoized: only recomputed after a skill or theory status change, so
+        every consumer in a turn shares one calculation.
         """
         if self.locked:
             return self.current_lens
+
+        key = lens_inputs_version(self.skill_system, self.board)
+        if key is not None and key == self._lens_key:
+            return self.current_lens
             
         # 1. Get base scores from attributes (The "Core" bias)
         believer_score = self.skill_system.attributes["INTUITION"].value * 2
@@ -38,10 +62,11 @@ class LensSystem:
         )
         
         # 3. Add weight from active theories
-        if self.board.theories.get("i_want_to_believe") and self.board.theories["i_want_to_believe"].status == "active":
+        theories = self.board.theories if self.board else {}
+        if theories.get("i_want_to_believe") and theories["i_want_to_believe"].status == "active":
             believer_score += 4
             
-        if self.board.theories.get("there_is_a_rational_explanation") and self.board.theories["there_is_a_rational_explanation"].status == "active":
+        if theories.get("there_is_a_rational_explanation") and theories["there_is_a_rational_explanation"].status == "active":
             skeptic_score += 4
             
         # 4. Determine dominant lens
@@ -61,7 +86,8 @@ class LensSystem:
             self.current_lens = dominant
         else:
             self.current_lens = "neutral"
-            
+
+        self._lens_key = key
         return self.current_lens
 
     def filter_text(self, base_text: str, variants: Optional[Dict[str, str]] = None) -> str:
@@ -85,6 +111,7 @@ class LensSystem:
 
     def lock_lens(self, forced_lens: Optional[str] = None):
         """Permanently locks the current lens, typically for major story events."""
+        self._lens_key = None
         if forced_lens:
             self.current_lens = forced_lens
         else:
@@ -4,6 +4,17 @@ import os
 from typing import Dict, List, Optional, Tuple
 from dice import roll_2d6, get_roll_description
 
+# Bumped by any change that can move an effective skill level (base level,
+# modifiers, confidence, attribute values). Values derived from skills, such as
+# the player's lens, cache against it; see SkillSystem.state_version.
+_skill_state_version = 0
+
+
+def _touch_skill_state():
+    global _skill_state_version
+    _skill_state_version += 1
+
+
 class Attribute:
     def __init__(self, name: str, base_value: int = 1, cap: int = 6):
         self.name = name
@@ -17,6 +28,7 @@ class Attribute:
     @value.setter
     def value(self, new_val):
         self._value = min(max(new_val, 1), self.cap)
+        _touch_skill_state()
     
     def to_dict(self) -> dict:
         """Serialize attribute to dictionary."""
@@ -33,6 +45,9 @@ class Attribute:
         return attr
 
 class Skill:
+    # Fields that feed effective_level; assigning any of them bumps the skill state version
+    _LEVEL_FIELDS = frozenset({"base_level", "modifiers", "confidence_modifier", "attribute_ref"})
+
     def __init__(self, name: str, attribute_obj: Attribute, personality_desc: str):
         self.name = name
         self.attribute_ref = attribute_obj
@@ -57,13 +72,20 @@ class Skill:
         # Cap by attribute value
         return min(uncapped, self.attribute_ref.value)
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in self._LEVEL_FIELDS:
+            _touch_skill_state()
+
     def set_modifier(self, source: str, value: int):
         """Sets a modifier from a specific source. Use value=0 to remove it."""
         if value == 0:
             if source in self.modifiers:
                 del self.modifiers[source]
-        else:
+                _touch_skill_state()
+        elif self.modifiers.get(source) != value:
             self.modifiers[source] = value
+            _touch_skill_state()
     
     def to_dict(self) -> dict:
         """Serialize skill to dictionary."""
@@ -275,6 +297,11 @@ class SkillSystem:
     def _add_skill(self, name: str, attribute_obj: Attribute, personality: str):
         self.skills[name] = Skill(name, attribute_obj, personality)
 
+    @property
+    def state_version(self) -> int:
+        """Changes whenever any effective skill level may have changed."""
+        return _skill_state_version
+
     def get_skill(self, skill_name: str) -> Optional[Skill]:
         return self.skills.get(skill_name)
     
@@ -8,6 +8,8 @@ import os
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any
 
+from engine.trigger_index import TriggerIndex
+
 
 @dataclass
 class SuppressedMemory:
@@ -20,6 +22,42 @@ class SuppressedMemory:
     effects: Dict[str, int] = field(default_factory=dict)  # Stat changes on unlock
     unlocked: bool = False
 
+    def dependencies(self) -> List[tuple]:
+        """State keys the unlock conditions read, for the MemorySystem trigger index."""
+        conditions = self.unlock_conditions
+        keys = []
+        for skill_name, required_level in conditions.get("skill_threshold", {}).items():
+            keys.append(("skill", skill_name, required_level))
+        if "scene_visited" in conditions:
+            keys.append(("scene",))
+        if "theory_active" in conditions:
+            keys.append(("theory", conditions["theory_active"]))
+        for stat_name, threshold in conditions.get("stat_threshold", {}).items():
+            keys.append(("below", stat_name, threshold))
+        if "event_flag" in conditions:
+            keys.append(("flag", conditions["event_flag"]))
+        return keys
+
+
+def _probe(key, game_state: Dict[str, Any]):
+    """Probe a SuppressedMemory.dependencies() key against the memory game state."""
+    kind = key[0]
+    if kind == "skill":
+        skill_system = game_state.get("skill_system")
+        skill = skill_system.get_skill(key[1]) if skill_system else None
+        return bool(skill and skill.effective_level >= key[2])
+    if kind == "scene":
+        return game_state.get("current_scene")
+    if kind == "theory":
+        board = game_state.get("board")
+        return bool(board and board.is_theory_active(key[1]))
+    if kind == "below":
+        player_state = game_state.get("player_state")
+        return bool(player_state) and player_state.get(key[1], 100) < key[2]
+    if kind == "flag":
+        return key[1] in game_state.get("event_flags", set())
+    raise KeyError(key)
+
 
 class MemorySystem:
     """Manages suppressed memories and their unlock conditions."""
@@ -27,6 +65,8 @@ class MemorySystem:
     def __init__(self, memories_file: str = "data/memories/memories.json"):
         self.memories: Dict[str, SuppressedMemory] = {}
         self.memories_file = memories_file
+        # Locked memories indexed by the state their conditions read
+        self.index = TriggerIndex(_probe)
         self.load_memories()
     
     def load_memories(self) -> bool:
@@ -50,6 +90,7 @@ class MemorySystem:
                     unlocked=False
                 )
                 self.memories[memory_id] = memory
+                self._index_memory(memory)
             
             print(f"[MEMORY] Loaded {len(self.memories)} suppressed memories")
             return True
@@ -124,20 +165,27 @@ class MemorySystem:
         
         return True
     
+    def _index_memory(self, memory: SuppressedMemory):
+        self.index.register(
+            memory.id, memory.dependencies(),
+            lambda game_state, memory=memory: self.check_unlock_conditions(memory, game_state)
+        )
+
     def check_memory_triggers(self, game_state: Dict[str, Any]) -> List[str]:
         """
-        Check all locked memories for unlock conditions.
+        Check locked memories for unlock conditions.
+
+        Only memories whose conditions read state that changed since the last
+        check are re-evaluated (see TriggerIndex).
         
         Returns:
             List of memory IDs that were just unlocked
         """
         newly_unlocked = []
         
-        for memory_id, memory in self.memories.items():
-            if not memory.unlocked:
-                if self.check_unlock_conditions(memory, game_state):
-                    self.unlock_memory(memory_id)
-                    newly_unlocked.append(memory_id)
+        for memory_id in self.index.update(game_state):
+            if self.unlock_memory(memory_id):
+                newly_unlocked.append(memory_id)
         
         return newly_unlocked
     
@@ -156,6 +204,7 @@ class MemorySystem:
             return False  # Already unlocked
         
         memory.unlocked = True
+        self.index.unregister(memory_id)
         print(f"\n{'='*60}")
         print(f"  SUPPRESSED MEMORY SURFACING")
         print(f"{'='*60}")
@@ -199,3 +248,4 @@ class MemorySystem:
         for memory_id in unlocked_ids:
             if memory_id in self.memories:
                 self.memories[memory_id].unlocked = True
+                self.index.unregister(memory_id)
@@ -21,7 +21,7 @@ class NewGamePlusManager:
         saves = self.save_system.list_saves()
         for save in saves:
             # Check if any save has reached an ending
-            save_data = self.save_system.load_game(save["slot"])
+            save_data = self.save_system.load_game(save["slot_id"])
             if save_data and save_data.get("game_completed", False):
                 return True
         return False
@@ -32,10 +32,10 @@ class NewGamePlusManager:
         completed_saves = []
         
         for save in saves:
-            save_data = self.save_system.load_game(save["slot"])
+            save_data = self.save_system.load_game(save["slot_id"])
             if save_data and save_data.get("game_completed", False):
                 completed_saves.append({
-                    "slot": save["slot"],
+                    "slot": save["slot_id"],
                     "timestamp": save.get("timestamp", 0),
                     "data": save_data
                 })
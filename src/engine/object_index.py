@@ -0,0 +1,166 @@
+"""
+Scene Object Index
+
+Precompiled lookup tables for resolving free-text targets ("the stain",
+"lamps", "desk") against a scene's `objects` dict. An index is built once
+per scene and then answers every EXAMINE / TAKE / USE / TALK lookup with
+dictionary hits instead of string scans over every object key.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Context-merged nouns: common synonyms mapped to probable object keys
+NOUN_SYNONYMS = {
+    "blood": ["stain", "mark", "pool", "splatter"],
+    "stain": ["blood", "mark", "pool"],
+    "mark": ["blood", "stain", "scratch"],
+    "body": ["corpse", "victim", "cadaver"],
+    "corpse": ["body", "victim"],
+    "desk": ["table", "workstation"],
+    "door": ["exit", "entry", "gate"],
+    "light": ["lamp", "bulb", "fixture"],
+    "notebook": ["journal", "diary", "notes"],
+}
+
+# Match ranks, best first
+RANK_EXACT = 0
+RANK_ALIAS = 1
+RANK_SYNONYM = 2
+RANK_STEM = 3
+RANK_SUBSTRING = 4
+
+
+def normalize_name(text: str) -> str:
+    """Lowercase and collapse separators: 'Shed_Door' -> 'shed door'."""
+    return re.sub(r'[\s_\-]+', ' ', text.lower()).strip()
+
+
+def stem(word: str) -> str:
+    """Very small English stemmer: enough to fold plurals ('lamps', 'boxes')."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith(("ches", "shes", "xes", "sses")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+class SceneObjectIndex:
+    """
+    Alias / stem / substring index over one scene's objects.
+
+    Resolution ranks candidates exactly the way the original linear matcher
+    ordered them (exact key, synonyms, substrings), with aliases and plural
+    folding slotted in ahead of the looser substring rule. Substring lookups
+    go through a sorted suffix table: one entry per character of each key,
+    searched by binary search.
+    """
+
+    def __init__(self, objects: Dict[str, Any]):
+        self.objects = objects
+        self._order: Dict[str, int] = {}
+        self._aliases: Dict[str, List[str]] = {}
+        self._stems: Dict[str, List[str]] = {}
+        # (lowered key, suffix start, key), sorted by suffix
+        self._suffixes: List[Tuple[str, int, str]] = []
+
+        for position, (key, data) in enumerate(objects.items()):
+            self._order[key] = position
+            names = {normalize_name(key)}
+            if isinstance(data, dict):
+                if data.get("name"):
+                    names.add(normalize_name(data["name"]))
+                for alias in data.get("aliases", []):
+                    names.add(normalize_name(alias))
+
+            for name in names:
+                self._add(self._aliases, name, key)
+                self._add(self._stems, " ".join(stem(t) for t in name.split()), key)
+                for token in name.split():
+                    self._add(self._stems, stem(token), key)
+
+            lowered = key.lower()
+            self._suffixes.extend((lowered, start, key) for start in range(len(lowered)))
+
+        self._suffixes.sort(key=lambda entry: entry[0][entry[1]:])
+
+    def _substring_keys(self, term: str) -> List[str]:
+        """Keys containing term, in key order (suffixes starting with term)."""
+        width = len(term)
+        lo = bisect_left(self._suffixes, term, key=lambda entry: entry[0][entry[1]:entry[1] + width])
+        found = set()
+        for text, start, key in self._suffixes[lo:]:
+            if text[start:start + width] != term:
+                break
+            found.add(key)
+        return sorted(found, key=self._order.__getitem__)
+
+    @staticmethod
+    def _add(table: Dict[str, List[str]], term: str, key: str):
+        keys = table.setdefault(term, [])
+        if key not in keys:
+            keys.append(key)
+
+    def candidates(self, target_name: str) -> List[Tuple[int, str]]:
+        """
+        Return every matching object as (rank, key), best match first.
+
+        See ambiguous_matches for when the best match is a tie.
+        """
+        return [(entry[0], key) for entry, key in self._ranked(target_name)]
+
+    def _ranked(self, target_name: str) -> List[Tuple[Tuple[int, int, int], str]]:
+        """Matches as ((rank, synonym order, object order), key), best first."""
+        if not target_name:
+            return []
+
+        target_lower = target_name.lower()
+        normalized = normalize_name(target_name)
+        ranked: Dict[str, Tuple[int, int, int]] = {}
+
+        def offer(key: str, rank: int, sub_order: int = 0):
+            entry = (rank, sub_order, self._order[key])
+            if key not in ranked or entry < ranked[key]:
+                ranked[key] = entry
+
+        if target_name in self.objects:
+            offer(target_name, RANK_EXACT)
+
+        for key in self._aliases.get(normalized, ()):
+            offer(key, RANK_ALIAS)
+
+        for i, syn in enumerate(NOUN_SYNONYMS.get(target_lower, ())):
+            for key in self._substring_keys(syn):
+                offer(key, RANK_SYNONYM, i)
+
+        stemmed = " ".join(stem(t) for t in normalized.split())
+        for key in self._stems.get(stemmed, ()):
+            offer(key, RANK_STEM)
+
+        for key in self._substring_keys(target_lower):
+            offer(key, RANK_SUBSTRING)
+
+        return [(entry, key) for key, entry in sorted(ranked.items(), key=lambda item: item[1])]
+
+    def resolve(self, target_name: str) -> Tuple[Optional[str], Optional[Any]]:
+        """Return (key, data) for the best match, or (None, None)."""
+        matches = self.candidates(target_name)
+        if not matches:
+            return None, None
+        key = matches[0][1]
+        return key, self.objects[key]
+
+    def ambiguous_matches(self, target_name: str) -> List[str]:
+        """
+        Keys tied for the best match (empty or single entry means unambiguous).
+        An earlier noun synonym still beats a later one, as in the legacy matcher.
+        """
+        matches = self._ranked(target_name)
+        if not matches:
+            return []
+        best = matches[0][0][:2]
+        return [key for entry, key in matches if entry[:2] == best]
@@ -3,15 +3,154 @@ Parser Memory - Tracks player input history for context-aware branching.
 
 Maintains a circular buffer of recent commands and provides keyword/pattern matching
 for dynamic scene branching based on player exploration and dialogue.
+
+Registered trigger phrases are compiled into an inverted keyword index and a
+set of precompiled regexes. Both are updated incrementally as each command
+enters (and leaves) the buffer, so per-turn trigger cost depends on the new
+command rather than on how many triggers exist.
 """
 
+import base64
+import hashlib
+import math
 import re
-from collections import deque
-from typing import List, Set, Optional, Dict
+from collections import OrderedDict, deque
+from typing import Any, List, Set, Optional, Dict
+
+
+class KeywordSketch:
+    """
+    Fixed-size keyword statistics with exponential decay.
+
+    - A conservative-update count-min sketch estimates decayed keyword
+      frequencies for any word.
+    - A Bloom filter records which words were ever mentioned (no false
+      negatives, but false positives grow with vocabulary).
+    - A small top-K table tracks the heaviest keywords.
+
+    Everything here is approximate, so it only backs the statistics APIs
+    (get_keyword_frequency, get_top_keywords), never branch conditions.
+
+    Decay is measured in commands (one tick per add_command). Weights grow
+    with time instead of old cells shrinking, so a tick costs O(1).
+    """
+
+    def __init__(self, width: int = 256, depth: int = 4, bloom_bits: int = 8192,
+                 top_k: int = 32, half_life: int = 500):
+        self.width = width
+        self.depth = depth
+        self.bloom_bits = bloom_bits
+        self.top_k = top_k
+        self.half_life = half_life
+        self.cells = [[0.0] * width for _ in range(depth)]
+        self.bloom = bytearray(bloom_bits // 8)
+        self.top: Dict[str, float] = {}
+        self._rate = math.log(2) / half_life
+        self._weight = 1.0
+
+    def _hashes(self, word: str) -> List[int]:
+        # Stable across runs (unlike hash()), so sketches survive save/load
+        digest = hashlib.blake2b(word.encode('utf-8'), digest_size=4 * self.depth).digest()
+        return [int.from_bytes(digest[i * 4:(i + 1) * 4], 'little') for i in range(self.depth)]
+
+    def tick(self):
+        """Advance the decay clock by one command."""
+        self._weight *= math.exp(self._rate)
+        if self._weight > 1e12:
+            self._renormalize()
+
+    def _renormalize(self):
+        for row in self.cells:
+            for i in range(self.width):
+                row[i] /= self._weight
+        for word in self.top:
+            self.top[word] /= self._weight
+        self._weight = 1.0
+
+    def add(self, word: str, count: float = 1.0):
+        hashes = self._hashes(word)
+        for h in hashes:
+            bit = h % self.bloom_bits
+            self.bloom[bit // 8] |= 1 << (bit % 8)
+
+        # Conservative update: only raise cells to the new estimate
+        columns = [h % self.width for h in hashes]
+        estimate = min(self.cells[row][col] for row, col in enumerate(columns)) + count * self._weight
+        for row, col in enumerate(columns):
+            if self.cells[row][col] < estimate:
+                self.cells[row][col] = estimate
+
+        if word in self.top or len(self.top) < self.top_k:
+            self.top[word] = estimate
+        else:
+            weakest = min(self.top, key=self.top.get)
+            if estimate > self.top[weakest]:
+                del self.top[weakest]
+                self.top[word] = estimate
+
+    def seen(self, word: str) -> bool:
+        for h in self._hashes(word):
+            bit = h % self.bloom_bits
+            if not self.bloom[bit // 8] & (1 << (bit % 8)):
+                return False
+        return True
+
+    def estimate(self, word: str) -> float:
+        columns = [h % self.width for h in self._hashes(word)]
+        return min(self.cells[row][col] for row, col in enumerate(columns)) / self._weight
+
+    def top_keywords(self, count: int) -> List[tuple]:
+        ranked = sorted(self.top.items(), key=lambda x: x[1], reverse=True)[:count]
+        return [(word, value / self._weight) for word, value in ranked]
+
+    def to_dict(self) -> dict:
+        self._renormalize()
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "bloom_bits": self.bloom_bits,
+            "top_k": self.top_k,
+            "half_life": self.half_life,
+            "cells": [[round(c, 4) for c in row] for row in self.cells],
+            "bloom": base64.b64encode(bytes(self.bloom)).decode('ascii'),
+            "top": {word: round(value, 4) for word, value in self.top.items()}
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'KeywordSketch':
+        sketch = KeywordSketch(
+            data.get("width", 256), data.get("depth", 4), data.get("bloom_bits", 8192),
+            data.get("top_k", 32), data.get("half_life", 500)
+        )
+        if "cells" in data:
+            sketch.cells = [list(map(float, row)) for row in data["cells"]]
+        if "bloom" in data:
+            sketch.bloom = bytearray(base64.b64decode(data["bloom"]))
+        sketch.top = {word: float(value) for word, value in data.get("top", {}).items()}
+        return sketch
+
+
+def trigger_key(trigger: Dict[str, Any]) -> str:
+    """
+    Stable identity of a trigger phrase: its "id", or else its phrase itself
+    (so equal anonymous triggers share one index entry).
+    """
+    if trigger.get("id") is not None:
+        return str(trigger["id"])
+    if "pattern" in trigger:
+        return f"pattern:{trigger['pattern']}"
+    keywords = trigger.get("keywords", [])
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    return f"{trigger.get('mode', 'all')}:{','.join(kw.lower() for kw in keywords)}"
 
 
 class ParserMemory:
     """Tracks player input history for context-aware scene branching."""
+
+    # Ad-hoc patterns kept compiled (least recently queried are evicted);
+    # patterns of registered triggers are never evicted
+    PATTERN_CACHE_SIZE = 64
     
     def __init__(self, buffer_size: int = 20):
         """
@@ -23,8 +162,27 @@ class ParserMemory:
         self.buffer_size = buffer_size
         self.command_buffer = deque(maxlen=buffer_size)
         self.discovered_concepts = set()
-        self.keyword_counts = {}
-        self.pattern_cache = {}
+        # Bounded, approximate keyword statistics for frequency queries.
+        # Exact counts are kept for every keyword a trigger or branch
+        # condition can ask about (see watch_keywords).
+        self.keyword_sketch = KeywordSketch()
+        self.watched_counts: Dict[str, int] = {}
+
+        # pattern -> [compiled regex, number of buffered commands it matches],
+        # least recently queried first
+        self.pattern_cache: "OrderedDict[str, list]" = OrderedDict()
+        # Patterns matched by each buffered command (parallel to command_buffer)
+        self._command_matches = deque(maxlen=buffer_size)
+
+        # Compiled trigger phrases by trigger_key (see register_triggers)
+        self._triggers: Dict[str, dict] = {}
+        self._keyword_index: Dict[str, List[str]] = {}
+        self._pattern_index: Dict[str, List[str]] = {}
+        self._active_triggers: Dict[str, dict] = {}
+        self._activation_delta: List[dict] = []
+
+        # Commands recorded by defer_command, applied on the next read
+        self._pending: List[str] = []
         
     def add_command(self, command_text: str):
         """
@@ -33,19 +191,65 @@ class ParserMemory:
         Args:
             command_text: Raw player input
         """
+        if self._pending:
+            self.flush_pending()
+        self._record(command_text)
+
+    def defer_command(self, command_text: str):
+        """
+        Queue a command for the buffer without processing it yet.
+
+        Structured actions use this so a turn does not pay for pattern and
+        keyword updates; they are applied in order before the next query.
+        
+        Args:
+            command_text: Command text (e.g. "examine desk")
+        """
+        if command_text and command_text.strip():
+            self._pending.append(command_text)
+
+    def flush_pending(self):
+        """Apply every deferred command."""
+        pending, self._pending = self._pending, []
+        for command_text in pending:
+            self._record(command_text)
+
+    def _record(self, command_text: str):
         if not command_text or not command_text.strip():
             return
             
         normalized = command_text.lower().strip()
+
+        # Account for the command about to fall off the buffer
+        if len(self.command_buffer) == self.buffer_size:
+            for pattern in self._command_matches[0]:
+                entry = self.pattern_cache.get(pattern)
+                if entry:
+                    entry[1] -= 1
+                    if entry[1] == 0:
+                        self._on_pattern_changed(pattern, False)
+
         self.command_buffer.append(normalized)
         
-        # Update keyword counts
+        # Regexes only need checking against the new command
+        matched = set()
+        for pattern, entry in self.pattern_cache.items():
+            if entry[0] and entry[0].search(normalized):
+                matched.add(pattern)
+                entry[1] += 1
+                if entry[1] == 1:
+                    self._on_pattern_changed(pattern, True)
+        self._command_matches.append(matched)
+        
+        # Update keyword statistics
+        self.keyword_sketch.tick()
         words = self._extract_keywords(normalized)
         for word in words:
-            self.keyword_counts[word] = self.keyword_counts.get(word, 0) + 1
-        
-        # Clear pattern cache when new command added
-        self.pattern_cache.clear()
+            self.keyword_sketch.add(word)
+            if word in self.watched_counts:
+                self.watched_counts[word] += 1
+                if self.watched_counts[word] == 1:
+                    self._on_keyword_mentioned(word)
     
     def has_mentioned(self, keyword: str, min_count: int = 1) -> bool:
         """
@@ -58,9 +262,36 @@ class ParserMemory:
         Returns:
             True if keyword mentioned at least min_count times
         """
+        if self._pending:
+            self.flush_pending()
         normalized = keyword.lower()
-        count = self.keyword_counts.get(normalized, 0)
-        return count >= min_count
+        if normalized not in self.watched_counts:
+            # Answer exactly from here on; earlier mentions only count while still buffered
+            self.watch_keywords([normalized])
+        return self.watched_counts[normalized] >= min_count
+
+    def watch_keywords(self, keywords: List[str]):
+        """
+        Track exact mention counts for specific keywords (e.g. branch conditions).
+
+        Content keywords should be watched up front (Game watches every
+        parser_keywords condition at load). A keyword first watched later
+        starts from its mentions still in the command buffer; the sketch is
+        never used to seed an exact count.
+        
+        Args:
+            keywords: Keywords to watch
+        """
+        if self._pending:
+            self.flush_pending()
+        for keyword in keywords:
+            normalized = keyword.lower()
+            if normalized not in self.watched_counts:
+                self.watched_counts[normalized] = self._buffered_mentions(normalized)
+
+    def _buffered_mentions(self, keyword: str) -> int:
+        """Exact mentions of a keyword among the buffered commands."""
+        return sum(self._extract_keywords(command).count(keyword) for command in self.command_buffer)
     
     def has_pattern(self, regex_pattern: str) -> bool:
         """
@@ -72,22 +303,44 @@ class ParserMemory:
         Returns:
             True if any command matches the pattern
         """
-        # Check cache
-        if regex_pattern in self.pattern_cache:
-            return self.pattern_cache[regex_pattern]
-        
+        return self._track_pattern(regex_pattern)[1] > 0
+
+    def _track_pattern(self, regex_pattern: str) -> list:
+        """Compile a pattern once and count its matches over the current buffer."""
+        if self._pending:
+            self.flush_pending()
+        entry = self.pattern_cache.get(regex_pattern)
+        if entry is not None:
+            self.pattern_cache.move_to_end(regex_pattern)
+            return entry
+
         try:
             compiled = re.compile(regex_pattern, re.IGNORECASE)
-            for command in self.command_buffer:
-                if compiled.search(command):
-                    self.pattern_cache[regex_pattern] = True
-                    return True
         except re.error:
-            # Invalid regex
-            pass
-        
-        self.pattern_cache[regex_pattern] = False
-        return False
+            # Invalid regex never matches
+            compiled = None
+
+        count = 0
+        if compiled:
+            for command, matches in zip(self.command_buffer, self._command_matches):
+                if compiled.search(command):
+                    matches.add(regex_pattern)
+                    count += 1
+
+        entry = [compiled, count]
+        self.pattern_cache[regex_pattern] = entry
+        if len(self.pattern_cache) > self.PATTERN_CACHE_SIZE:
+            self._evict_pattern()
+        return entry
+
+    def _evict_pattern(self):
+        """Drop the least recently queried pattern no registered trigger uses."""
+        for pattern in self.pattern_cache:
+            if pattern not in self._pattern_index:
+                del self.pattern_cache[pattern]
+                for matches in self._command_matches:
+                    matches.discard(pattern)
+                return
     
     def has_mentioned_all(self, keywords: List[str]) -> bool:
         """
@@ -123,6 +376,8 @@ class ParserMemory:
         Returns:
             List of recent commands (newest first)
         """
+        if self._pending:
+            self.flush_pending()
         return list(reversed(list(self.command_buffer)))[:count]
     
     def get_discovered_concepts(self) -> Set[str]:
@@ -155,9 +410,105 @@ class ParserMemory:
         """
         return concept_id in self.discovered_concepts
     
-    def check_trigger_phrases(self, triggers: List[Dict[str, any]]) -> List[Dict[str, any]]:
+    def register_triggers(self, triggers: List[Dict[str, Any]]):
+        """
+        Compile trigger phrases into the incremental index.
+
+        Keyword triggers are indexed by each keyword; pattern triggers have
+        their regex compiled once. Activation state is then maintained as
+        commands arrive instead of being recomputed on every check.
+        
+        Args:
+            triggers: List of trigger dictionaries with 'keywords' or 'pattern'
+        """
+        if self._pending:
+            self.flush_pending()
+        for trigger in triggers:
+            trigger_id = trigger_key(trigger)
+            if trigger_id in self._triggers:
+                continue
+
+            record = {"trigger": trigger}
+            if "keywords" in trigger:
+                keywords = trigger["keywords"]
+                if isinstance(keywords, str):
+                    keywords = [keywords]
+                keywords = [kw.lower() for kw in keywords]
+                self.watch_keywords(keywords)
+                record["mode"] = trigger.get("mode", "all")  # 'all' or 'any'
+                record["missing"] = {kw for kw in keywords if not self.watched_counts[kw]}
+                record["any_hit"] = len(record["missing"]) < len(set(keywords))
+                for kw in set(keywords):
+                    self._keyword_index.setdefault(kw, []).append(trigger_id)
+                self._triggers[trigger_id] = record
+                if self._keyword_record_active(record):
+                    self._activate(trigger_id)
+            elif "pattern" in trigger:
+                record["pattern"] = trigger["pattern"]
+                self._pattern_index.setdefault(trigger["pattern"], []).append(trigger_id)
+                self._triggers[trigger_id] = record
+                if self._track_pattern(trigger["pattern"])[1] > 0:
+                    self._activate(trigger_id)
+
+    @staticmethod
+    def _keyword_record_active(record: dict) -> bool:
+        if record["mode"] == "all":
+            return not record["missing"]
+        return record["any_hit"]
+
+    def _activate(self, trigger_id: str):
+        if trigger_id not in self._active_triggers:
+            trigger = self._triggers[trigger_id]["trigger"]
+            self._active_triggers[trigger_id] = trigger
+            self._activation_delta.append(trigger)
+
+    def _on_keyword_mentioned(self, keyword: str):
+        """Update keyword triggers waiting on a newly mentioned keyword."""
+        for trigger_id in self._keyword_index.get(keyword, ()):
+            record = self._triggers[trigger_id]
+            record["missing"].discard(keyword)
+            record["any_hit"] = True
+            if self._keyword_record_active(record):
+                self._activate(trigger_id)
+
+    def _on_pattern_changed(self, pattern: str, matching: bool):
+        """A pattern started or stopped matching the buffer."""
+        for trigger_id in self._pattern_index.get(pattern, ()):
+            if matching:
+                self._activate(trigger_id)
+            else:
+                self._active_triggers.pop(trigger_id, None)
+
+    def pop_activations(self) -> List[Dict[str, Any]]:
+        """
+        Return registered triggers that became active since the last call.
+        
+        Returns:
+            List of newly activated triggers, in activation order
+        """
+        if self._pending:
+            self.flush_pending()
+        delta = self._activation_delta
+        self._activation_delta = []
+        return delta
+
+    def _rebuild_trigger_state(self):
+        """Recompute trigger state after the buffer or counts were replaced."""
+        triggers = [record["trigger"] for record in self._triggers.values()]
+        self._triggers.clear()
+        self._keyword_index.clear()
+        self._pattern_index.clear()
+        self._active_triggers.clear()
+        self.register_triggers(triggers)
+        self._activation_delta = []
+
+    def check_trigger_phrases(self, triggers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Check which trigger phrases have been activated.
+
+        Registered triggers are answered from the incremental index; any
+        others are evaluated directly, which is only exact for keywords that
+        were watched before they were typed.
         
         Args:
             triggers: List of trigger dictionaries with 'keywords' or 'pattern'
@@ -165,9 +516,17 @@ class ParserMemory:
         Returns:
             List of activated triggers
         """
+        if self._pending:
+            self.flush_pending()
         activated = []
         
         for trigger in triggers:
+            trigger_id = trigger_key(trigger)
+            if trigger_id in self._triggers:
+                if trigger_id in self._active_triggers:
+                    activated.append(trigger)
+                continue
+
             # Check keyword-based triggers
             if "keywords" in trigger:
                 keywords = trigger["keywords"]
@@ -218,39 +577,42 @@ class ParserMemory:
     
     def get_keyword_frequency(self, keyword: str) -> int:
         """
-        Get the frequency of a keyword.
+        Get the (decayed) frequency of a keyword.
         
         Args:
             keyword: Keyword to check
             
         Returns:
-            Number of times keyword was mentioned
+            Approximate number of recent mentions
         """
-        return self.keyword_counts.get(keyword.lower(), 0)
+        if self._pending:
+            self.flush_pending()
+        return int(round(self.keyword_sketch.estimate(keyword.lower())))
     
     def get_top_keywords(self, count: int = 10) -> List[tuple]:
         """
         Get the most frequently mentioned keywords.
         
         Args:
-            count: Number of keywords to return
+            count: Number of keywords to return (at most the sketch's top_k)
             
         Returns:
             List of (keyword, frequency) tuples
         """
-        sorted_keywords = sorted(
-            self.keyword_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        return sorted_keywords[:count]
+        if self._pending:
+            self.flush_pending()
+        return [(word, int(round(freq))) for word, freq in self.keyword_sketch.top_keywords(count)]
     
     def clear(self):
         """Clear all memory."""
+        self._pending = []
         self.command_buffer.clear()
         self.discovered_concepts.clear()
-        self.keyword_counts.clear()
+        self.keyword_sketch = KeywordSketch()
+        self.watched_counts = {k: 0 for k in self.watched_counts}
         self.pattern_cache.clear()
+        self._command_matches.clear()
+        self._rebuild_trigger_state()
     
     def save_state(self) -> dict:
         """
@@ -259,10 +621,13 @@ class ParserMemory:
         Returns:
             Dictionary of state data
         """
+        if self._pending:
+            self.flush_pending()
         return {
             "commands": list(self.command_buffer),
             "discovered_concepts": list(self.discovered_concepts),
-            "keyword_counts": self.keyword_counts.copy()
+            "keyword_sketch": self.keyword_sketch.to_dict(),
+            "watched_counts": self.watched_counts.copy()
         }
     
     def load_state(self, state: dict):
@@ -272,10 +637,25 @@ class ParserMemory:
         Args:
             state: State dictionary from save_state()
         """
+        self._pending = []
         self.command_buffer = deque(state.get("commands", []), maxlen=self.buffer_size)
         self.discovered_concepts = set(state.get("discovered_concepts", []))
-        self.keyword_counts = state.get("keyword_counts", {}).copy()
+        if "keyword_sketch" in state:
+            self.keyword_sketch = KeywordSketch.from_dict(state["keyword_sketch"])
+        else:
+            # Legacy saves stored an unbounded dict of exact counts
+            self.keyword_sketch = KeywordSketch()
+            for word, count in state.get("keyword_counts", {}).items():
+                self.keyword_sketch.add(word, count)
+        watched = {k: self._buffered_mentions(k) for k in self.watched_counts}
+        watched.update(state.get("watched_counts", {}))
+        for word, count in state.get("keyword_counts", {}).items():
+            if word in watched:
+                watched[word] = count
+        self.watched_counts = watched
         self.pattern_cache.clear()
+        self._command_matches = deque((set() for _ in self.command_buffer), maxlen=self.buffer_size)
+        self._rebuild_trigger_state()
     
     def __repr__(self) -> str:
         return f"<ParserMemory: {len(self.command_buffer)} commands, {len(self.discovered_concepts)} concepts>"
@@ -263,18 +263,19 @@ class PsychologicalState:
     
     # ==================== MENTAL LOAD SYSTEM ====================
     
-    def add_mental_load(self, amount: int, source: str = "Unknown") -> Dict:
+    def add_mental_load(self, amount: int, source: str = "Unknown", scaled: bool = False) -> Dict:
         """
         Add Mental Load with sanity-based multiplier.
         
         Args:
             amount: Base amount to add
             source: What caused the load
+            scaled: amount already includes the sanity multiplier
             
         Returns:
             Dict with messages and current load level
         """
-        multiplier = self.get_mental_load_multiplier()
+        multiplier = 1.0 if scaled else self.get_mental_load_multiplier()
         actual_amount = int(amount * multiplier)
         
         old_load = self.player_state["mental_load"]
@@ -0,0 +1,137 @@
+"""
+Save Schema Migrations
+
+Registry of per-subsystem upgrade steps for save files. Each step upgrades
+one top-level block (e.g. "event_log") or nested block (e.g.
+"additional_systems.fracture_system") from one save version to the next.
+
+Migrations run lazily: SaveData only upgrades a block the first time it is
+accessed, so loading a large legacy save never pays for blocks nobody reads.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Ordered history of save layout versions. Saves without a version tag
+# predate versioning and are treated as the first entry.
+SAVE_VERSIONS = ["1.0", "1.1", "1.2"]
+CURRENT_VERSION = SAVE_VERSIONS[-1]
+
+# subsystem path -> {from_version: migration}
+_MIGRATIONS: Dict[str, Dict[str, Callable[[Any], Any]]] = {}
+
+
+def register_migration(subsystem: str, from_version: str):
+    """
+    Decorator registering a migration that upgrades `subsystem` from
+    `from_version` to the next version in SAVE_VERSIONS.
+
+    The migration receives the block as stored and returns the upgraded block.
+    """
+    if from_version not in SAVE_VERSIONS[:-1]:
+        raise ValueError(f"Cannot migrate from unknown or current version '{from_version}'")
+
+    def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        _MIGRATIONS.setdefault(subsystem, {})[from_version] = func
+        return func
+    return decorator
+
+
+def migrate_block(subsystem: str, block: Any, from_version: str) -> Any:
+    """Run every registered step for a subsystem from from_version up to CURRENT_VERSION."""
+    steps = _MIGRATIONS.get(subsystem)
+    if not steps or block is None:
+        return block
+    if from_version not in SAVE_VERSIONS:
+        print(f"[WARNING] Unknown save version '{from_version}' for {subsystem}; loading as-is.")
+        return block
+
+    for version in SAVE_VERSIONS[SAVE_VERSIONS.index(from_version):-1]:
+        step = steps.get(version)
+        if step:
+            block = step(block)
+    return block
+
+
+def registered_subsystems() -> List[str]:
+    """Return every subsystem path that has at least one migration."""
+    return list(_MIGRATIONS.keys())
+
+
+class SaveData:
+    """
+    Read-only view over a loaded save that upgrades blocks on first access.
+
+    Usage:
+        save = SaveData(raw_dict)
+        board_state = save.get_block("board_state")
+        fracture = save.get_block("additional_systems.fracture_system")
+    """
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self.version = raw.get("version", SAVE_VERSIONS[0])
+        self._cache: Dict[str, Any] = {}
+
+    @property
+    def is_current(self) -> bool:
+        return self.version == CURRENT_VERSION
+
+    def _lookup(self, path: str) -> Tuple[bool, Any]:
+        node: Any = self.raw
+        for part in path.split("."):
+            if not isinstance(node, dict) or part not in node:
+                return False, None
+            node = node[part]
+        return True, node
+
+    def has_block(self, path: str) -> bool:
+        return self._lookup(path)[0]
+
+    def get_block(self, path: str, default: Optional[Any] = None) -> Any:
+        """Return a block upgraded to CURRENT_VERSION, or default if absent."""
+        if path in self._cache:
+            return self._cache[path]
+
+        found, block = self._lookup(path)
+        if not found:
+            return default
+
+        if not self.is_current:
+            block = migrate_block(path, block, self.version)
+        self._cache[path] = block
+        return block
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Plain metadata access (scene, datetime, summary ...)."""
+        return self.raw.get(key, default)
+
+    def migrate_all(self) -> Dict[str, Any]:
+        """Eagerly upgrade every registered block and return a current-version dict."""
+        upgraded = dict(self.raw)
+        for path in registered_subsystems():
+            found, _ = self._lookup(path)
+            if not found:
+                continue
+            block = self.get_block(path)
+            parts = path.split(".")
+            node = upgraded
+            for part in parts[:-1]:
+                node[part] = dict(node[part])
+                node = node[part]
+            node[parts[-1]] = block
+        upgraded["version"] = CURRENT_VERSION
+        return upgraded
+
+
+# ---------------------------------------------------------------------------
+# Registered migrations
+# ---------------------------------------------------------------------------
+
+@register_migration("event_log", "1.1")
+def _event_log_rows(block: Dict[str, Any]) -> Dict[str, Any]:
+    """1.1 stored events as a list of dicts with formatted timestamps; 1.2 stores compact rows."""
+    if "events" not in block:
+        return block
+    from engine.save_system import EventLog
+    return EventLog.from_dict(block).to_dict()
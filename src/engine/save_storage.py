@@ -0,0 +1,210 @@
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class SaveStorage(ABC):
+    """
+    Abstract storage backend for serialized save slots.
+
+    Backends only move opaque text payloads around. Metadata, hashing and
+    (de)serialization stay in SaveSystem, so every backend produces
+    byte-identical save documents.
+    """
+
+    @abstractmethod
+    def read(self, slot_id: str) -> Optional[str]:
+        """Return the raw payload for a slot, or None if it does not exist."""
+        pass
+
+    @abstractmethod
+    def write(self, slot_id: str, payload: str) -> None:
+        """Create or replace the payload for a slot."""
+        pass
+
+    @abstractmethod
+    def delete(self, slot_id: str) -> bool:
+        """Remove a slot. Returns False if the slot did not exist."""
+        pass
+
+    @abstractmethod
+    def list_slots(self) -> List[str]:
+        """Return the IDs of all stored slots."""
+        pass
+
+    def exists(self, slot_id: str) -> bool:
+        """Check whether a slot has been stored."""
+        return self.read(slot_id) is not None
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
+
+
+class FileSaveStorage(SaveStorage):
+    """Stores each slot as `<directory>/<slot_id>.json` (the original layout)."""
+
+    def __init__(self, directory: str = "saves"):
+        self.directory = directory
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def _path(self, slot_id: str) -> str:
+        return os.path.join(self.directory, f"{slot_id}.json")
+
+    def read(self, slot_id: str) -> Optional[str]:
+        path = self._path(slot_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def write(self, slot_id: str, payload: str) -> None:
+        # Write to a sibling temp file and swap it in so a crash mid-write
+        # never leaves a truncated save behind.
+        path = self._path(slot_id)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    def delete(self, slot_id: str) -> bool:
+        path = self._path(slot_id)
+        if not os.path.exists(path):
+            return False
+        os.remove(path)
+        return True
+
+    def list_slots(self) -> List[str]:
+        if not os.path.exists(self.directory):
+            return []
+        return [f[:-5] for f in os.listdir(self.directory) if f.endswith('.json')]
+
+    def exists(self, slot_id: str) -> bool:
+        return os.path.exists(self._path(slot_id))
+
+
+class SQLiteSaveStorage(SaveStorage):
+    """
+    Stores slots for many players in a single SQLite database.
+
+    Each instance is scoped to one player_id; several instances (one per
+    connected player) can share the same database file. The database runs
+    in WAL mode so readers never block the writer.
+    """
+
+    def __init__(self, db_path: str = "saves/saves.db", player_id: str = "default"):
+        self.db_path = db_path
+        self.player_id = player_id
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS saves ("
+            " player_id TEXT NOT NULL,"
+            " slot_id TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " updated_at TEXT NOT NULL,"
+            " PRIMARY KEY (player_id, slot_id))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_saves_player_updated"
+            " ON saves (player_id, updated_at)"
+        )
+        self._conn.commit()
+
+    def read(self, slot_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM saves WHERE player_id = ? AND slot_id = ?",
+                (self.player_id, slot_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def write(self, slot_id: str, payload: str) -> None:
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO saves (player_id, slot_id, payload, updated_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(player_id, slot_id) DO UPDATE SET"
+                " payload = excluded.payload, updated_at = excluded.updated_at",
+                (self.player_id, slot_id, payload, now)
+            )
+            self._conn.commit()
+
+    def delete(self, slot_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM saves WHERE player_id = ? AND slot_id = ?",
+                (self.player_id, slot_id)
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def list_slots(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT slot_id FROM saves WHERE player_id = ? ORDER BY updated_at DESC",
+                (self.player_id,)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def exists(self, slot_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM saves WHERE player_id = ? AND slot_id = ?",
+                (self.player_id, slot_id)
+            ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class MemorySaveStorage(SaveStorage):
+    """Keeps slots in a dict. Nothing touches disk; intended for tests and benchmarks."""
+
+    def __init__(self):
+        self.slots: Dict[str, str] = {}
+
+    def read(self, slot_id: str) -> Optional[str]:
+        return self.slots.get(slot_id)
+
+    def write(self, slot_id: str, payload: str) -> None:
+        self.slots[slot_id] = payload
+
+    def delete(self, slot_id: str) -> bool:
+        return self.slots.pop(slot_id, None) is not None
+
+    def list_slots(self) -> List[str]:
+        return list(self.slots.keys())
+
+
+def create_storage(backend: str = "file", **options) -> SaveStorage:
+    """
+    Build a storage backend by name.
+
+    Args:
+        backend: One of "file", "sqlite" or "memory"
+        **options: Backend-specific arguments (directory, db_path, player_id)
+    """
+    if backend == "file":
+        return FileSaveStorage(options.get("directory", "saves"))
+    if backend == "sqlite":
+        return SQLiteSaveStorage(
+            options.get("db_path", os.path.join("saves", "saves.db")),
+            player_id=options.get("player_id", "default")
+        )
+    if backend == "memory":
+        return MemorySaveStorage()
+    raise ValueError(f"Unknown save storage backend: '{backend}'")
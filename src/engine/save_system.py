@@ -1,16 +1,174 @@
 import json
 import os
 import hashlib
+import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import List, Dict, Any, Optional
 
+from engine.save_storage import SaveStorage, FileSaveStorage
+from engine.save_migrations import CURRENT_VERSION as SAVE_FORMAT_VERSION
+
+
+class LogEvent:
+    """Compact record for a single logged event."""
+    __slots__ = ("seq", "timestamp", "type", "details")
+
+    def __init__(self, seq: int, timestamp: int, event_type: str, details: Dict[str, Any]):
+        self.seq = seq
+        self.timestamp = timestamp  # Unix epoch seconds
+        self.type = event_type
+        self.details = details
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Expand to the display form, formatting the timestamp on demand."""
+        return {
+            "timestamp": EventLog.format_timestamp(self.timestamp),
+            "type": self.type,
+            **self.details
+        }
+
+    def to_row(self) -> list:
+        """Compact serialized form: [timestamp, type, details]."""
+        return [self.timestamp, self.type, self.details]
+
 
 class EventLog:
-    """Manages a log of significant game events."""
-    
-    def __init__(self):
-        self.events: List[Dict[str, Any]] = []
-    
+    """
+    Manages a log of significant game events.
+
+    Events live in a fixed-size ring buffer so memory and save size stay
+    bounded over long sessions. A per-type index of sequence numbers keeps
+    filtered queries proportional to the number of matching events. When
+    an overflow_path is given, events evicted from the ring are appended to
+    that file (one JSON row per line) instead of being dropped.
+
+    When a journal_dir is given, events are written through a buffered
+    append-only NDJSON journal once the ring first overflows (short sessions
+    never touch disk). Saves then only record the journal position, and
+    exports stream from disk. A log restored from a save starts a fresh
+    journal that points back to its parent journal and offset, so branching
+    timelines never overwrite each other; chains longer than
+    MAX_JOURNAL_CHAIN are compacted into the new journal.
+    """
+
+    JOURNAL_BUFFER_SIZE = 64 * 1024
+    MAX_JOURNAL_CHAIN = 8
+
+    DEFAULT_CAPACITY = 500
+    TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, overflow_path: Optional[str] = None,
+                 journal_dir: Optional[str] = None, journal_parent: Optional[Dict[str, Any]] = None):
+        self.capacity = max(1, capacity)
+        self.overflow_path = overflow_path
+        self._ring: List[Optional[LogEvent]] = [None] * self.capacity
+        self._next_seq = 0
+        self._type_index: Dict[str, deque] = {}
+        self.overflow_count = 0
+
+        self.journal_dir = journal_dir
+        self.journal_parent = journal_parent
+        self.journal_path: Optional[str] = None
+        self._journal = None
+        # First sequence number not yet covered by the journal chain
+        self._journal_base = 0
+
+    def _open_journal(self):
+        """
+        Open this session's journal, creating it on first use. A new journal
+        starts with the events still only held in memory.
+        """
+        if self.journal_path:
+            # Reopened after close(): keep appending to the same file
+            self._journal = open(self.journal_path, 'ab', buffering=self.JOURNAL_BUFFER_SIZE)
+            return
+        if not os.path.exists(self.journal_dir):
+            os.makedirs(self.journal_dir)
+        session_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.urandom(3).hex()}"
+        self.journal_path = os.path.join(self.journal_dir, f"session_{session_id}.ndjson")
+        self._journal = open(self.journal_path, 'ab', buffering=self.JOURNAL_BUFFER_SIZE)
+
+        if self.journal_parent and self._chain_length(self.journal_parent) >= self.MAX_JOURNAL_CHAIN:
+            # Compact: copy the ancestors' events so the chain stays short
+            for row in self._read_journal_rows(self.journal_parent):
+                self._journal.write((json.dumps(row, ensure_ascii=False, default=str) + "\n").encode('utf-8'))
+            self.journal_parent = None
+        for record in self._unjournaled_records():
+            self._write_journal(record)
+
+    def _unjournaled_records(self) -> List[LogEvent]:
+        return [r for r in self.iter_records() if r.seq >= self._journal_base]
+
+    def flush(self) -> int:
+        """Flush buffered journal writes. Returns the journal byte offset."""
+        if self._journal:
+            self._journal.flush()
+            return self._journal.tell()
+        if self.journal_path and os.path.exists(self.journal_path):
+            return os.path.getsize(self.journal_path)
+        return 0
+
+    def close(self):
+        """Flush and close the journal. Later overflows reopen the same file."""
+        if self._journal:
+            self._journal.close()
+            self._journal = None
+
+    @staticmethod
+    def format_timestamp(timestamp: int) -> str:
+        """Format an epoch timestamp for display."""
+        return datetime.fromtimestamp(timestamp).strftime(EventLog.TIMESTAMP_FORMAT)
+
+    @staticmethod
+    def _parse_timestamp(value: Any) -> int:
+        """Accept epoch ints as well as legacy formatted timestamp strings."""
+        if isinstance(value, (int, float)):
+            return int(value)
+        try:
+            return int(datetime.strptime(value, EventLog.TIMESTAMP_FORMAT).timestamp())
+        except (TypeError, ValueError):
+            return 0
+
+    def __len__(self) -> int:
+        return min(self._next_seq, self.capacity)
+
+    @property
+    def _first_seq(self) -> int:
+        return max(0, self._next_seq - self.capacity)
+
+    def _append(self, timestamp: int, event_type: str, details: Dict[str, Any]) -> LogEvent:
+        seq = self._next_seq
+        slot = seq % self.capacity
+
+        evicted = self._ring[slot]
+        if evicted is not None:
+            if self.journal_dir and not self._journal:
+                # First overflow (or first since close): events start going to disk
+                self._open_journal()
+            # The evicted record is always the oldest of its type
+            self._type_index[evicted.type].popleft()
+            if not self._journal:
+                self._spill(evicted)
+
+        record = LogEvent(seq, timestamp, event_type, details)
+        self._ring[slot] = record
+        self._type_index.setdefault(event_type, deque()).append(seq)
+        self._next_seq += 1
+        return record
+
+    def _spill(self, record: LogEvent):
+        """Append an evicted record to the overflow segment, if configured."""
+        if not self.overflow_path:
+            return
+        try:
+            with open(self.overflow_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record.to_row(), ensure_ascii=False, default=str) + "\n")
+            self.overflow_count += 1
+        except OSError as e:
+            print(f"[WARNING] Could not write event log overflow: {e}")
+
     def add_event(self, event_type: str, **details):
         """
         Add an event to the log.
@@ -19,13 +177,30 @@ class EventLog:
             event_type: Type of event (e.g., "scene_entry", "skill_check", "combat", "theory")
             **details: Keyword arguments containing event-specific data
         """
-        event = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "type": event_type,
-            **details
-        }
-        self.events.append(event)
-    
+        record = self._append(int(time.time()), event_type, details)
+        if self._journal:
+            self._write_journal(record)
+
+    def _write_journal(self, record: LogEvent):
+        line = json.dumps(record.to_row(), ensure_ascii=False, default=str) + "\n"
+        self._journal.write(line.encode('utf-8'))
+
+    def iter_records(self, event_type: Optional[str] = None, limit: Optional[int] = None) -> List[LogEvent]:
+        """Return raw records (oldest first), optionally filtered by type and limited to the last N."""
+        if event_type:
+            seqs = self._type_index.get(event_type)
+            if not seqs:
+                return []
+            if limit:
+                seqs = list(islice(reversed(seqs), limit))[::-1]
+            return [self._ring[seq % self.capacity] for seq in seqs]
+
+        first = self._first_seq
+        if limit:
+            first = max(first, self._next_seq - limit)
+        records = (self._ring[seq % self.capacity] for seq in range(first, self._next_seq))
+        return [r for r in records if r is not None]
+
     def get_logs(self, event_type: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retrieve event logs, optionally filtered by type.
@@ -34,37 +209,154 @@ class EventLog:
             event_type: If provided, only return events of this type
             limit: If provided, only return the last N events
         """
-        filtered = self.events
-        
-        if event_type:
-            filtered = [e for e in filtered if e["type"] == event_type]
-        
-        if limit:
-            filtered = filtered[-limit:]
-        
-        return filtered
-    
+        return [r.to_dict() for r in self.iter_records(event_type, limit)]
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """All in-memory events in display form (oldest first)."""
+        return self.get_logs()
+
+    def iter_overflow(self):
+        """Yield display-form events previously spilled to the overflow segment."""
+        if not self.overflow_path or not os.path.exists(self.overflow_path):
+            return
+        with open(self.overflow_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                ts, event_type, details = json.loads(line)
+                yield LogEvent(-1, ts, event_type, details).to_dict()
+
+    @staticmethod
+    def _chain_length(journal: Optional[Dict[str, Any]]) -> int:
+        length = 0
+        while journal:
+            length += 1
+            journal = journal.get("parent")
+        return length
+
+    @staticmethod
+    def _read_journal_rows(journal: Dict[str, Any]):
+        """Yield [timestamp, type, details] rows from a journal chain, oldest first."""
+        chain = []
+        while journal:
+            chain.append(journal)
+            journal = journal.get("parent")
+
+        for link in reversed(chain):
+            path = link.get("path")
+            if not path or not os.path.exists(path):
+                print(f"[WARNING] Event journal '{path}' is missing; its events cannot be replayed.")
+                continue
+            remaining = link.get("offset")
+            with open(path, 'rb') as f:
+                for line in f:
+                    if remaining is not None:
+                        if remaining < len(line):
+                            break
+                        remaining -= len(line)
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+
+    def _journal_ref(self) -> Optional[Dict[str, Any]]:
+        """Reference to the current journal position (flushes pending writes)."""
+        if not self.journal_path:
+            return None
+        return {"path": self.journal_path, "offset": self.flush(), "parent": self.journal_parent}
+
+    def iter_journal(self):
+        """
+        Stream every event of the session in display form, oldest first.
+
+        Reads the journal chain from disk when journaling is enabled; otherwise
+        falls back to the overflow segment followed by the in-memory ring.
+        """
+        ref = self._journal_ref()
+        if ref or self.journal_parent:
+            for ts, event_type, details in self._read_journal_rows(ref or self.journal_parent):
+                yield LogEvent(-1, ts, event_type, details).to_dict()
+            if ref:
+                return
+            records = self._unjournaled_records()
+        else:
+            yield from self.iter_overflow()
+            records = self.iter_records()
+        for record in records:
+            yield record.to_dict()
+
     def to_dict(self) -> dict:
         """Serialize event log to dictionary."""
-        return {"events": self.events}
+        data = {
+            "capacity": self.capacity,
+            "total": self._next_seq,
+        }
+        journal = self._journal_ref()
+        if journal:
+            # Events live on disk; the save only needs the journal position
+            data["journal"] = journal
+        elif self.journal_parent:
+            # Restored from a journal but not overflowed since: parent plus the new tail
+            data["journal"] = self.journal_parent
+            data["rows"] = [r.to_row() for r in self._unjournaled_records()]
+        else:
+            data["rows"] = [r.to_row() for r in self.iter_records()]
+        return data
     
     @staticmethod
-    def from_dict(data: dict) -> 'EventLog':
-        """Deserialize event log from dictionary."""
-        log = EventLog()
-        log.events = data.get("events", [])
+    def from_dict(data: dict, overflow_path: Optional[str] = None,
+                  journal_dir: Optional[str] = None) -> 'EventLog':
+        """Deserialize event log from dictionary (journal, compact or legacy layout)."""
+        journal = data.get("journal")
+        # Journaling is switched on after the replay below
+        log = EventLog(
+            data.get("capacity", EventLog.DEFAULT_CAPACITY),
+            overflow_path,
+            journal_parent=journal if journal_dir else None
+        )
+
+        if journal:
+            # Only the tail that fits in the ring is kept in memory; rows saved
+            # alongside the journal reference were never written to it
+            tail = data.get("rows", [])
+            rows = deque(EventLog._read_journal_rows(journal), maxlen=log.capacity)
+            rows.extend(tail)
+            unjournaled = min(len(tail), len(rows))
+        elif "rows" in data:
+            rows = data["rows"]
+            unjournaled = len(rows)
+        else:
+            # Legacy layout: list of dicts with formatted timestamps
+            rows = []
+            for event in data.get("events", []):
+                details = {k: v for k, v in event.items() if k not in ("timestamp", "type")}
+                rows.append([event.get("timestamp"), event.get("type", "unknown"), details])
+            unjournaled = len(rows)
+
+        # Keep sequence numbers continuous with the original session
+        total = data.get("total", len(rows))
+        log._next_seq = max(0, total - len(rows))
+        for ts, event_type, details in rows:
+            log._append(EventLog._parse_timestamp(ts), event_type, details)
+
+        log.journal_dir = journal_dir
+        log._journal_base = max(0, log._next_seq - unjournaled)
         return log
 
 
 class SaveSystem:
     """Manages game save/load functionality with hash verification."""
     
-    def __init__(self, save_directory: str = "saves"):
+    def __init__(self, save_directory: str = "saves", storage: Optional[SaveStorage] = None):
+        """
+        Args:
+            save_directory: Directory for the default filesystem backend
+            storage: Optional storage backend (SQLite, in-memory, ...). When
+                     omitted, slots are stored as JSON files in save_directory.
+        """
         self.save_directory = save_directory
-        
-        # Create saves directory if it doesn't exist
-        if not os.path.exists(save_directory):
-            os.makedirs(save_directory)
+        self.storage = storage if storage is not None else FileSaveStorage(save_directory)
     
     def _validate_slot_id(self, slot_id: str) -> None:
         """Validate that the slot_id is safe to use as a filename."""
@@ -74,12 +366,8 @@ class SaveSystem:
         if not re.match(r'^[a-zA-Z0-9 _-]+$', slot_id):
             raise ValueError(f"Invalid save slot ID: '{slot_id}'. Only alphanumeric characters, spaces, underscores, and hyphens are allowed.")
 
-    def _get_save_path(self, slot_id: str) -> str:
-        """Get the full path for a save file."""
-        self._validate_slot_id(slot_id)
-        return os.path.join(self.save_directory, f"{slot_id}.json")
-    
-    def _calculate_hash(self, data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _calculate_hash(data: Dict[str, Any]) -> str:
         """Calculate SHA-256 hash of the save data (excluding the hash field itself)."""
         # Create a copy to avoid modifying the original
         data_to_hash = data.copy()
@@ -91,9 +379,20 @@ class SaveSystem:
         json_str = json.dumps(data_to_hash, sort_keys=True, ensure_ascii=False, default=str)
         return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
 
+    @staticmethod
+    def _default_serializer(obj):
+        """Helper to handle non-serializable objects (like Enum) when writing saves."""
+        if hasattr(obj, 'value'): # Enum
+            return obj.value
+        if hasattr(obj, 'to_dict'):
+            return obj.to_dict()
+        if isinstance(obj, set):
+            return list(obj)
+        raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
     def save_game(self, slot_id: str, state_data: Dict[str, Any]) -> bool:
         """
-        Save game state to a file with hash verification.
+        Save game state to the storage backend with hash verification.
         
         Args:
             slot_id: Unique identifier for this save slot
@@ -103,33 +402,23 @@ class SaveSystem:
             True if save was successful, False otherwise
         """
         try:
-            save_path = self._get_save_path(slot_id)
+            self._validate_slot_id(slot_id)
             
             # Add metadata
             save_data = {
                 "id": slot_id,
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "version": "1.1",
+                "version": SAVE_FORMAT_VERSION,
                 **state_data
             }
             
-            # Calculate and append hash
+            # Normalise to plain JSON types first so the stored hash matches
+            # what load_game will recompute from the written document.
+            save_data = json.loads(json.dumps(save_data, ensure_ascii=False, default=self._default_serializer))
             save_data["hash"] = self._calculate_hash(save_data)
 
-            # Write to file with pretty formatting
-            # Helper to handle non-serializable objects (like Enum)
-            def default_serializer(obj):
-                if hasattr(obj, 'value'): # Enum
-                    return obj.value
-                if hasattr(obj, 'to_dict'):
-                    return obj.to_dict()
-                if isinstance(obj, set):
-                    return list(obj)
-                raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
-
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False, default=default_serializer)
-                json.dump(save_data, f, indent=2, ensure_ascii=False, default=list)
+            payload = json.dumps(save_data, indent=2, ensure_ascii=False)
+            self.storage.write(slot_id, payload)
             
             print(f"[SAVE] Game saved to slot '{slot_id}'")
             return True
@@ -140,7 +429,7 @@ class SaveSystem:
     
     def load_game(self, slot_id: str) -> Optional[Dict[str, Any]]:
         """
-        Load game state from a file and verify integrity.
+        Load game state from the storage backend and verify integrity.
         
         Args:
             slot_id: Unique identifier for the save slot to load
@@ -149,14 +438,14 @@ class SaveSystem:
             Dictionary containing game state, or None if load failed
         """
         try:
-            save_path = self._get_save_path(slot_id)
+            self._validate_slot_id(slot_id)
             
-            if not os.path.exists(save_path):
+            payload = self.storage.read(slot_id)
+            if payload is None:
                 print(f"[ERROR] Save file '{slot_id}' not found")
                 return None
             
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = json.loads(payload)
             
             # Verify Hash if present
             stored_hash = save_data.get("hash")
@@ -185,31 +474,23 @@ class SaveSystem:
         """
         saves = []
         
-        if not os.path.exists(self.save_directory):
-            return saves
-        
-        for filename in os.listdir(self.save_directory):
-            if filename.endswith('.json'):
-                slot_id = filename[:-5]  # Remove .json extension
-                save_path = self._get_save_path(slot_id)
+        for slot_id in self.storage.list_slots():
+            try:
+                data = json.loads(self.storage.read(slot_id) or "{}")
                 
-                try:
-                    with open(save_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Extract expanded metadata
-                    saves.append({
-                        "slot_id": slot_id,
-                        "timestamp": data.get("timestamp", "Unknown"),
-                        "scene": data.get("scene", "Unknown"),
-                        "summary": data.get("summary", "No summary"),
-                        "datetime": data.get("datetime", "Unknown"),
-                        "sanity": data.get("character_state", {}).get("player_state", {}).get("sanity", "??"),
-                        "attention": data.get("additional_systems", {}).get("attention_system", {}).get("attention_level", "??"),
-                        "active_theories": data.get("board_state", {}).get("active_count", 0) # Assuming this is available or derived
-                    })
-                except Exception as e:
-                    print(f"[WARNING] Could not read save file '{filename}': {e}")
+                # Extract expanded metadata
+                saves.append({
+                    "slot_id": slot_id,
+                    "timestamp": data.get("timestamp", "Unknown"),
+                    "scene": data.get("scene", "Unknown"),
+                    "summary": data.get("summary", "No summary"),
+                    "datetime": data.get("datetime", "Unknown"),
+                    "sanity": data.get("character_state", {}).get("player_state", {}).get("sanity", "??"),
+                    "attention": data.get("additional_systems", {}).get("attention_system", {}).get("attention_level", "??"),
+                    "active_theories": data.get("board_state", {}).get("active_count", 0) # Assuming this is available or derived
+                })
+            except Exception as e:
+                print(f"[WARNING] Could not read save slot '{slot_id}': {e}")
         
         # Sort by timestamp (newest first)
         saves.sort(key=lambda x: x["timestamp"], reverse=True)
@@ -226,13 +507,12 @@ class SaveSystem:
             True if deletion was successful, False otherwise
         """
         try:
-            save_path = self._get_save_path(slot_id)
+            self._validate_slot_id(slot_id)
             
-            if not os.path.exists(save_path):
+            if not self.storage.delete(slot_id):
                 print(f"[ERROR] Save file '{slot_id}' not found")
                 return False
             
-            os.remove(save_path)
             print(f"[DELETE] Save '{slot_id}' deleted")
             return True
             
@@ -5,6 +5,7 @@ import random
 from typing import Optional
 
 from engine.branch_controller import BranchController
+from engine.object_index import SceneObjectIndex
 
 class SceneManager:
     def __init__(self, time_system, board, skill_system, player_state, flashback_manager, 
@@ -26,6 +27,9 @@ class SceneManager:
         
         self.branch_controller = BranchController()
 
+        # Per-scene object name indexes, built on first load of each scene
+        self.object_indexes = {}
+
     def load_scenes_from_directory(self, directory: str, root_scenes: Optional[str] = None):
         # Fallback to finding existing scenes.json in root if directory doesn't look populated
         if not root_scenes:
@@ -68,6 +72,7 @@ class SceneManager:
 
         self.current_scene_id = scene_id
         self.current_scene_data = scene
+        self.get_object_index(scene_id)
         
         # Flashback Handling (Phase 6)
         if scene.get("type") == "flashback":
@@ -96,6 +101,20 @@ class SceneManager:
 
         return self.current_scene_data
 
+    def get_object_index(self, scene_id=None) -> Optional[SceneObjectIndex]:
+        """Return the (cached) object name index for a scene, defaulting to the current one."""
+        scene_id = scene_id or self.current_scene_id
+        scene = self.scenes.get(scene_id)
+        if scene is None:
+            return None
+
+        objects = scene.get("objects")
+        index = self.object_indexes.get(scene_id)
+        if index is None or (objects is not None and index.objects is not objects):
+            index = SceneObjectIndex(objects or {})
+            self.object_indexes[scene_id] = index
+        return index
+
     def _apply_on_entry_effects(self, scene):
         effects = scene.get("effects")
         if effects:
@@ -248,13 +267,9 @@ class SceneManager:
         # Ideally, we should track which modifiers come from board to avoid wiping others.
         # But for now, we'll assume we overwrite/set them by key "Board Theory".
 
-        # Reset board-related modifiers on all skills
-        for skill in self.skill_system.skills.values():
-            skill.set_modifier("Board Theory", 0)
-
-        # Apply new
-        for skill_name, mod_value in modifiers.items():
-            skill = self.skill_system.get_skill(skill_name)
-            if skill:
-                skill.set_modifier("Board Theory", mod_value)
+        # Reset or apply board-related modifiers on all skills in one pass
+        for skill_name, skill in self.skill_system.skills.items():
+            mod_value = modifiers.get(skill_name, 0)
+            skill.set_modifier("Board Theory", mod_value)
+            if skill_name in modifiers:
                 print(f"[Board Effect] {skill_name} modifier: {mod_value}")
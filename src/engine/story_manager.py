@@ -1,6 +1,16 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Callable
 
+# (event id, day, hour it opens, handler); an event fires on its day once the hour is reached
+TIMELINE_EVENTS = (
+    # --- DAY 2 EVENTS --- 09:00 AM - Old Tom Disappears
+    ("day2_tom_missing", 2, 9, "_trigger_old_tom_missing"),
+    # --- DAY 3 EVENTS --- 22:00 PM - The Green Pulse
+    ("day3_green_pulse", 3, 22, "_trigger_green_pulse"),
+    # --- DAY 4 EVENTS --- 14:00 PM - The Circle
+    ("day4_birds_found", 4, 14, "_trigger_the_circle"),
+)
+
 class StoryManager:
     """
     Manages the narrative timeline and triggered events based on game time.
@@ -11,8 +21,9 @@ class StoryManager:
         self.player_state = player_state
         self.output = output_buffer
         
-        # Register listener
+        # Register listener and tick planner horizon
         self.time_system.add_listener(self.check_timeline_events)
+        self.time_system.add_horizon(self.minutes_until_next_event)
         
         self.triggered_events = set()
         
@@ -33,23 +44,26 @@ class StoryManager:
         day = current_data["days_passed"] + 1 # Day 1 is 0 days passed
         hour = current_data["datetime"].hour
         
-        # --- DAY 2 EVENTS ---
-        if day == 2:
-            # 09:00 AM - Old Tom Disappears
-            if hour >= 9 and "day2_tom_missing" not in self.triggered_events:
-                self._trigger_old_tom_missing()
-
-        # --- DAY 3 EVENTS ---
-        if day == 3:
-            # 22:00 PM - The Green Pulse
-            if hour >= 22 and "day3_green_pulse" not in self.triggered_events:
-                self._trigger_green_pulse()
+        for event_id, event_day, event_hour, handler in TIMELINE_EVENTS:
+            if day == event_day and hour >= event_hour and event_id not in self.triggered_events:
+                getattr(self, handler)()
 
-        # --- DAY 4 EVENTS ---
-        if day == 4:
-            # 14:00 PM - The Circle
-            if hour >= 14 and "day4_birds_found" not in self.triggered_events:
-                self._trigger_the_circle()
+    def minutes_until_next_event(self):
+        """
+        Tick planner horizon: game minutes until the next pending timeline
+        event opens, so a long wait stops on its day instead of skipping it.
+        """
+        now = self.time_system.current_time
+        upcoming = []
+        for event_id, event_day, event_hour, _ in TIMELINE_EVENTS:
+            if event_id in self.triggered_events:
+                continue
+            # Days count from the start time, not midnight (see get_date_data)
+            day_start = self.time_system.start_time + timedelta(days=event_day - 1)
+            opens_at = max(day_start, day_start.replace(hour=event_hour, minute=0, second=0, microsecond=0))
+            if opens_at > now:
+                upcoming.append((opens_at - now).total_seconds() / 60)
+        return min(upcoming) if upcoming else None
 
     def _trigger_old_tom_missing(self):
         """
@@ -20,6 +20,7 @@ except ImportError:
 from engine.distortion_rules import DistortionManager
 from engine.echo_manager import EchoManager
 from engine.skill_voice_manager import SkillVoiceManager
+from engine.lens_system import LensSystem
 
 
 class InsertPosition(Enum):
@@ -89,11 +90,17 @@ class TextComposer:
     4. Fracture layer: Rare reality glitches (triggered by attention/flags)
     """
 
-    def __init__(self, skill_system=None, board=None, game_state=None, hallucination_engine=None):
+    def __init__(self, skill_system=None, board=None, game_state=None, hallucination_engine=None,
+                 lens_system=None):
         self.skill_system = skill_system
         self.board = board
         self.game_state = game_state
         self.hallucination_engine = hallucination_engine
+        # The one lens service every consumer reads; Game injects its own so the
+        # composer, clues and the UI header always agree (and honour lock_lens).
+        if lens_system is None and skill_system is not None:
+            lens_system = LensSystem(skill_system, board)
+        self.lens_system = lens_system
         self.debug_mode = False
         self.developer_commentary = False
         self.distortion_manager = DistortionManager()
@@ -104,75 +111,17 @@ class TextComposer:
     
     def calculate_dominant_lens(self, player_state: dict = None) -> Archetype:
         """
-        Calculate the dominant lens based on player's skills and active theories.
+        The player's lens as an Archetype, from LensSystem.calculate_lens.
         Week 12: Dynamic lens selection.
         
         Returns:
-            Archetype based on dominant attribute and active theories
+            Archetype for the current lens (NEUTRAL without a lens system)
         """
-        if not self.skill_system or player_state is None:
+        if self.lens_system is None:
             return Archetype.NEUTRAL
-        
-        # Calculate dominant attribute scores
-        intuition_skills = ["Paranormal Sensitivity", "Instinct", "Subconscious", "Pattern Recognition"]
-        reason_skills = ["Logic", "Skepticism", "Forensics", "Research"]
-        presence_skills = ["Authority", "Interrogation", "Cool", "Composure"]
-        
-        intuition_total = sum(
-            self.skill_system.get_skill(s).effective_level 
-            for s in intuition_skills 
-            if self.skill_system.get_skill(s)
-        ) + (self.skill_system.attributes["INTUITION"].value * 2)
-
-        reason_total = sum(
-            self.skill_system.get_skill(s).effective_level 
-            for s in reason_skills 
-            if self.skill_system.get_skill(s)
-        ) + (self.skill_system.attributes["REASON"].value * 2)
-
-        presence_total = sum(
-            self.skill_system.get_skill(s).effective_level
-            for s in presence_skills
-            if self.skill_system.get_skill(s)
-        ) + (self.skill_system.attributes["PRESENCE"].value * 2)
-        
-        # Check active theories for lens override
-        if self.board:
-            active_theories = [t.id for t in self.board.theories.values() if t.status == "active"]
-            
-            # Believer theories
-            believer_theories = ["The Truth Is Out There", "The Nightmares Mean Something", "They're Watching Me"]
-            # Skeptic theories
-            skeptic_theories = ["Rational Explanation", "Mass Hysteria", "Government Coverup"]
-            # Haunted theories
-            haunted_theories = ["I've Been Here Before", "The Entity Knows Me"]
-            
-            believer_count = sum(1 for t in active_theories if t in believer_theories)
-            skeptic_count = sum(1 for t in active_theories if t in skeptic_theories)
-            haunted_count = sum(1 for t in haunted_theories if t in active_theories) # Corrected order
-            
-            # Theory override (theories are stronger than skills)
-            if haunted_count > 0:
-                return Archetype.HAUNTED
-            if believer_count > skeptic_count:
-                return Archetype.BELIEVER
-            if skeptic_count > believer_count:
-                return Archetype.SKEPTIC
-        
-        # Combined scores
-        scores = {
-            Archetype.BELIEVER: intuition_total,
-            Archetype.SKEPTIC: reason_total,
-            Archetype.HAUNTED: presence_total
-        }
-        
-        dominant = max(scores, key=scores.get)
-        max_val = scores[dominant]
-        other_vals = [v for k, v in scores.items() if k != dominant]
-
-        if max_val >= max(other_vals) + 3:
-            return dominant
-        else:
+        try:
+            return Archetype(self.lens_system.calculate_lens())
+        except ValueError:
             return Archetype.NEUTRAL
 
     def compose(self, text_data: dict, archetype: Archetype = Archetype.NEUTRAL,
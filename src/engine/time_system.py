@@ -1,5 +1,47 @@
+import heapq
+import math
 from datetime import datetime, timedelta
-from typing import List, Callable, Dict, Any
+from typing import List, Callable, Dict, Any, Optional, Tuple, Union
+
+
+# Upper bound on planner segments in one advance; the remainder is applied in one step
+MAX_SEGMENTS_PER_ADVANCE = 500
+
+
+class ScheduledEvent:
+    """Handle for a scheduled event; pass it (or its id) to TimeSystem.cancel."""
+
+    __slots__ = ("id", "time", "callback", "handler", "payload", "desc", "interval", "cancelled")
+
+    def __init__(self, event_id: int, when: datetime, callback, description: str,
+                 interval: Optional[int] = None, payload: Optional[Dict[str, Any]] = None):
+        self.id = event_id
+        self.time = when
+        # A string callback names a registered handler; only those are saved
+        self.handler = callback if isinstance(callback, str) else None
+        self.callback = None if isinstance(callback, str) else callback
+        self.payload = payload or {}
+        self.desc = description
+        self.interval = interval
+        self.cancelled = False
+
+    @property
+    def serializable(self) -> bool:
+        return self.handler is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "time": self.time.isoformat(),
+            "handler": self.handler,
+            "payload": self.payload,
+            "desc": self.desc,
+            "interval": self.interval
+        }
+
+    def __repr__(self):
+        return f"ScheduledEvent({self.id}, {self.time:%Y-%m-%d %H:%M}, {self.desc!r})"
+
 
 class TimeSystem:
     def __init__(self, start_date_str: str = "1995-10-14 08:00"):
@@ -9,9 +51,17 @@ class TimeSystem:
         
         # Listeners (callbacks that take minutes_passed as int)
         self.listeners: List[Callable[[int], None]] = []
+
+        # Tick planner horizons (see add_horizon)
+        self.horizons: List[Callable[[], Optional[float]]] = []
         
-        # Scheduled Events: List of dicts { 'time': datetime, 'callback': func, 'desc': str }
-        self.scheduled_events: List[Dict[str, Any]] = []
+        # Scheduled events: a heap of (time, id, ScheduledEvent); cancelled entries are skipped on pop
+        self._queue: List[Tuple[datetime, int, "ScheduledEvent"]] = []
+        self._events_by_id: Dict[int, "ScheduledEvent"] = {}
+        self._next_event_id = 1
+        self._dispatch_time: Optional[datetime] = None
+        # Named handlers for serializable events
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {}
         
         self.weather = "clear"
 
@@ -21,50 +71,165 @@ class TimeSystem:
     def add_listener(self, callback: Callable[[int], None]):
         self.listeners.append(callback)
 
+    def add_horizon(self, horizon: Callable[[], Optional[float]]):
+        """
+        Register a tick-planner horizon: a function returning the game minutes
+        until the next point where its system changes discretely (a theory
+        finishes internalizing, a stat crosses a threshold ...), or None.
+        """
+        self.horizons.append(horizon)
+
+    def plan_step(self, remaining: float) -> float:
+        """Minutes until the next change point, capped at `remaining`."""
+        step = remaining
+        if self._queue:
+            until_event = (self._queue[0][0] - self.current_time).total_seconds() / 60
+            if 0 < until_event < step:
+                step = until_event
+        for horizon in self.horizons:
+            minutes = horizon()
+            if minutes is not None and 0 < minutes < step:
+                step = minutes
+        # The game runs on whole minutes; a change inside a minute lands at its end
+        return min(remaining, max(1, math.ceil(step)))
+
     def advance_time(self, minutes: int):
-        """Advances time by X minutes, checking for triggers and notifying listeners."""
-        # We advance in chunks if necessary, but for now simple addition
-        old_time = self.current_time
-        self.current_time += timedelta(minutes=minutes)
-        
-        # Check triggers
-        self.check_triggers(old_time, self.current_time)
-        
-        # Notify listeners
-        for listener in self.listeners:
-            listener(minutes)
-
-    def schedule_event(self, delay_minutes: int, callback: Callable[[], None], description: str):
-        trigger_time = self.current_time + timedelta(minutes=delay_minutes)
-        self.scheduled_events.append({
-            "time": trigger_time,
-            "callback": callback,
-            "desc": description
-        })
-        # Sort by time so we process earliest first
-        self.scheduled_events.sort(key=lambda x: x["time"])
+        """
+        Advances time by X minutes, checking for triggers and notifying listeners.
+
+        Long advances are coalesced: the tick planner jumps straight from one
+        change point (scheduled event, horizon) to the next, and listeners get
+        one call per segment. Between change points every rate is constant,
+        so a single call with the segment length is exact, and short advances
+        with nothing pending are still a single segment.
+        """
+        remaining = minutes
+        segments = 0
+        while True:
+            segments += 1
+            if segments >= MAX_SEGMENTS_PER_ADVANCE:
+                step = remaining
+            else:
+                step = self.plan_step(remaining)
+
+            old_time = self.current_time
+            self.current_time += timedelta(minutes=step)
+
+            # Check triggers
+            self.check_triggers(old_time, self.current_time)
+
+            # Notify listeners
+            for listener in self.listeners:
+                listener(step)
+
+            remaining -= step
+            if remaining <= 0:
+                break
+
+    def register_handler(self, name: str, handler: Callable[[Dict[str, Any]], None]):
+        """
+        Register a named event handler. Events scheduled by handler name
+        (rather than with a bare callable) survive to_dict/from_dict; the
+        handler is looked up when the event fires and receives its payload.
+        """
+        self.handlers[name] = handler
+
+    def schedule_event(self, delay_minutes: int, callback: Union[Callable[[], None], str], description: str,
+                       interval: Optional[int] = None, payload: Optional[Dict[str, Any]] = None) -> "ScheduledEvent":
+        """
+        Schedule an event delay_minutes from now. O(log n).
+
+        callback is either a callable (called with no arguments, not saved)
+        or the name of a handler from register_handler (called with payload,
+        saved). interval makes the event recur every interval minutes until
+        cancelled. Returns a handle for cancel().
+
+        Inside an event callback the delay counts from that event's due time,
+        so chained events land where they would have with smaller time steps.
+        """
+        now = self._dispatch_time or self.current_time
+        return self.schedule_at(now + timedelta(minutes=delay_minutes),
+                                callback, description, interval, payload)
+
+    def schedule_at(self, when: datetime, callback: Union[Callable[[], None], str], description: str,
+                    interval: Optional[int] = None, payload: Optional[Dict[str, Any]] = None) -> "ScheduledEvent":
+        """Schedule an event at an absolute game time (see schedule_event)."""
+        if interval is not None and interval <= 0:
+            raise ValueError("Recurring events need a positive interval")
+        event = ScheduledEvent(self._next_event_id, when, callback, description, interval, payload)
+        self._next_event_id += 1
+        self._push(event)
+        return event
+
+    def cancel(self, event: Union["ScheduledEvent", int]) -> bool:
+        """Cancel a pending event by handle or id. Returns False if it was not pending."""
+        if not isinstance(event, ScheduledEvent):
+            event = self._events_by_id.get(event)
+        if event is None or event.cancelled or self._events_by_id.get(event.id) is not event:
+            return False
+        event.cancelled = True
+        del self._events_by_id[event.id]
+        # Cancelled entries are dropped lazily; compact once they dominate the heap
+        if len(self._queue) > 32 and len(self._events_by_id) < len(self._queue) // 2:
+            self._queue = [entry for entry in self._queue if not entry[2].cancelled]
+            heapq.heapify(self._queue)
+        return True
+
+    @property
+    def scheduled_events(self) -> List["ScheduledEvent"]:
+        """Pending events, earliest first."""
+        return sorted(self._events_by_id.values(), key=lambda e: (e.time, e.id))
+
+    def _push(self, event: "ScheduledEvent"):
+        self._events_by_id[event.id] = event
+        heapq.heappush(self._queue, (event.time, event.id, event))
 
     def check_triggers(self, previous_time: datetime, new_time: datetime):
-        # We need to process events that happened between previous_time and new_time
-        # Use a while loop to handle events that might trigger other events?
-        # For simplicity, just iterate copy of list
-        
-        remaining_events = []
-        fired_events = []
-        
-        for event in self.scheduled_events:
-            if event["time"] <= new_time:
-                fired_events.append(event)
+        """
+        Fire every pending event due at or before new_time, earliest first.
+
+        Events scheduled (or rescheduled) by a callback that fall inside the
+        same window fire during this call too. Recurring events are
+        re-queued before their callback runs, so a callback may cancel them.
+        """
+        queue = self._queue
+        while queue and queue[0][0] <= new_time:
+            due, _, event = heapq.heappop(queue)
+            if event.cancelled:
+                continue
+
+            if event.interval:
+                event.time += timedelta(minutes=event.interval)
+                heapq.heappush(queue, (event.time, event.id, event))
             else:
-                remaining_events.append(event)
-        
-        self.scheduled_events = remaining_events
-        
-        for event in fired_events:
+                del self._events_by_id[event.id]
+
             # You might want to print a debug log here
-            # print(f"[DEBUG] Event triggered: {event['desc']}")
-            if event["callback"]:
-                event["callback"]()
+            # print(f"[DEBUG] Event triggered: {event.desc}")
+            self._dispatch_time = due
+            try:
+                self._fire(event)
+            finally:
+                self._dispatch_time = None
+            queue = self._queue  # cancel() may have compacted the heap
+
+    def _fire(self, event: "ScheduledEvent"):
+        if event.handler is not None:
+            handler = self.handlers.get(event.handler)
+            if handler is None:
+                print(f"[TimeSystem] No handler registered for event '{event.desc}' ({event.handler})")
+                return
+            handler(event.payload)
+        elif event.callback:
+            event.callback()
+
+    def now(self) -> datetime:
+        """Game clock interface (see engine.game_clock): the current game time."""
+        return self.current_time
+
+    def get_total_minutes(self) -> int:
+        """Whole minutes of game time since the start of the game."""
+        return int((self.current_time - self.start_time).total_seconds() // 60)
 
     def get_time_string(self) -> str:
         # Format: "Oct 14, 08:00 AM" or similar
@@ -83,14 +248,32 @@ class TimeSystem:
         return {
             "current_time": self.current_time.strftime("%Y-%m-%d %H:%M"),
             "start_time": self.start_time.strftime("%Y-%m-%d %H:%M"),
-            "weather": self.weather
-            # Note: We don't serialize callbacks/listeners as they need to be re-registered
+            "weather": self.weather,
+            # Only events scheduled by handler name are saved; listeners, handlers
+            # and bare callbacks need to be re-registered
+            "scheduled_events": [e.to_dict() for e in self.scheduled_events if e.serializable],
+            "next_event_id": self._next_event_id
         }
-    
+
+    def load_state(self, data: dict):
+        """Restore clock and saved events in place, keeping listeners and handlers."""
+        self.start_time = datetime.strptime(data.get("start_time", "1995-10-14 08:00"), "%Y-%m-%d %H:%M")
+        self.current_time = datetime.strptime(data["current_time"], "%Y-%m-%d %H:%M")
+        self.weather = data.get("weather", "clear")
+
+        self._queue = []
+        self._events_by_id = {}
+        for entry in data.get("scheduled_events", []):
+            event = ScheduledEvent(
+                entry["id"], datetime.fromisoformat(entry["time"]), entry["handler"],
+                entry.get("desc", ""), entry.get("interval"), entry.get("payload")
+            )
+            self._push(event)
+        self._next_event_id = max([data.get("next_event_id", 1)] + [i + 1 for i in self._events_by_id])
+
     @staticmethod
     def from_dict(data: dict) -> 'TimeSystem':
         """Deserialize time system from dictionary."""
         system = TimeSystem(start_date_str=data.get("start_time", "1995-10-14 08:00"))
-        system.current_time = datetime.strptime(data["current_time"], "%Y-%m-%d %H:%M")
-        system.weather = data.get("weather", "clear")
+        system.load_state(data)
         return system
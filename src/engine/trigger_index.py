@@ -0,0 +1,117 @@
+"""
+Trigger Index
+
+Shared dependency index for condition-driven content (suppressed memories,
+fear events, timed triggers). Each entry is registered under the state keys
+its conditions read - location, scene, a flag, a theory, a sanity band, a
+time window - and is only re-evaluated when one of those keys changes.
+
+Keys are plain tuples such as ("flag", "saw_ghost") or ("below", "sanity", 20).
+What a key means is up to the owning system: it passes a probe function
+that maps (key, game_state) to a small comparable value. Every check probes
+each distinct key once (a lookup or a comparison), then re-runs only the
+predicates registered under keys whose value moved. Entries whose
+conditions cannot be keyed are registered under ALWAYS and run every check.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+
+# Dependency for conditions that must be evaluated on every check
+ALWAYS: Tuple[str] = ("always",)
+
+Probe = Callable[[Tuple, Any], Any]
+Predicate = Callable[[Any], bool]
+
+_UNSET = object()
+
+
+class TriggerIndex:
+    """
+    Tracks which registered entries currently have their conditions met.
+
+    update(state) returns the satisfied entry ids in registration order;
+    owners apply their own once-only / cooldown / chance rules on top.
+    """
+
+    def __init__(self, probe: Probe):
+        self._probe = probe
+        self._predicates: Dict[Hashable, Predicate] = {}
+        self._keys: Dict[Hashable, Tuple] = {}
+        self._order: Dict[Hashable, int] = {}
+        self._by_key: Dict[Tuple, Set[Hashable]] = {}
+        self._always: Set[Hashable] = set()
+        self._last: Dict[Tuple, Any] = {}
+        self._satisfied: Set[Hashable] = set()
+        self._pending: Set[Hashable] = set()
+        self._counter = 0
+        self.evaluations = 0  # Predicate calls, for profiling
+
+    def register(self, entry_id: Hashable, keys: Iterable[Tuple], predicate: Predicate):
+        """Register (or replace) an entry. It is evaluated on the next update."""
+        self.unregister(entry_id)
+        keys = tuple(dict.fromkeys(keys))
+        self._predicates[entry_id] = predicate
+        self._keys[entry_id] = keys
+        self._order[entry_id] = self._counter
+        self._counter += 1
+        for key in keys:
+            if key == ALWAYS:
+                self._always.add(entry_id)
+            else:
+                self._by_key.setdefault(key, set()).add(entry_id)
+        self._pending.add(entry_id)
+
+    def unregister(self, entry_id: Hashable):
+        """Drop an entry (e.g. a memory that has unlocked or a once-only trigger that fired)."""
+        if entry_id not in self._predicates:
+            return
+        for key in self._keys.pop(entry_id):
+            if key == ALWAYS:
+                continue
+            members = self._by_key.get(key)
+            if members is not None:
+                members.discard(entry_id)
+                if not members:
+                    del self._by_key[key]
+                    self._last.pop(key, None)
+        del self._predicates[entry_id]
+        del self._order[entry_id]
+        self._always.discard(entry_id)
+        self._satisfied.discard(entry_id)
+        self._pending.discard(entry_id)
+
+    def clear(self):
+        self.__init__(self._probe)
+
+    def invalidate(self):
+        """Forget every probed value so the next update re-evaluates everything."""
+        self._last.clear()
+        self._pending.update(self._predicates)
+
+    def update(self, state: Any) -> List[Hashable]:
+        """Re-evaluate entries whose keys changed; return satisfied ids in registration order."""
+        dirty = self._pending | self._always
+        self._pending = set()
+
+        for key, members in self._by_key.items():
+            value = self._probe(key, state)
+            last = self._last.get(key, _UNSET)
+            if last is _UNSET or last != value:
+                self._last[key] = value
+                dirty |= members
+
+        for entry_id in dirty:
+            self.evaluations += 1
+            if self._predicates[entry_id](state):
+                self._satisfied.add(entry_id)
+            else:
+                self._satisfied.discard(entry_id)
+
+        return sorted(self._satisfied, key=self._order.__getitem__)
+
+    def __contains__(self, entry_id: Hashable) -> bool:
+        return entry_id in self._predicates
+
+    def __len__(self) -> int:
+        return len(self._predicates)
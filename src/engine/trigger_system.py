@@ -1,10 +1,84 @@
 import json
 from datetime import datetime
 
+from engine.trigger_index import TriggerIndex, ALWAYS
+from engine.parser_memory import trigger_key
+
+# Condition keys trigger_dependencies() knows how to key; anything else is evaluated every check
+KEYED_CONDITIONS = {"time_after", "time_before", "location_flags", "player_flags",
+                    "has_theory", "sanity_below", "reality_below"}
+
+
+def is_parser_trigger(trigger):
+    """
+    Parser triggers carry a phrase ("keywords" list with optional "mode", or a
+    regex "pattern") and fire once the player has typed it; see ParserMemory.
+    """
+    return "keywords" in trigger or "pattern" in trigger
+
+
+def _parse_clock(value):
+    return datetime.strptime(value, "%H:%M").time()
+
+
+def trigger_dependencies(trigger):
+    """State keys a trigger's conditions read (see _probe)."""
+    conditions = trigger.get("conditions", {})
+    keys = []
+    if "location" in trigger:
+        keys.append(("location",))
+    if "time_after" in conditions:
+        keys.append(("time_after", _parse_clock(conditions["time_after"])))
+    if "time_before" in conditions:
+        keys.append(("time_before", _parse_clock(conditions["time_before"])))
+    if conditions.get("location_flags"):
+        keys.append(("location",))
+        keys += [("location_flag", flag) for flag in conditions["location_flags"]]
+    keys += [("flag", flag) for flag in conditions.get("player_flags", [])]
+    if "has_theory" in conditions:
+        keys.append(("theory", conditions["has_theory"]))
+    for stat in ("sanity", "reality"):
+        if f"{stat}_below" in conditions:
+            keys.append(("below", stat, conditions[f"{stat}_below"]))
+    if set(conditions) - KEYED_CONDITIONS:
+        keys.append(ALWAYS)
+    return keys
+
+
+def _probe(key, game_state):
+    kind = key[0]
+    if kind == "location":
+        return game_state.get("current_location")
+    if kind == "flag":
+        return key[1] in game_state.get("player_flags", set())
+    if kind == "location_flag":
+        cur_loc = game_state.get("current_location")
+        return game_state.get("location_states", {}).get(cur_loc, {}).get(key[1]) if cur_loc else None
+    if kind == "time_after":
+        return game_state.get("time").time() >= key[1]
+    if kind == "time_before":
+        return game_state.get("time").time() <= key[1]
+    if kind == "theory":
+        board = game_state.get("board")
+        theory = board.get_theory(key[1]) if board else None
+        return bool(theory and theory.status == "active")
+    if kind == "below":
+        return game_state.get(key[1], 100) < key[2]
+    raise KeyError(key)
+
+
 class TriggerManager:
     def __init__(self):
         self.triggers = []
         self.fired_triggers = set()
+        # Triggers are indexed by the state they read; rebuilt when self.triggers is replaced
+        self.index = TriggerIndex(_probe)
+        self._by_id = {}
+        self._indexed = None
+        # Parser triggers live in ParserMemory's phrase index instead
+        self._parser_triggers = []
+        self._parser_memory = None
+        self._parser_indexed = None
 
     def load_triggers(self, filepath):
         try:
@@ -15,20 +89,67 @@ class TriggerManager:
             print(f"Error loading triggers from {filepath}: {e}")
             return False
 
+    def _build_index(self):
+        self.index.clear()
+        self._by_id = {}
+        # Sort by priority descending; the index reports matches in registration order
+        for trigger in sorted(self.triggers, key=lambda x: x.get("priority", 0), reverse=True):
+            if trigger["id"] in self.fired_triggers and trigger.get("once_only", True):
+                continue
+            if is_parser_trigger(trigger):
+                continue
+            self._by_id[trigger["id"]] = trigger
+            self.index.register(
+                trigger["id"], trigger_dependencies(trigger),
+                lambda state, trigger=trigger: self.evaluate_conditions(trigger, state)
+            )
+        self._indexed = self.triggers
+
     def check_triggers(self, game_state):
+        if self._indexed is not self.triggers:
+            self._build_index()
+
         triggered = []
-        # Sort by priority descending
-        active_triggers = sorted(self.triggers, key=lambda x: x.get("priority", 0), reverse=True)
-        
-        for trigger in active_triggers:
-            if trigger["id"] in self.fired_triggers and trigger.get("once_only", True):
+        for trigger_id in self.index.update(game_state):
+            trigger = self._by_id[trigger_id]
+            triggered.append(trigger)
+            if trigger.get("once_only", True):
+                self.fired_triggers.add(trigger_id)
+                self.index.unregister(trigger_id)
+
+        return triggered
+
+    def check_parser_triggers(self, parser_memory, game_state):
+        """
+        Parser triggers whose phrase has been typed and whose other conditions
+        hold, highest priority first. Phrases are registered with
+        parser_memory once, so each check is a lookup per trigger.
+
+        once_only triggers fire the first check both hold; repeatable ones
+        fire each time their phrase becomes active again.
+        """
+        if self._parser_memory is not parser_memory or self._parser_indexed is not self.triggers:
+            self._parser_triggers = sorted(
+                (t for t in self.triggers if is_parser_trigger(t)),
+                key=lambda x: x.get("priority", 0), reverse=True
+            )
+            parser_memory.register_triggers(self._parser_triggers)
+            self._parser_memory = parser_memory
+            self._parser_indexed = self.triggers
+
+        newly_active = {trigger_key(t) for t in parser_memory.pop_activations()}
+        triggered = []
+        for trigger in parser_memory.check_trigger_phrases(self._parser_triggers):
+            once_only = trigger.get("once_only", True)
+            if once_only and trigger["id"] in self.fired_triggers:
                 continue
-                
-            if self.evaluate_conditions(trigger, game_state):
-                triggered.append(trigger)
-                if trigger.get("once_only", True):
-                    self.fired_triggers.add(trigger["id"])
-                    
+            if not once_only and trigger_key(trigger) not in newly_active:
+                continue
+            if not self.evaluate_conditions(trigger, game_state):
+                continue
+            triggered.append(trigger)
+            if once_only:
+                self.fired_triggers.add(trigger["id"])
         return triggered
 
     def evaluate_conditions(self, trigger, game_state):
@@ -96,3 +217,4 @@ class TriggerManager:
 
     def from_dict(self, data):
         self.fired_triggers = set(data.get("fired_triggers", []))
+        self._indexed = None
@@ -0,0 +1,13 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _temp_event_journal(tmp_path, monkeypatch):
+    """Games built by tests journal into a temp dir, never the working tree's saves/journal."""
+    game = sys.modules.get("game")
+    if game is not None:
+        load_config = game.load_config
+        monkeypatch.setattr(game, "load_config",
+                            lambda: dict(load_config(), event_journal_dir=str(tmp_path / "journal")))
@@ -0,0 +1,106 @@
+import os
+import random
+import sys
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+
+from engine.board import Board, Theory
+
+
+def _theory(t_id, **data):
+    base = {"name": t_id.title(), "category": "Test", "description": "", "internalize_time_hours": 1}
+    base.update(data)
+    return Theory(t_id, base)
+
+
+def _board():
+    board = Board()
+    board.theories = {
+        "a": _theory("a", effects={"Logic": 1, "Perception": 2}),
+        "b": _theory("b", effects={"Logic": -1}, conflicts_with=["c"], degradation_rate=50),
+        "c": _theory("c", effects={"Empathy": 3}, internalize_time_hours=2),
+        "d": _theory("d", status="locked", effects={"Logic": 1}),
+        "e": _theory("e", auto_locks=["d"]),
+    }
+    return board
+
+
+def _full_scan(board):
+    modifiers = {}
+    friction = 0
+    count = 0
+    for theory in board.theories.values():
+        if theory.status == "active":
+            for skill, val in theory.effects.items():
+                modifiers[skill] = modifiers.get(skill, 0) + val
+            friction += theory.friction_level
+        if theory.status in ("active", "internalizing"):
+            count += 1
+    return modifiers, friction, count
+
+
+def _aggregates(board):
+    return board.get_all_modifiers(), board.get_total_friction(), board.get_active_or_internalizing_count()
+
+
+def test_aggregates_follow_status_transitions():
+    board = _board()
+    assert _aggregates(board) == ({}, 0, 0)
+
+    board.start_internalizing("a")
+    board.start_internalizing("b")
+    assert _aggregates(board) == ({}, 0, 2)
+    assert [t.id for t in board.theories_with_status("internalizing")] == ["a", "b"]
+
+    assert board.on_time_passed(60) == ["Theory Internalized: 'A'", "Theory Internalized: 'B'"]
+    assert _aggregates(board) == ({"Logic": 0, "Perception": 2}, 0, 2)
+
+    board.start_internalizing("c", force=True)
+    board.on_time_passed(120)
+    assert _aggregates(board) == ({"Logic": 0, "Perception": 2, "Empathy": 3}, 20, 3)
+
+    # Collapse removes the theory's modifiers entirely
+    board.degrade_theory("b", "ev1")
+    board.degrade_theory("b", "ev2")
+    assert board.get_theory("b").status == "closed"
+    assert _aggregates(board) == ({"Logic": 1, "Perception": 2, "Empathy": 3}, 20, 2)
+
+    # Direct assignment from outside the board (abandoning, NG+ unlocks) is tracked too
+    board.get_theory("c").status = "available"
+    board.get_theory("a").friction_level = 5
+    assert _aggregates(board) == _full_scan(board) == ({"Logic": 1, "Perception": 2}, 5, 1)
+
+
+def test_aggregates_match_full_scan_under_random_play():
+    rng = random.Random(7)
+    board = _board()
+    ids = list(board.theories)
+    for _ in range(500):
+        t_id = rng.choice(ids)
+        action = rng.randrange(6)
+        if action == 0:
+            board.start_internalizing(t_id, force=rng.random() < 0.5)
+        elif action == 1:
+            board.on_time_passed(rng.choice([10, 30, 60]))
+        elif action == 2:
+            board.degrade_theory(t_id, f"ev{rng.random()}")
+        elif action == 3:
+            board.get_theory(t_id).status = rng.choice(["available", "locked", "active"])
+        elif action == 4:
+            board.get_theory(t_id).friction_level = rng.randrange(0, 60, 20)
+        else:
+            board.discover_theory(t_id)
+        assert _aggregates(board) == _full_scan(board)
+
+
+def test_aggregates_survive_save_and_load():
+    board = Board()
+    available = [t.id for t in board.theories_with_status("available")][:2]
+    for t_id in available:
+        board.start_internalizing(t_id)
+    board.on_time_passed(24 * 60)
+
+    restored = Board.from_dict(board.to_dict())
+    assert _aggregates(restored) == _aggregates(board) == _full_scan(restored)
@@ -0,0 +1,95 @@
+import os
+import sys
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+
+from engine.board import Board, Theory
+
+
+class StubInventory:
+    def __init__(self):
+        self.items = set()
+
+    def has_item(self, item_id):
+        return item_id in self.items
+
+
+class StubSkills:
+    def __init__(self):
+        self.totals = {}
+
+    def get_skill_total(self, name):
+        return self.totals.get(name, 0)
+
+
+def _theory(t_id, status="locked", **requirements):
+    return Theory(t_id, {"name": t_id, "category": "Test", "description": "",
+                         "status": status, "requirements": requirements})
+
+
+def _setup():
+    board = Board()
+    board.theories = {
+        "grave": _theory("grave", flags_required=["found_grave"]),
+        "cult": _theory("cult", clues_required=["sigil"], scenes_visited=["chapel"]),
+        "entity": _theory("entity", min_skill={"Paranormal Sensitivity": 3}),
+        "deeper": _theory("deeper", theories_active=["grave"]),
+        "open": _theory("open", status="available", flags_required=["found_grave"]),
+    }
+    state = {
+        "player_flags": set(),
+        "visited_scenes": set(),
+        "inventory_system": StubInventory(),
+        "skill_system": StubSkills(),
+        "board": board,
+    }
+    return board, state
+
+
+def _full_scan(board, state):
+    return [t_id for t_id in board.theories if board.can_discover_theory(t_id, state)]
+
+
+def test_only_dependent_theories_are_rechecked():
+    board, state = _setup()
+    index = board.discovery_index
+    assert len(index) == 4  # Only locked theories are indexed
+
+    assert board.discoverable_theories(state) == []
+    evaluations = index.evaluations
+
+    state["player_flags"].add("found_grave")
+    assert board.discoverable_theories(state) == ["grave"] == _full_scan(board, state)
+    assert index.evaluations == evaluations + 1
+
+    # Unrelated state changes re-check nothing
+    state["player_flags"].add("ate_pie")
+    state["visited_scenes"].add("diner")
+    evaluations = index.evaluations
+    assert board.discoverable_theories(state) == ["grave"]
+    assert index.evaluations == evaluations
+
+    state["inventory_system"].items.add("sigil")
+    assert board.discoverable_theories(state) == ["grave"]
+    state["visited_scenes"].add("chapel")
+    state["skill_system"].totals["Paranormal Sensitivity"] = 3
+    assert board.discoverable_theories(state) == ["grave", "cult", "entity"] == _full_scan(board, state)
+
+
+def test_discovered_theories_leave_the_index():
+    board, state = _setup()
+    state["player_flags"].add("found_grave")
+    for t_id in board.discoverable_theories(state):
+        board.get_theory(t_id).status = "available"
+    assert "grave" not in board.discovery_index
+    assert board.discoverable_theories(state) == []
+
+    # Dependent theory unlocks once its prerequisite is internalized
+    board.get_theory("grave").status = "active"
+    assert board.discoverable_theories(state) == ["deeper"]
+
+    # Re-locking puts a theory back in the index
+    board.get_theory("grave").status = "locked"
+    assert board.discoverable_theories(state) == ["grave"]
@@ -0,0 +1,88 @@
+import os
+import sys
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+
+from engine.board import Board, Theory
+
+
+def _board():
+    board = Board()
+    board.theories = {
+        t_id: Theory(t_id, {"name": t_id.title(), "category": "Test", "description": "",
+                            "lens_bias": bias, "degradation_rate": 30})
+        for t_id, bias in (("ghosts", "believer"), ("cover_up", "skeptic"), ("hidden", "neutral"))
+    }
+    board.get_theory("ghosts").status = "active"
+    board.get_theory("cover_up").status = "internalizing"
+    return board
+
+
+def test_graph_nodes_and_links():
+    board = _board()
+    board.add_evidence_to_theory("ghosts", "cold_spot")
+    board.add_evidence_to_theory("cover_up", "cold_spot")
+    board.add_evidence_to_theory("cover_up", "memo")
+
+    data = board.get_board_data()
+    assert [n["id"] for n in data["nodes"]] == ["ghosts", "cold_spot", "cover_up", "memo"]
+    assert [(l["source"], l["target"]) for l in data["links"]] == [
+        ("cold_spot", "ghosts"), ("cold_spot", "cover_up"), ("memo", "cover_up")]
+    assert not any(n["is_glitched"] for n in data["nodes"])
+
+
+def test_version_only_moves_when_the_graph_changes():
+    board = _board()
+    first = board.get_board_data("skeptic", 5)
+    assert board.get_board_data("skeptic", 5) is first
+
+    # Changes to theories that are not on the graph are invisible
+    board.get_theory("hidden").health = 10
+    assert board.get_board_data("skeptic", 5)["version"] == first["version"]
+
+    # Archetype view changes, and changes to visible theories, bump the version
+    second = board.get_board_data("believer", 5)
+    assert second["version"] > first["version"]
+    board.degrade_theory("ghosts", "ev")
+    third = board.get_board_data("believer", 5)
+    assert third["version"] > second["version"]
+    assert third["nodes"][0]["health"] == 70
+
+    # Board methods mark the theory dirty themselves
+    board.add_evidence_to_theory("ghosts", "footprint")
+    board.add_contradiction_to_theory("cover_up", "alibi")
+    assert {"ghosts", "cover_up"} <= board._graph_dirty
+    fourth = board.get_board_data("believer", 5)
+    assert fourth["version"] > third["version"]
+    assert {"footprint", "alibi"} <= {n["id"] for n in fourth["nodes"]}
+
+    # In-place appends from outside callers are picked up too
+    board.get_theory("ghosts").linked_evidence.append("photo")
+    assert "photo" in [n["id"] for n in board.get_board_data("believer", 5)["nodes"]]
+
+
+def test_glitches_are_applied_per_view():
+    board = _board()
+    board.add_evidence_to_theory("ghosts", "cold_spot")
+    board.degrade_theory("ghosts", "ev1")
+    board.degrade_theory("ghosts", "ev2")  # 40% health
+
+    skeptic = board.get_board_data("Skeptic", 5)
+    ghost = skeptic["nodes"][0]
+    assert ghost["is_glitched"] and "[LOGICAL ERROR]" in ghost["label"]
+    assert skeptic["links"][0]["has_friction"] and skeptic["links"][0]["color"] == "#ff0000"
+
+    believer = board.get_board_data("believer", -20)
+    assert believer["nodes"][0]["label"] == "Ghosts"
+    assert believer["nodes"][1]["label"] == "[TRIVIAL MATTER]"
+    assert not believer["links"][0]["has_friction"]
+
+    # Collapsing the theory recolours it and its links
+    board.degrade_theory("ghosts", "ev3")
+    board.degrade_theory("ghosts", "ev4")
+    collapsed = board.get_board_data("believer", -20)
+    assert collapsed["nodes"][0]["status"] == "closed"
+    assert collapsed["nodes"][0]["color"] == "#ff00ff"
+    assert collapsed["links"][0]["color"] == "#ff0000"
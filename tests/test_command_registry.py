@@ -0,0 +1,105 @@
+import pytest
+import sys
+import os
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from engine.command_registry import (
+    CommandRegistry, COST_TRIVIAL, COST_HEAVY, ARGS_REQUIRED, ARGS_OPTIONAL
+)
+from engine.save_storage import MemorySaveStorage
+from game import Game
+
+
+def _handler(name):
+    return lambda args, raw: (name, args)
+
+
+@pytest.fixture
+def registry():
+    reg = CommandRegistry()
+    reg.register("board", _handler("board"), ["b"], cost=COST_TRIVIAL, mutates=False)
+    reg.register("save", _handler("save_menu"), cost=COST_HEAVY)
+    reg.register("save_slot", _handler("save_slot"), ["save"], args=ARGS_REQUIRED, cost=COST_HEAVY)
+    reg.register("wait", _handler("wait"), args=ARGS_OPTIONAL)
+    reg.register("goto", _handler("goto"), args=ARGS_OPTIONAL, debug=True)
+    return reg
+
+
+def test_aliases_resolve_to_the_same_spec(registry):
+    spec, args = registry.resolve("B")
+    assert spec.name == "board"
+    assert args == ""
+    assert registry.resolve("board")[0] is spec
+
+
+def test_bare_and_argument_forms_route_separately(registry):
+    assert registry.resolve("save")[0].name == "save"
+    spec, args = registry.resolve("save  Slot1 ")
+    assert spec.name == "save_slot"
+    assert args == "slot1"
+
+
+def test_optional_arguments(registry):
+    assert registry.resolve("wait")[0].name == "wait"
+    assert registry.resolve("wait 30")[1] == "30"
+
+
+def test_unknown_and_extra_arguments_fall_through(registry):
+    assert registry.resolve("look at desk") == (None, "")
+    # Bare-only commands do not swallow trailing words
+    assert registry.resolve("board game") == (None, "")
+    assert registry.resolve("   ") == (None, "")
+
+
+def test_debug_commands_hidden_unless_enabled(registry):
+    assert registry.resolve("goto diner")[0] is None
+    spec, args = registry.resolve("goto diner", debug_enabled=True)
+    assert spec.name == "goto"
+    assert args == "diner"
+
+
+def test_read_only_metadata(registry):
+    assert registry.is_read_only("b")
+    assert not registry.is_read_only("wait")
+    assert not registry.is_read_only("missing")
+    assert registry.get("save_slot").cost == COST_HEAVY
+
+
+def test_read_only_commands_skip_passive_mechanics():
+    game = Game(save_storage=MemorySaveStorage())
+    game.start_game()
+    calls = []
+    run = game.run_passive_mechanics
+    game.run_passive_mechanics = lambda: calls.append(1) or run()
+
+    game.step_many(["help", "inventory", "help"])
+    assert len(calls) == 1  # Nothing has run since the game started
+    game.step("map")
+    assert len(calls) == 1
+
+    # Examining rolls passive skill checks, so it counts as a state change
+    assert not game.verb_handlers.is_read_only("EXAMINE")
+    game.step({"verb": "EXAMINE", "target": "window"})
+    game.step("wait 10")
+    assert len(calls) == 3
+
+
+def test_duplicate_words_rejected(registry):
+    with pytest.raises(ValueError):
+        registry.register("bulletin", _handler("x"), ["b"])
+
+
+def test_decorator_registration():
+    reg = CommandRegistry()
+
+    @reg.command("MAP", ["CHART"], cost=COST_TRIVIAL, mutates=False)
+    def show_map(target, objects):
+        return "map"
+
+    assert "chart" in reg
+    assert reg.get("CHART").handler(None, {}) == "map"
+    assert len(reg) == 1
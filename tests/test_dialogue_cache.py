@@ -0,0 +1,129 @@
+import json
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+
+from content.dialogue_graph import DialogueCache, DialogueGraph, compile_requirements, evaluate_requirements
+from content.dialogue_manager import DialogueManager
+from engine.mechanics import SkillSystem
+from engine.board import Board
+
+
+TREE = {
+    "npc_id": "maude",
+    "start_node": "start",
+    "nodes": [
+        {"id": "start", "text": {"base": "Hello."},
+         "passive_checks": [{"skill": "Logic", "dc": 7, "interjection": "She is lying."}],
+         "choices": [
+             {"text": "Leave", "next": "EXIT_DIALOGUE"},
+             {"text": "Press", "next": "press", "skill_gate": {"skill": "Authority", "level": 3}},
+             {"text": "Theory", "next": "press", "theory_req": "cover_up"}
+         ]},
+        {"id": "press", "text": "Fine.", "choices": []}
+    ]
+}
+
+
+def _write(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+class StubBoard(Board):
+    def __init__(self, active=False):
+        super().__init__()
+        self.theories = {}
+        self.active = active
+
+    def is_theory_active(self, tid):
+        return self.active
+
+
+def _manager(cache, level=1, theory_active=False):
+    skill_system = SkillSystem()
+    for attr in skill_system.attributes.values():
+        attr.value = 6
+    skill_system.get_skill("Authority").base_level = level
+    # Keep passive output deterministic
+    skill_system.check_passive_interrupts = MagicMock(return_value=[])
+    skill_system.roll_check = MagicMock(return_value={"success": True})
+    return DialogueManager(skill_system, StubBoard(theory_active), {"sanity": 100}, dialogue_cache=cache)
+
+
+def test_graph_is_loaded_once_and_shared(tmp_path):
+    _write(tmp_path / "maude.json", TREE)
+    cache = DialogueCache(stat_interval=None)
+
+    first = _manager(cache)
+    second = _manager(cache)
+    assert first.load_dialogue("maude", str(tmp_path))
+    assert second.load_dialogue("maude", str(tmp_path))
+
+    assert first.graph is second.graph
+    assert cache.misses == 1 and cache.hits == 1
+    assert first.current_npc_id == "maude"
+    assert first.active_interjections == ["She is lying."]
+
+
+def test_edited_file_is_reloaded(tmp_path):
+    path = tmp_path / "maude.json"
+    _write(path, TREE)
+    cache = DialogueCache(stat_interval=0)
+    graph = cache.get("maude", str(tmp_path))
+
+    edited = dict(TREE, start_node="press")
+    _write(path, edited)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, graph.mtime + 1_000_000))
+
+    reloaded = cache.get("maude", str(tmp_path))
+    assert reloaded is not graph
+    assert reloaded.start_node == "press"
+
+
+def test_missing_and_malformed_files(tmp_path):
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+    _write(tmp_path / "empty.json", {"nodes": []})
+    cache = DialogueCache()
+    dm = _manager(cache)
+
+    assert dm.load_dialogue("nope", str(tmp_path)) is False
+    assert dm.load_dialogue("broken", str(tmp_path)) is False
+    assert dm.load_dialogue("empty", str(tmp_path)) is False
+    assert cache.warmup(["nope", "broken", "empty"], str(tmp_path)) == 0
+
+
+def test_compiled_requirements_match_live_checks(tmp_path):
+    _write(tmp_path / "maude.json", TREE)
+    cache = DialogueCache()
+
+    for level, active in ((1, False), (5, False), (5, True)):
+        dm = _manager(cache, level=level, theory_active=active)
+        dm.load_dialogue("maude", str(tmp_path))
+        rendered = dm.get_render_data()["choices"]
+        for choice in rendered:
+            assert (choice["enabled"], choice["reason"]) == dm._check_requirements(choice["original_data"])
+
+    dm = _manager(cache, level=1)
+    dm.load_dialogue("maude", str(tmp_path))
+    assert dm.select_choice(1) == (False, "Requirement not met.")
+
+
+def test_ungated_choice_compiles_to_nothing():
+    assert compile_requirements({"text": "Leave"}) == ()
+    assert evaluate_requirements((), None) == (True, "")
+
+
+def test_graph_validation():
+    with pytest.raises(ValueError):
+        DialogueGraph("bad", {"nodes": [{"text": "no id"}]})
+    graph = DialogueGraph("ok", {"lines": [{"id": "a", "choices": [{"next": "b"}]}, {"id": "b"}]})
+    assert graph.start_node == "a"
+    assert graph.edges("a") == ["b"]
@@ -0,0 +1,54 @@
+import os
+import random
+import sys
+
+# Ensure src and tools are in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tools')))
+
+from content.dialogue_graph import DialogueGraph
+from dialogue_coverage import describe_gates, simulate_reach
+
+
+def _graph(choices):
+    return DialogueGraph("test", {"nodes": [
+        {"id": "start", "choices": choices},
+        {"id": "a", "text": "A"},
+        {"id": "b", "text": "B"},
+    ]})
+
+
+def test_describe_gates_follows_compiled_requirements():
+    choice = {
+        "next": "a",
+        "emotional_flag_required": "trusting",
+        "theory_blocked": "cover_up",
+        "skill_gate": {"skill": "Logic", "level": 3},
+        "relationship_gate": {"trust_min": 40},
+        "require_theory": "insider",
+    }
+    assert describe_gates(choice) == [
+        ("skill", "Logic", 3),
+        ("theory", "insider"),
+        ("theory_blocked", "cover_up"),
+        ("relationship", "current"),
+        ("flag", "trusting"),
+    ]
+    assert describe_gates({"next": "a"}) == []
+
+
+def test_theory_requirement_and_block_share_one_sample():
+    # Exactly one of the two choices is open in any consistent state
+    graph = _graph([
+        {"next": "a", "theory_req": "insider"},
+        {"next": "b", "theory_blocked": "insider"},
+    ])
+    reach = simulate_reach(graph, 2000, random.Random(3), gate_odds=0.3)
+    assert reach["start"] == 1.0
+    assert reach["a"] + reach["b"] == 1.0
+    assert 0.25 < reach["a"] < 0.35
+
+
+def test_contradictory_gates_never_open():
+    graph = _graph([{"next": "a", "theory_req": "insider", "theory_blocked": "insider"}])
+    assert simulate_reach(graph, 500, random.Random(0))["a"] == 0.0
@@ -0,0 +1,158 @@
+import json
+import sys
+import os
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from engine.save_system import EventLog
+
+
+def test_ring_buffer_is_bounded():
+    log = EventLog(capacity=5)
+    for i in range(12):
+        log.add_event("tick", n=i)
+
+    assert len(log) == 5
+    assert [e["n"] for e in log.get_logs()] == [7, 8, 9, 10, 11]
+    assert len(log.to_dict()["rows"]) == 5
+
+
+def test_type_index_tracks_evictions():
+    log = EventLog(capacity=4)
+    log.add_event("scene_entry", scene_id="a")
+    log.add_event("skill_check", skill="Logic")
+    log.add_event("skill_check", skill="Perception")
+    log.add_event("scene_entry", scene_id="b")
+    log.add_event("skill_check", skill="Empathy")  # evicts scene "a"
+
+    assert [e["scene_id"] for e in log.get_logs(event_type="scene_entry")] == ["b"]
+    assert [e["skill"] for e in log.get_logs(event_type="skill_check", limit=2)] == ["Perception", "Empathy"]
+    assert log.get_logs(event_type="combat") == []
+
+
+def test_timestamps_formatted_on_display():
+    log = EventLog()
+    log.add_event("theory", action="start")
+    record = log.iter_records()[0]
+
+    assert isinstance(record.timestamp, int)
+    assert log.get_logs()[0]["timestamp"] == EventLog.format_timestamp(record.timestamp)
+
+
+def test_round_trip_and_legacy_layout():
+    log = EventLog(capacity=3)
+    for i in range(5):
+        log.add_event("tick", n=i)
+    restored = EventLog.from_dict(log.to_dict())
+    assert [e["n"] for e in restored.events] == [2, 3, 4]
+
+    legacy = {"events": [{"timestamp": "2024-01-01 10:00:00", "type": "scene_entry", "scene_id": "diner"}]}
+    restored = EventLog.from_dict(legacy)
+    assert restored.events[0]["scene_id"] == "diner"
+    assert restored.events[0]["timestamp"] == "2024-01-01 10:00:00"
+
+
+def test_overflow_segment_keeps_evicted_events(tmp_path):
+    overflow = str(tmp_path / "overflow.ndjson")
+    log = EventLog(capacity=2, overflow_path=overflow)
+    for i in range(5):
+        log.add_event("tick", n=i)
+
+    assert [e["n"] for e in log.iter_overflow()] == [0, 1, 2]
+    assert [e["n"] for e in log.events] == [3, 4]
+
+
+def test_journal_save_stores_only_offset(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    log = EventLog(capacity=3, journal_dir=journal_dir)
+    for i in range(10):
+        log.add_event("tick", n=i)
+
+    data = log.to_dict()
+    assert "rows" not in data
+    assert data["journal"]["offset"] == os.path.getsize(log.journal_path)
+
+    # Full session streams from disk even though only 3 events are in memory
+    assert [e["n"] for e in log.iter_journal()] == list(range(10))
+    log.close()
+
+
+def test_restored_log_branches_from_journal_offset(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    log = EventLog(capacity=3, journal_dir=journal_dir)
+    for i in range(5):
+        log.add_event("tick", n=i)
+    saved = log.to_dict()
+
+    # Events after the save belong to an abandoned timeline
+    log.add_event("tick", n=99)
+    log.close()
+
+    restored = EventLog.from_dict(saved, journal_dir=journal_dir)
+    assert [e["n"] for e in restored.events] == [2, 3, 4]
+
+    restored.add_event("tick", n=5)
+    assert [e["n"] for e in restored.iter_journal()] == [0, 1, 2, 3, 4, 5]
+    assert restored.journal_path != log.journal_path
+    restored.close()
+
+
+def test_journal_opens_on_first_overflow(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    log = EventLog(capacity=3, journal_dir=journal_dir)
+    for i in range(3):
+        log.add_event("tick", n=i)
+    assert log.journal_path is None
+    assert not os.path.exists(journal_dir)
+    assert "rows" in log.to_dict()
+
+    log.add_event("tick", n=3)
+    assert os.listdir(journal_dir) == [os.path.basename(log.journal_path)]
+
+    # Closing is safe mid-session; the next overflow appends to the same file
+    log.close()
+    log.add_event("tick", n=4)
+    assert [e["n"] for e in log.iter_journal()] == list(range(5))
+    log.close()
+    assert os.listdir(journal_dir) == [os.path.basename(log.journal_path)]
+
+
+def test_resaving_a_restored_log_keeps_parent_chain(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    log = EventLog(capacity=3, journal_dir=journal_dir)
+    for i in range(5):
+        log.add_event("tick", n=i)
+    log.close()
+
+    # Load then save straight away: no new journal file
+    restored = EventLog.from_dict(log.to_dict(), journal_dir=journal_dir)
+    saved = restored.to_dict()
+    assert restored.journal_path is None
+    assert saved["journal"]["path"] == log.journal_path and saved["rows"] == []
+
+    again = EventLog.from_dict(saved, journal_dir=journal_dir)
+    assert [e["n"] for e in again.iter_journal()] == list(range(5))
+    again.add_event("tick", n=5)
+    assert [e["n"] for e in again.iter_journal()] == list(range(6))
+    again.close()
+    assert len(os.listdir(journal_dir)) == 2
+
+
+def test_long_journal_chains_are_read_iteratively_and_compacted(tmp_path):
+    journal_dir = tmp_path / "journal"
+    journal_dir.mkdir()
+    segment = journal_dir / "segment.ndjson"
+    segment.write_text(json.dumps([0, "tick", {"n": 0}]) + "\n", encoding="utf-8")
+
+    chain = None
+    for _ in range(5000):
+        chain = {"path": str(segment), "offset": None, "parent": chain}
+    assert sum(1 for _ in EventLog._read_journal_rows(chain)) == 5000
+
+    log = EventLog.from_dict({"capacity": 2, "total": 5000, "journal": chain}, journal_dir=str(journal_dir))
+    for _ in range(3):
+        log.add_event("tick", n=1)
+    assert log.journal_parent is None
+    assert sum(1 for _ in log.iter_journal()) == 5003
+    log.close()
@@ -0,0 +1,72 @@
+import os
+import sys
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+
+from engine.game_clock import ManualClock
+from engine.fear_system import FearManager, FearEvent
+from engine.time_system import TimeSystem
+from engine.fracture_system import FractureSystem
+from engine.journal_system import JournalManager
+
+
+def _manager(clock):
+    fm = FearManager(clock=clock)
+    fm.fear_events["dread"] = FearEvent({
+        "id": "dread", "cooldown_minutes": 30,
+        "trigger_conditions": {"sanity_below": 60}
+    })
+    return fm
+
+
+def test_cooldown_runs_on_game_time():
+    clock = ManualClock()
+    fm = _manager(clock)
+    state = {"sanity": 40}
+
+    assert len(fm.check_fear_triggers(state)) == 1
+    clock.advance(29)
+    assert fm.check_fear_triggers(state) == []
+    clock.advance(1)
+    assert len(fm.check_fear_triggers(state)) == 1
+
+
+def test_time_system_is_a_clock_for_bulk_simulation():
+    ts = TimeSystem()
+    fm = _manager(ts)
+    fired = []
+    ts.add_listener(lambda minutes: fired.extend(fm.check_fear_triggers({"sanity": 40})))
+
+    # A week of game time in 10 minute turns: one trigger per 30 minute cooldown
+    for _ in range(7 * 24 * 6):
+        ts.advance_time(10)
+    assert len(fired) == 7 * 24 * 2
+
+    status = fm.get_event_status("dread")
+    assert status["minutes_since_trigger"] == 20
+
+
+def test_cooldowns_survive_save_and_load():
+    clock = ManualClock()
+    fm = _manager(clock)
+    fm.check_fear_triggers({"sanity": 40})
+    data = fm.to_dict()
+
+    restored = _manager(clock)
+    restored.restore_state(data)
+    clock.advance(10)
+    assert restored.check_fear_triggers({"sanity": 40}) == []
+    assert restored.get_event_status("dread")["can_trigger_again_in"] == 20
+
+
+def test_timestamps_use_the_injected_clock():
+    clock = ManualClock()
+    journal = JournalManager(clock=clock)
+    journal.add_entry("Arrival", "The bus leaves.")
+    assert journal.entries[0].timestamp == "1995-10-14T08:00:00"
+
+    fractures = FractureSystem(clock=clock)
+    effect = next(iter(fractures.fracture_effects.values()))
+    assert fractures.trigger_fracture(effect).timestamp == clock.now()
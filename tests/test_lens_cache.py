@@ -0,0 +1,125 @@
+import os
+import random
+import sys
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mechanics import SkillSystem
+from engine.board import Board, Theory
+from engine.lens_system import LensSystem
+from engine.text_composer import TextComposer, Archetype
+from engine.save_storage import MemorySaveStorage
+from game import Game
+
+
+def _setup():
+    skills = SkillSystem()
+    board = Board()
+    board.theories = {
+        "i_want_to_believe": Theory("i_want_to_believe", {"name": "Believe", "category": "T", "description": ""}),
+    }
+    calls = []
+    total = skills.get_skill_total
+    skills.get_skill_total = lambda name: calls.append(name) or total(name)
+    return skills, board, calls
+
+
+def test_lens_is_computed_once_per_state_change():
+    skills, board, calls = _setup()
+    lens = LensSystem(skills, board)
+
+    first = lens.calculate_lens()
+    computed = len(calls)
+    assert computed > 0
+    for _ in range(5):
+        assert lens.calculate_lens() == first
+    assert len(calls) == computed
+
+    # Re-applying an identical modifier is not a change
+    skills.get_skill("Logic").set_modifier("Board", 0)
+    lens.calculate_lens()
+    assert len(calls) == computed
+
+
+def test_lens_follows_skill_and_theory_changes():
+    skills, board, _ = _setup()
+    lens = LensSystem(skills, board)
+    assert lens.calculate_lens() == "neutral"
+
+    skills.attributes["INTUITION"].value = 4
+    assert lens.calculate_lens() == "believer"
+
+    skills.attributes["REASON"].value = 6
+    for name in ("Logic", "Skepticism"):
+        skills.get_skill(name).base_level = 1
+    assert lens.calculate_lens() == "skeptic"
+
+    board.get_theory("i_want_to_believe").status = "active"
+    assert lens.calculate_lens() == "neutral"
+
+    skills.get_skill("Logic").set_modifier("Adrenaline", 5)
+    assert lens.calculate_lens() == "skeptic"
+
+
+def _theory(t_id):
+    return Theory(t_id, {"name": t_id, "category": "T", "description": ""})
+
+
+def _random_states(skills, board, rng, steps=300):
+    """Yield after each random skill, attribute or lens-theory status change."""
+    theory_ids = ["i_want_to_believe", "there_is_a_rational_explanation"]
+    skill_names = ["Paranormal Sensitivity", "Instinct", "Logic", "Skepticism", "Authority"]
+    for _ in range(steps):
+        action = rng.randrange(3)
+        if action == 0:
+            skills.attributes[rng.choice(["INTUITION", "REASON", "PRESENCE"])].value = rng.randint(1, 6)
+        elif action == 1:
+            skills.get_skill(rng.choice(skill_names)).base_level = rng.randint(0, 6)
+        else:
+            board.get_theory(rng.choice(theory_ids)).status = rng.choice(["active", "available"])
+        yield
+
+
+def test_composer_reads_the_lens_system():
+    skills, board, calls = _setup()
+    board.theories = {t_id: _theory(t_id) for t_id in ("i_want_to_believe", "there_is_a_rational_explanation")}
+    lens = LensSystem(skills, board)
+    composer = TextComposer(skill_system=skills, board=board)
+    shared = TextComposer(skill_system=skills, board=board, lens_system=lens)
+
+    seen = set()
+    for _ in _random_states(skills, board, random.Random(5)):
+        expected = lens.calculate_lens()
+        seen.add(expected)
+        assert composer.calculate_dominant_lens() == Archetype(expected)
+        assert shared.calculate_dominant_lens({}) == Archetype(expected)
+    assert seen == {"neutral", "believer", "skeptic", "haunted"}
+
+    # The shared lens is computed once per change, whoever asks first
+    skills.attributes["PRESENCE"].value = 6
+    before = len(calls)
+    shared.calculate_dominant_lens()
+    lens.calculate_lens()
+    assert len(calls) - before == 4
+
+    lens.lock_lens("haunted")
+    skills.attributes["PRESENCE"].value = 1
+    assert shared.calculate_dominant_lens() == Archetype.HAUNTED
+
+
+def test_game_consumers_agree_on_the_lens():
+    game = Game(save_storage=MemorySaveStorage())
+    game.board.theories = dict(
+        game.board.theories,
+        **{t_id: _theory(t_id) for t_id in ("i_want_to_believe", "there_is_a_rational_explanation")}
+    )
+    composers = [game.text_composer, game.dialogue_manager.text_composer]
+    assert all(c.lens_system is game.lens_system for c in composers)
+
+    for _ in _random_states(game.skill_system, game.board, random.Random(11), steps=100):
+        lens = game.lens_system.calculate_lens()
+        assert [c.calculate_dominant_lens(game.player_state).value for c in composers] == [lens, lens]
+        assert game.get_ui_state()["archetype"] == lens
@@ -0,0 +1,82 @@
+import sys
+import os
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from engine.object_index import SceneObjectIndex
+from engine.save_storage import MemorySaveStorage
+from game import Game
+
+
+OBJECTS = {
+    "workbench": {"description": "A scarred bench."},
+    "blood_stain": {"description": "Dark and dry."},
+    "streetlamp": {"description": "Flickering.", "aliases": ["lamp post"]},
+    "shed_door": {"name": "Shed Door", "description": "Padlocked."},
+    "boxes": {"description": "Stacked high."},
+    "map": {"description": "Trail map."},
+    "map_case": {"description": "Glass case."},
+}
+
+
+def test_exact_key_wins():
+    index = SceneObjectIndex(OBJECTS)
+    assert index.resolve("map")[0] == "map"
+
+
+def test_synonym_and_substring_follow_legacy_order():
+    index = SceneObjectIndex(OBJECTS)
+    # "blood" maps to "stain" via the noun synonyms
+    assert index.resolve("blood")[0] == "blood_stain"
+    # "light" -> "lamp" synonym matches the streetlamp key
+    assert index.resolve("light")[0] == "streetlamp"
+    # Plain substring
+    assert index.resolve("bench")[0] == "workbench"
+
+
+def test_aliases_names_and_plurals():
+    index = SceneObjectIndex(OBJECTS)
+    assert index.resolve("lamp post")[0] == "streetlamp"
+    assert index.resolve("shed door")[0] == "shed_door"
+    assert index.resolve("box")[0] == "boxes"
+    assert index.resolve("maps")[0] == "map"
+
+
+def test_missing_and_ambiguous_targets():
+    index = SceneObjectIndex(OBJECTS)
+    assert index.resolve("piano") == (None, None)
+    assert index.ambiguous_matches("ma") == ["map", "map_case"]
+    assert index.ambiguous_matches("workbench") == ["workbench"]
+
+
+def test_substring_lookup_matches_brute_force():
+    index = SceneObjectIndex(OBJECTS)
+    # One suffix entry per character of each key, not one per substring
+    assert len(index._suffixes) == sum(len(key) for key in OBJECTS)
+    for term in ("a", "ap", "map", "_", "oor", "s", "tains", "x", "bench", "lamp"):
+        expected = [key for key in OBJECTS if term in key.lower()]
+        assert index._substring_keys(term) == expected
+
+
+def test_earlier_synonym_is_not_a_tie():
+    index = SceneObjectIndex({"bookmark": {}, "blood_stain": {}})
+    # "blood" prefers "stain" over "mark", as the legacy matcher did
+    assert index.ambiguous_matches("blood") == ["blood_stain"]
+    assert index.ambiguous_matches("door") == []
+
+
+def test_tied_targets_ask_which_object():
+    game = Game(save_storage=MemorySaveStorage())
+    game.start_game()
+    game.scene_manager.current_scene_data["objects"] = {
+        "front_door": {"description": "Painted red."},
+        "shed_door": {"name": "Shed Door", "description": "Padlocked."},
+    }
+    output = game.step({"verb": "EXAMINE", "target": "door"})
+    assert "Which do you mean: front door or Shed Door?" in output
+    assert "Padlocked" not in output
+
+    assert "Padlocked" in game.step({"verb": "EXAMINE", "target": "shed"})
@@ -0,0 +1,225 @@
+import sys
+import os
+import unittest
+
+# Ensure src is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from engine.parser_memory import ParserMemory, KeywordSketch, trigger_key
+from engine.trigger_system import TriggerManager
+from engine.branch_controller import collect_parser_keywords
+from engine.save_storage import MemorySaveStorage
+from game import Game
+
+
+class TestParserMemoryTriggers(unittest.TestCase):
+    def setUp(self):
+        self.memory = ParserMemory(buffer_size=3)
+        self.all_trigger = {"id": "radio", "keywords": ["radio", "tower"]}
+        self.any_trigger = {"id": "body", "keywords": ["corpse", "body"], "mode": "any"}
+        self.pattern_trigger = {"id": "ask", "pattern": r"ask .* about"}
+        self.triggers = [self.all_trigger, self.any_trigger, self.pattern_trigger]
+        self.memory.register_triggers(self.triggers)
+
+    def test_activations_reported_as_delta(self):
+        self.memory.add_command("examine radio")
+        self.assertEqual(self.memory.pop_activations(), [])
+
+        self.memory.add_command("climb the tower")
+        self.assertEqual(self.memory.pop_activations(), [self.all_trigger])
+        self.assertEqual(self.memory.pop_activations(), [])
+
+        self.memory.add_command("look at body")
+        self.assertEqual(self.memory.pop_activations(), [self.any_trigger])
+
+    def test_matches_direct_evaluation(self):
+        commands = ["ask maude about the fire", "examine radio", "check tower", "look", "wait"]
+        for command in commands:
+            self.memory.add_command(command)
+            indexed = self.memory.check_trigger_phrases(self.triggers)
+
+            fresh = ParserMemory(buffer_size=3)
+            fresh.watch_keywords(["radio", "tower", "corpse", "body"])
+            for earlier in commands[:commands.index(command) + 1]:
+                fresh.add_command(earlier)
+            self.assertEqual(indexed, fresh.check_trigger_phrases([dict(t) for t in self.triggers]))
+
+    def test_pattern_expires_with_buffer(self):
+        self.memory.add_command("ask maude about the fire")
+        self.assertIn(self.pattern_trigger, self.memory.check_trigger_phrases(self.triggers))
+
+        for filler in ["wait", "wait", "wait"]:
+            self.memory.add_command(filler)
+        self.assertFalse(self.memory.has_pattern(r"ask .* about"))
+        self.assertNotIn(self.pattern_trigger, self.memory.check_trigger_phrases(self.triggers))
+
+    def test_load_state_rebuilds_trigger_state(self):
+        self.memory.add_command("radio tower")
+        state = self.memory.save_state()
+
+        restored = ParserMemory(buffer_size=3)
+        restored.register_triggers(self.triggers)
+        restored.load_state(state)
+        self.assertEqual(restored.check_trigger_phrases(self.triggers), [self.all_trigger])
+
+    def test_deferred_commands_flush_before_queries(self):
+        self.memory.defer_command("examine radio")
+        self.memory.defer_command("climb the tower")
+        self.assertEqual(self.memory.get_recent_commands(2), ["climb the tower", "examine radio"])
+        self.assertEqual(self.memory.pop_activations(), [self.all_trigger])
+
+        self.memory.defer_command("look at body")
+        self.assertTrue(self.memory.has_mentioned("body"))
+        self.assertEqual(self.memory.save_state()["commands"][-1], "look at body")
+
+
+class TestKeywordSketch(unittest.TestCase):
+    def test_frequency_and_top_keywords(self):
+        memory = ParserMemory()
+        for _ in range(5):
+            memory.add_command("lantern")
+        memory.add_command("open door")
+
+        self.assertEqual(memory.get_keyword_frequency("lantern"), 5)
+        self.assertEqual(memory.get_top_keywords(1)[0][0], "lantern")
+        self.assertTrue(memory.has_mentioned("door"))
+        self.assertFalse(memory.has_mentioned("piano"))
+
+    def test_counts_decay_over_commands(self):
+        memory = ParserMemory(buffer_size=5)
+        memory.keyword_sketch = KeywordSketch(half_life=10)
+        memory.watch_keywords(["lantern"])
+        for _ in range(4):
+            memory.add_command("lantern")
+        for _ in range(10):
+            memory.add_command("wait")
+
+        self.assertEqual(memory.get_keyword_frequency("lantern"), 2)
+        # Watched mentions are exact and never forgotten
+        self.assertTrue(memory.has_mentioned("lantern", min_count=4))
+        self.assertFalse(memory.has_mentioned("lantern", min_count=5))
+
+    def test_saved_size_is_fixed(self):
+        memory = ParserMemory()
+        for i in range(2000):
+            memory.add_command(f"examine object{i}")
+        state = memory.save_state()
+        sketch = state["keyword_sketch"]
+        self.assertEqual(sum(len(row) for row in sketch["cells"]), sketch["width"] * sketch["depth"])
+        self.assertLessEqual(len(sketch["top"]), sketch["top_k"])
+
+        restored = ParserMemory()
+        restored.load_state(state)
+        self.assertTrue(restored.has_mentioned("object1999"))
+        self.assertEqual(restored.get_top_keywords(1), memory.get_top_keywords(1))
+
+    def test_legacy_keyword_counts_are_imported(self):
+        memory = ParserMemory()
+        memory.register_triggers([{"keywords": ["radio"]}])
+        memory.load_state({"commands": [], "keyword_counts": {"radio": 3, "tower": 1}})
+
+        self.assertTrue(memory.has_mentioned("radio", min_count=3))
+        self.assertEqual(memory.get_keyword_frequency("tower"), 1)
+
+    def test_unwatched_keywords_never_answer_from_the_sketch(self):
+        memory = ParserMemory()
+        for i in range(2000):
+            memory.add_command(f"word{i}")
+        self.assertFalse(memory.has_mentioned("radio"))
+
+        # Sketch false positives must not become exact counts either
+        memory.keyword_sketch.seen = lambda keyword: True
+        memory.watch_keywords(["tower"])
+        self.assertEqual(memory.watched_counts["tower"], 0)
+        memory.add_command("climb tower")
+        self.assertTrue(memory.has_mentioned("tower"))
+        self.assertFalse(memory.has_mentioned("tower", min_count=2))
+
+    def test_game_watches_branch_keywords(self):
+        scenes = {"s1": {"choices": [{"conditions": {"parser_keywords": ["Radio", "tower"]}}]},
+                  "s2": {"branches": [{"conditions": {"parser_keywords": ["body"]}}]}}
+        self.assertEqual(collect_parser_keywords(scenes), {"radio", "tower", "body"})
+
+
+class TestTriggerIdentityAndCache(unittest.TestCase):
+    def test_triggers_keyed_by_stable_id(self):
+        memory = ParserMemory()
+        memory.register_triggers([{"id": "radio", "keywords": ["radio"]}])
+        memory.add_command("examine radio")
+
+        # A fresh copy of the same trigger (e.g. reloaded content) hits the index
+        copy = {"id": "radio", "keywords": ["radio"]}
+        self.assertEqual(memory.check_trigger_phrases([copy]), [copy])
+        self.assertEqual(trigger_key({"keywords": ["Radio", "tower"]}), "all:radio,tower")
+        self.assertEqual(trigger_key({"pattern": "ask .*"}), "pattern:ask .*")
+
+    def test_pattern_cache_is_bounded(self):
+        memory = ParserMemory()
+        memory.register_triggers([{"id": "ask", "pattern": r"ask .* about"}])
+        memory.add_command("ask maude about the fire")
+        for i in range(ParserMemory.PATTERN_CACHE_SIZE * 3):
+            memory.has_pattern(f"word{i}")
+            memory.add_command(f"word{i}")
+
+        self.assertLessEqual(len(memory.pattern_cache), ParserMemory.PATTERN_CACHE_SIZE)
+        self.assertIn(r"ask .* about", memory.pattern_cache)
+        # Evicted patterns are recounted over the buffer when queried again
+        last = ParserMemory.PATTERN_CACHE_SIZE * 3 - 1
+        self.assertTrue(memory.has_pattern(f"word{last}"))
+        self.assertFalse(memory.has_pattern("word0"))
+
+
+class TestParserTriggersInTriggerManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = TriggerManager()
+        self.manager.triggers = [
+            {"id": "radio_call", "keywords": ["radio", "tower"], "effects": {}},
+            {"id": "cabin_only", "keywords": ["lantern"], "location": "cabin", "effects": {}},
+            {"id": "ask_again", "pattern": r"ask .* about", "once_only": False, "effects": {}},
+        ]
+        self.memory = ParserMemory(buffer_size=2)
+        self.state = {"current_location": "dock", "player_flags": set()}
+
+    def fired(self):
+        return [t["id"] for t in self.manager.check_parser_triggers(self.memory, self.state)]
+
+    def test_parser_triggers_fire_once_with_conditions(self):
+        self.assertEqual(self.fired(), [])
+        # Conditions-only checks never fire phrase triggers
+        self.assertEqual(self.manager.check_triggers({"current_location": "cabin"}), [])
+
+        self.memory.add_command("examine radio")
+        self.memory.add_command("climb tower")
+        self.memory.add_command("light lantern")
+        self.assertEqual(self.fired(), ["radio_call"])
+        self.assertEqual(self.fired(), [])
+
+        # Typed earlier, fires once its location condition holds
+        self.state["current_location"] = "cabin"
+        self.assertEqual(self.fired(), ["cabin_only"])
+
+    def test_repeatable_trigger_fires_on_each_activation(self):
+        self.memory.add_command("ask maude about fire")
+        self.assertEqual(self.fired(), ["ask_again"])
+        self.assertEqual(self.fired(), [])
+        self.memory.add_command("wait")
+        self.memory.add_command("wait")
+        self.memory.add_command("ask maude about the tower")
+        self.assertEqual(self.fired(), ["ask_again"])
+
+    def test_typed_phrases_fire_parser_triggers_in_game(self):
+        game = Game(save_storage=MemorySaveStorage())
+        game.start_game()
+        game.trigger_manager.triggers = game.trigger_manager.triggers + [
+            {"id": "window_watcher", "keywords": ["window"], "effects": {"set_player_flags": ["saw_watcher"]}}
+        ]
+        output = game.step("examine window")
+        self.assertIn("EVENT: window_watcher", output)
+        self.assertIn("saw_watcher", game.player_state["event_flags"])
+        self.assertNotIn("EVENT: window_watcher", game.step("examine window"))
+
+
+if __name__ == '__main__':
+    unittest.main()
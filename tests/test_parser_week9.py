@@ -55,6 +55,16 @@ class TestWeek9Parser(unittest.TestCase):
         verb, target = results[0]
         self.assertIn(verb, ["ASK", "TALK"])
         self.assertEqual(target, "priest")
+    def test_multi_word_synonyms(self):
+        self.assertEqual(self.parser.normalize("pick up the lantern")[0], ("TAKE", "lantern"))
+        self.assertEqual(self.parser.normalize("look around")[0], ("SEARCH", None))
+        self.assertEqual(self.parser.normalize("look at map")[0], ("EXAMINE", "map"))
+        self.assertEqual(self.parser.normalize("use with rope")[0], ("COMBINE", "rope"))
+
+    def test_fuzzy_verb_and_suggestion(self):
+        self.assertEqual(self.parser.normalize("examin desk")[0], ("EXAMINE", "desk"))
+        self.assertEqual(self.parser.get_suggestion("serch room"), "search")
+        self.assertIsNone(self.parser.get_suggestion("xyzzyq"))
 
 if __name__ == '__main__':
     unittest.main()
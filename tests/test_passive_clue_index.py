@@ -0,0 +1,63 @@
+import os
+import sys
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from engine.clue_system import ClueSystem, compile_visibility_conditions
+
+
+SCENE_CLUES = [
+    {"clue_id": "glass", "visible_when": {"skill_gte": {"Forensics": 2}}, "reveal_text": "Blood on the glass."},
+    {"clue_id": "photo", "visible_when": {"skill_gte": {"Perception": 5}}},
+    {"clue_id": "memo", "visible_when": {"equipment": "uv_light", "flag_set": "found_office"}},
+    {"clue_id": "tracks"},
+]
+
+
+def _system():
+    system = ClueSystem()
+    for clue_id in ("glass", "photo", "memo", "tracks"):
+        system.register_clue({"id": clue_id, "title": clue_id.title(),
+                              "text": {"base": f"{clue_id} base", "lens": {"believer": f"{clue_id} omen"}}})
+    return system
+
+
+def test_compiled_predicates_match_conditions():
+    conditions = {"skill_gte": {"Logic": 3}, "equipment": "uv_light",
+                  "theory_active": "cover_up", "flag_set": "night"}
+    visible = compile_visibility_conditions(conditions)
+    state = {"skills": {"Logic": 3}, "equipped": ["uv_light"],
+             "active_theories": ["cover_up"], "flags": {"night": True}}
+    assert visible(state)
+    for key, value in (("skills", {"Logic": 2}), ("equipped", []),
+                       ("active_theories", []), ("flags", {"night": False})):
+        assert not visible(dict(state, **{key: value}))
+    assert compile_visibility_conditions({})({})
+
+
+def test_scene_index_drops_acquired_clues():
+    system = _system()
+    state = {"skills": {"Forensics": 3}}
+
+    revealed = system.evaluate_passive_clues(SCENE_CLUES, state, scene_id="kitchen", lens="believer")
+    assert [(s.clue_id, text) for s, text in revealed] == [("glass", "Blood on the glass."), ("tracks", "tracks omen")]
+    assert list(system.passive_indexes["kitchen"].pending) == ["photo", "memo"]
+
+    # Clues acquired elsewhere leave the candidate set too
+    system.acquire_clue("photo")
+    assert list(system.passive_indexes["kitchen"].pending) == ["memo"]
+
+    state.update(inventory=["uv_light"], flags={"found_office": True})
+    revealed = system.evaluate_passive_clues(SCENE_CLUES, state, scene_id="kitchen")
+    assert [s.clue_id for s, _ in revealed] == ["memo"]
+    assert system.passive_indexes["kitchen"].pending == {}
+
+
+def test_restoring_state_rebuilds_candidates():
+    system = _system()
+    system.evaluate_passive_clues(SCENE_CLUES, {"skills": {"Forensics": 3}}, scene_id="kitchen")
+    system.restore_state({"acquired_clues": {}})
+
+    revealed = system.evaluate_passive_clues(SCENE_CLUES, {"skills": {"Forensics": 3}}, scene_id="kitchen")
+    assert [s.clue_id for s, _ in revealed] == ["glass", "tracks"]
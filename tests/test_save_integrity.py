@@ -0,0 +1,126 @@
+import json
+import os
+import sys
+
+# Ensure src and tools are in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tools')))
+
+from engine.save_system import SaveSystem, SAVE_FORMAT_VERSION
+from engine.save_storage import SQLiteSaveStorage
+import save_integrity
+from save_integrity import (
+    scan_file, scan_database, find_save_files,
+    OK, LEGACY, LEGACY_UNVERIFIED, HASH_MISMATCH, DUPLICATED, TRUNCATED,
+)
+
+
+def _signed(version=SAVE_FORMAT_VERSION, **fields):
+    data = {"version": version, "scene": "intro", **fields}
+    data["hash"] = SaveSystem._calculate_hash(data)
+    return data
+
+
+def _pre_series_save():
+    """A save as the 1.1 writer produced it: hashed raw (sets via str), written twice with sets as lists."""
+    data = {
+        "id": "real1", "timestamp": "2025-01-01 12:00:00", "version": "1.1", "scene": "intro",
+        "player_state": {"sanity": 80, "event_flags": {"met_maude", "saw_light"}},
+    }
+    data["hash"] = SaveSystem._calculate_hash(data)
+    return json.dumps(data, indent=2, default=list) + json.dumps(data, indent=2, default=list)
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _status(path, **kwargs):
+    return scan_file(path, content={}, **kwargs)["status"]
+
+
+def test_classifications(tmp_path):
+    good = _signed()
+    legacy = _signed(version="1.0")
+    unsigned = dict(good)
+    del unsigned["hash"]
+    tampered = dict(good, scene="elsewhere")
+
+    assert _status(_write(tmp_path, "ok.json", json.dumps(good))) == OK
+    assert _status(_write(tmp_path, "legacy.json", json.dumps(legacy))) == LEGACY
+    # Every writer signs saves, so a missing hash is tampering, not age
+    assert _status(_write(tmp_path, "unsigned.json", json.dumps(unsigned))) == HASH_MISMATCH
+    assert _status(_write(tmp_path, "tampered.json", json.dumps(tampered))) == HASH_MISMATCH
+    assert _status(_write(tmp_path, "cut.json", json.dumps(good)[:-10])) == TRUNCATED
+
+    assert _status(_write(tmp_path, "dup.json", json.dumps(good) + json.dumps(good))) == DUPLICATED
+    # The first document of a duplicated file is verified too
+    assert _status(_write(tmp_path, "dup_bad.json", json.dumps(tampered) + json.dumps(good))) == HASH_MISMATCH
+
+
+def test_repair_migrates_only_verified_files(tmp_path):
+    good = _signed()
+    legacy_path = _write(tmp_path, "legacy.json", json.dumps(_signed(version="1.0")))
+    dup_path = _write(tmp_path, "dup.json", json.dumps(good) + json.dumps(good))
+    tampered_text = json.dumps(dict(good, scene="elsewhere")) + json.dumps(good)
+    tampered_path = _write(tmp_path, "dup_bad.json", tampered_text)
+
+    assert scan_file(legacy_path, repair=True, dry_run=True, content={})["repaired"] is True
+    assert _status(legacy_path) == LEGACY
+
+    for path in (legacy_path, dup_path, tampered_path):
+        scan_file(path, repair=True, content={})
+
+    assert _status(legacy_path) == OK
+    assert _status(dup_path) == OK
+    # Tampered files are reported, never re-signed
+    assert _status(tampered_path) == HASH_MISMATCH
+    with open(tampered_path, encoding="utf-8") as f:
+        assert f.read() == tampered_text
+
+
+def test_sqlite_saves_are_scanned_and_repaired(tmp_path):
+    db_path = str(tmp_path / "saves.db")
+    for player_id in ("alice", "bob"):
+        storage = SQLiteSaveStorage(db_path, player_id=player_id)
+        storage.write("good", json.dumps(_signed()))
+        storage.write("old", json.dumps(_signed(version="1.0")))
+        storage.close()
+    _write(tmp_path, "notes.db", "not a database")
+
+    assert sorted(find_save_files(str(tmp_path))) == [db_path]
+
+    results = {r["path"]: r["status"] for r in scan_database(db_path, content={})}
+    assert results == {
+        f"{db_path}::alice/good": OK, f"{db_path}::alice/old": LEGACY,
+        f"{db_path}::bob/good": OK, f"{db_path}::bob/old": LEGACY,
+    }
+
+    repaired = scan_database(db_path, repair=True, content={})
+    assert sum(r["repaired"] for r in repaired) == 2
+    assert {r["status"] for r in scan_database(db_path, content={})} == {OK}
+
+    storage = SQLiteSaveStorage(db_path, player_id="bob")
+    assert json.loads(storage.read("old"))["version"] == SAVE_FORMAT_VERSION
+    storage.close()
+    assert save_integrity._scan_task((db_path, False, False, False))[0]["status"] == OK
+
+
+def test_pre_series_saves_are_unverified_legacy(tmp_path):
+    path = _write(tmp_path, "real1.json", _pre_series_save())
+    assert _status(path) == LEGACY_UNVERIFIED
+    # A current-format save with a bad hash is still tampering
+    tampered = dict(_signed(), scene="elsewhere")
+    assert _status(_write(tmp_path, "tampered.json", json.dumps(tampered))) == HASH_MISMATCH
+
+    # Plain repair leaves them alone; the operator has to accept the old hashes
+    assert scan_file(path, repair=True, content={})["repaired"] is False
+    assert _status(path) == LEGACY_UNVERIFIED
+    assert scan_file(path, repair=True, content={}, accept_legacy_hashes=True)["repaired"] is True
+    assert _status(path) == OK
+    with open(path, encoding="utf-8") as f:
+        migrated = json.load(f)
+    assert migrated["version"] == SAVE_FORMAT_VERSION
+    assert sorted(migrated["player_state"]["event_flags"]) == ["met_maude", "saw_light"]
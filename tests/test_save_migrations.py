@@ -0,0 +1,86 @@
+import json
+import sys
+import os
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from engine import save_migrations
+from engine.save_migrations import SaveData, CURRENT_VERSION, register_migration
+from engine.save_storage import MemorySaveStorage
+from game import Game
+
+
+LEGACY_SAVE = {
+    "version": "1.1",
+    "scene": "diner",
+    "event_log": {"events": [{"timestamp": "2024-01-01 10:00:00", "type": "scene_entry", "scene_id": "diner"}]},
+    "additional_systems": {"fracture_system": {"triggered_one_time": ["a"]}}
+}
+
+
+def test_event_log_upgraded_on_access():
+    save = SaveData(LEGACY_SAVE)
+    assert not save.is_current
+
+    block = save.get_block("event_log")
+    assert "events" not in block
+    assert block["rows"][0][1] == "scene_entry"
+    # Source dict is left untouched
+    assert "events" in LEGACY_SAVE["event_log"]
+
+
+def test_only_accessed_blocks_are_migrated():
+    calls = []
+
+    @register_migration("additional_systems.fracture_system", "1.1")
+    def _track(block):
+        calls.append(block)
+        return {"triggered_one_time": block["triggered_one_time"], "history": []}
+
+    try:
+        save = SaveData(LEGACY_SAVE)
+        save.get_block("event_log")
+        assert calls == []
+
+        fracture = save.get_block("additional_systems.fracture_system")
+        save.get_block("additional_systems.fracture_system")
+        assert fracture["history"] == []
+        assert len(calls) == 1
+    finally:
+        del save_migrations._MIGRATIONS["additional_systems.fracture_system"]
+
+
+def test_unversioned_save_chains_through_all_steps():
+    save = SaveData({"event_log": {"events": []}})
+    assert save.version == "1.0"
+    assert save.get_block("event_log")["rows"] == []
+    assert save.get_block("board_state") is None
+
+
+def test_migrate_all_stamps_current_version():
+    upgraded = SaveData(LEGACY_SAVE).migrate_all()
+    assert upgraded["version"] == CURRENT_VERSION
+    assert "rows" in upgraded["event_log"]
+    assert upgraded["additional_systems"] == LEGACY_SAVE["additional_systems"]
+
+
+def test_game_load_runs_migrations_registered_on_the_engine_module():
+    storage = MemorySaveStorage()
+    storage.write("old", json.dumps({
+        "version": "1.1", "scene": "intro", "hash": "",
+        "character_state": {"player_state": {"sanity": 70}},
+    }))
+
+    @register_migration("character_state.player_state", "1.1")
+    def _mark(block):
+        return dict(block, migrated=True)
+
+    try:
+        game = Game(save_storage=storage)
+        assert game.load_game("old")
+        assert game.player_state == {"sanity": 70, "migrated": True}
+    finally:
+        del save_migrations._MIGRATIONS["character_state.player_state"]
@@ -0,0 +1,103 @@
+import pytest
+import sys
+import os
+import shutil
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import game
+from engine.save_system import SaveSystem
+from engine.save_storage import (
+    SaveStorage, FileSaveStorage, SQLiteSaveStorage, MemorySaveStorage, create_storage
+)
+
+
+TEMP_DIR = os.path.join(os.path.dirname(__file__), "temp_saves_storage")
+
+
+@pytest.fixture
+def temp_dir():
+    if os.path.exists(TEMP_DIR):
+        shutil.rmtree(TEMP_DIR)
+    os.makedirs(TEMP_DIR)
+    yield TEMP_DIR
+    if os.path.exists(TEMP_DIR):
+        shutil.rmtree(TEMP_DIR)
+
+
+@pytest.fixture(params=["file", "sqlite", "memory"])
+def storage(request, temp_dir):
+    if request.param == "file":
+        backend = FileSaveStorage(os.path.join(temp_dir, "files"))
+    elif request.param == "sqlite":
+        backend = SQLiteSaveStorage(os.path.join(temp_dir, "saves.db"), player_id="alice")
+    else:
+        backend = MemorySaveStorage()
+    yield backend
+    backend.close()
+
+
+def test_round_trip_through_save_system(storage):
+    system = SaveSystem(storage=storage)
+    state = {"scene": "diner", "character_state": {"player_state": {"sanity": 80, "event_flags": {"a"}}}}
+
+    assert system.save_game("slot1", state) is True
+    loaded = system.load_game("slot1")
+
+    assert loaded["scene"] == "diner"
+    assert loaded["character_state"]["player_state"]["event_flags"] == ["a"]
+    assert loaded["hash"] == system._calculate_hash(loaded)
+
+
+def test_list_and_delete(storage):
+    system = SaveSystem(storage=storage)
+    system.save_game("one", {"scene": "a"})
+    system.save_game("two", {"scene": "b"})
+
+    slots = {s["slot_id"] for s in system.list_saves()}
+    assert slots == {"one", "two"}
+
+    assert system.delete_save("one") is True
+    assert system.delete_save("one") is False
+    assert system.load_game("one") is None
+
+
+def test_invalid_slot_rejected_for_every_backend(storage):
+    system = SaveSystem(storage=storage)
+    assert system.save_game("../escape", {"x": 1}) is False
+    assert system.load_game("../escape") is None
+
+
+def test_sqlite_slots_are_scoped_per_player(temp_dir):
+    db_path = os.path.join(temp_dir, "shared.db")
+    alice = SaveSystem(storage=SQLiteSaveStorage(db_path, player_id="alice"))
+    bob = SaveSystem(storage=SQLiteSaveStorage(db_path, player_id="bob"))
+
+    alice.save_game("slot1", {"scene": "alice_scene"})
+    bob.save_game("slot1", {"scene": "bob_scene"})
+
+    assert alice.load_game("slot1")["scene"] == "alice_scene"
+    assert bob.load_game("slot1")["scene"] == "bob_scene"
+    assert [s["slot_id"] for s in alice.list_saves()] == ["slot1"]
+
+    mode = alice.storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() == "wal"
+
+    alice.storage.close()
+    bob.storage.close()
+
+
+def test_create_storage_rejects_unknown_backend():
+    assert isinstance(create_storage("memory"), MemorySaveStorage)
+    with pytest.raises(ValueError):
+        create_storage("tape")
+
+
+def test_game_builds_engine_storage_backends(monkeypatch):
+    load_config = game.load_config
+    monkeypatch.setattr(game, "load_config", lambda: dict(load_config(), save_backend="memory"))
+    storage = game.Game().save_system.storage
+    assert isinstance(storage, SaveStorage) and isinstance(storage, MemorySaveStorage)
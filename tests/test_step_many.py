@@ -0,0 +1,66 @@
+import sys
+import os
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(ROOT, 'src'))
+sys.path.append(os.path.join(ROOT, 'src', 'engine'))
+sys.path.append(ROOT)
+
+from game import Game
+from engine.save_storage import MemorySaveStorage
+
+
+def _new_game():
+    game = Game(save_storage=MemorySaveStorage())
+    game.start_game()
+    return game
+
+
+def test_step_returns_turn_output():
+    game = _new_game()
+    output = game.step("help")
+    assert "AVAILABLE COMMANDS" in output
+    # Scene is redrawn at the end of the turn
+    assert "MODE" in output
+
+
+def test_step_many_segments_output_per_command():
+    game = _new_game()
+    result = game.step_many(["help", "inventory", "journal"])
+
+    assert [seg["input"] for seg in result["outputs"]] == ["help", "inventory", "journal"]
+    assert "AVAILABLE COMMANDS" in result["outputs"][0]["output"]
+    assert "AVAILABLE COMMANDS" not in result["outputs"][1]["output"]
+    # Only the final command re-renders the scene
+    assert "MODE" not in result["outputs"][0]["output"]
+    assert "MODE" in result["outputs"][-1]["output"]
+    assert result["quit"] is False
+    assert "sanity" in result["state"]
+
+
+def test_step_many_stops_on_quit():
+    game = _new_game()
+    result = game.step_many(["help", "quit", "help"], include_state=False)
+
+    assert len(result["outputs"]) == 2
+    assert result["quit"] is True
+    assert result["state"] is None
+
+
+def test_structured_choice_matches_typed_number():
+    typed = _new_game()
+    typed.step("1")
+    structured = _new_game()
+    structured.step({"choice_index": 0})
+
+    assert structured.scene_manager.current_scene_id == typed.scene_manager.current_scene_id
+
+
+def test_structured_verb_skips_parser_but_records_memory():
+    game = _new_game()
+    game.parser.normalize = None  # Any parser call would fail
+    output = game.step({"verb": "examine", "target": "window"})
+
+    assert "[ACTION: EXAMINE window]" in output
+    assert game.parser_memory.get_recent_commands(1) == ["examine window"]
+
@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'engine')))
+
+from engine.board import Board, Theory, TheoryDefinition
+
+
+def test_boards_share_definitions_not_state():
+    first, second = Board(), Board()
+    t_id = next(iter(first.theories))
+    a, b = first.get_theory(t_id), second.get_theory(t_id)
+
+    assert a.definition is b.definition
+    assert a.name == a.definition.name and a.requirements is b.requirements
+    a.linked_evidence.append("clue")
+    assert b.linked_evidence == []
+
+    # State is slotted and definition fields are read-only
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(AttributeError):
+        a.name = "Renamed"
+
+
+def test_theory_accepts_raw_content_dict():
+    theory = Theory("t", {"name": "T", "category": "C", "description": "", "status": "locked"})
+    assert isinstance(theory.definition, TheoryDefinition)
+    assert theory.status == "locked"
+    assert theory.requirements["clues_required"] == []
+
+
+def test_save_omits_untouched_theories_and_keeps_friction():
+    board = Board()
+    ids = [t.id for t in board.theories_with_status("available")][:2]
+    board.start_internalizing(ids[0])
+    board.get_theory(ids[0]).friction_level = 40
+
+    data = board.to_dict()
+    assert list(data["theories"]) == [ids[0]]
+
+    restored = Board.from_dict(data)
+    assert restored.get_theory(ids[0]).status == "internalizing"
+    assert restored.get_theory(ids[0]).friction_level == 40
+    assert restored.get_theory(ids[1]).status == "available"
+
+    # Old saves listing every theory still load
+    full = {"theories": {t_id: t.get_state() for t_id, t in board.theories.items()}}
+    assert Board.from_dict(full).to_dict() == data
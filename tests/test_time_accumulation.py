@@ -0,0 +1,65 @@
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(ROOT, 'src'))
+sys.path.append(os.path.join(ROOT, 'src', 'engine'))
+sys.path.append(ROOT)
+
+from game import Game
+from engine.save_storage import MemorySaveStorage
+from engine.attention_system import AttentionSystem
+
+
+def _resting_game(mental_load, attention, friction=0):
+    game = Game(save_storage=MemorySaveStorage())
+    game.output.print = lambda *args, **kwargs: None
+    game.psych_state.player_state["mental_load"] = mental_load
+    game.attention_system.attention_level = attention
+    if friction:
+        theory = next(iter(game.board.theories.values()))
+        theory.status = "active"
+        theory.friction_level = friction
+    # Keep the 347 resonance check out of the way
+    game.manifestation_manager.last_manifestation_time = 10 ** 9
+    return game
+
+
+def _state(game):
+    return (game.psych_state.player_state["mental_load"],
+            round(game.attention_system.attention_level, 6))
+
+
+def test_segmented_rest_matches_single_advance():
+    single = _resting_game(85, 52)
+    single.time_system.advance_time(8 * 60)
+
+    segmented = _resting_game(85, 52)
+    for _ in range(8 * 60 // 10):
+        segmented.time_system.advance_time(10)
+
+    # Beacon +1/h against decay -2/h over 8 hours
+    assert _state(single) == _state(segmented) == (85, 44.0)
+
+
+def test_fractional_friction_load_is_carried():
+    single = _resting_game(60, 30, friction=25)
+    single.time_system.advance_time(6 * 60)
+
+    per_minute = _resting_game(60, 30, friction=25)
+    for _ in range(6 * 60):
+        per_minute.time_system.advance_time(1)
+
+    assert _state(single) == _state(per_minute)
+    # Load climbs 25/h from 60, so the beacon steps up at 48, 72 and 96 minutes
+    assert _state(single) == (100, 32.4)
+
+
+def test_band_horizon_accounts_for_beacon():
+    attention = AttentionSystem()
+    attention.attention_level = 52
+    # Decay only: drops below 51 after half an hour
+    assert attention.minutes_until_band_change() == 31
+    # Beacon of 3/h outweighs decay: climbs to 60 at +1/h
+    assert attention.minutes_until_band_change(gain_per_hour=3) == 8 * 60
+    assert attention.minutes_until_band_change(gain_per_hour=2) is None
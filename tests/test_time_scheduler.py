@@ -0,0 +1,112 @@
+import os
+import sys
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from engine.time_system import TimeSystem
+
+
+def test_events_fire_in_time_order():
+    ts = TimeSystem("1995-10-14 08:00")
+    log = []
+    for delay in (30, 10, 20, 10):
+        ts.schedule_event(delay, lambda d=delay: log.append(d), f"at {delay}")
+
+    ts.advance_time(15)
+    assert log == [10, 10]
+    ts.advance_time(60)
+    assert log == [10, 10, 20, 30]
+    assert ts.scheduled_events == []
+
+
+def test_cancel_and_recurring():
+    ts = TimeSystem()
+    log = []
+    doomed = ts.schedule_event(5, lambda: log.append("doomed"), "doomed")
+    ticker = ts.schedule_event(10, lambda: log.append(ts.current_time.hour), "ticker", interval=60)
+
+    assert ts.cancel(doomed) is True
+    assert ts.cancel(doomed) is False
+    ts.advance_time(3 * 60)
+    # Fired at 08:10, 09:10 and 10:10; the planner stops the clock at each one
+    assert log == [8, 9, 10]
+
+    assert ts.cancel(ticker.id) is True
+    ts.advance_time(3 * 60)
+    assert len(log) == 3
+
+
+def test_events_scheduled_by_callbacks_fire_in_same_advance():
+    ts = TimeSystem()
+    log = []
+
+    def first():
+        log.append("first")
+        # Relative to the due time (08:05), not the end of the advance
+        ts.schedule_event(10, lambda: log.append("chained"), "chained")
+
+    ts.schedule_event(5, first, "first")
+    ts.schedule_event(30, lambda: log.append("last"), "last")
+    ts.advance_time(60)
+    assert log == ["first", "chained", "last"]
+
+
+def test_named_events_survive_save_and_load():
+    ts = TimeSystem()
+    ts.schedule_event(90, "story", "Tom goes missing", payload={"event": "tom"})
+    ts.schedule_event(30, lambda: None, "transient")
+    data = ts.to_dict()
+    assert [e["handler"] for e in data["scheduled_events"]] == ["story"]
+
+    restored = TimeSystem.from_dict(data)
+    fired = []
+    restored.register_handler("story", lambda payload: fired.append(payload["event"]))
+    restored.advance_time(120)
+    assert fired == ["tom"]
+
+    # New ids never collide with restored ones
+    handle = restored.schedule_event(5, "story", "again")
+    assert handle.id >= data["next_event_id"]
+
+
+def test_load_state_keeps_listeners():
+    ts = TimeSystem()
+    minutes = []
+    ts.add_listener(minutes.append)
+    ts.load_state({"current_time": "1995-10-15 09:00", "start_time": "1995-10-14 08:00"})
+    ts.advance_time(15)
+    assert minutes == [15]
+    assert ts.get_total_minutes() == 25 * 60 + 15
+
+
+def test_planner_stops_at_horizons_and_events():
+    ts = TimeSystem()
+    steps = []
+    ts.add_listener(steps.append)
+    ts.schedule_event(90, lambda: None, "event")
+    ts.add_horizon(lambda: 30.5 if sum(steps) < 30 else None)
+
+    ts.advance_time(120)
+    assert steps == [31, 59, 30]
+    assert ts.get_total_minutes() == 120
+
+
+def test_short_advance_is_one_segment():
+    ts = TimeSystem()
+    steps = []
+    ts.add_listener(steps.append)
+    ts.add_horizon(lambda: None)
+    ts.advance_time(15)
+    ts.advance_time(0)
+    assert steps == [15, 0]
+
+
+def test_planner_segments_are_bounded():
+    ts = TimeSystem()
+    steps = []
+    ts.add_listener(steps.append)
+    ts.add_horizon(lambda: 1)  # Always "about to change"
+    ts.advance_time(10_000)
+    assert sum(steps) == 10_000
+    assert len(steps) <= 500
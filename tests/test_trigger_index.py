@@ -0,0 +1,128 @@
+import os
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+# Ensure src is in python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from engine.trigger_index import TriggerIndex, ALWAYS
+from engine.trigger_system import TriggerManager
+from engine.fear_system import FearManager, FearEvent
+from engine.memory_system import MemorySystem, SuppressedMemory
+
+
+def _probe(key, state):
+    return state.get(key[1])
+
+
+def test_only_changed_keys_are_reevaluated():
+    calls = []
+    index = TriggerIndex(_probe)
+
+    def pred(name, field):
+        def check(state):
+            calls.append(name)
+            return state.get(field) == "yes"
+        return check
+
+    index.register("a", [("v", "x")], pred("a", "x"))
+    index.register("b", [("v", "y")], pred("b", "y"))
+    index.register("c", [ALWAYS], pred("c", "z"))
+
+    state = {"x": "yes", "y": "no", "z": "no"}
+    assert index.update(state) == ["a"]
+    assert sorted(calls) == ["a", "b", "c"]
+
+    calls.clear()
+    assert index.update(state) == ["a"]
+    assert calls == ["c"]
+
+    calls.clear()
+    state["y"] = "yes"
+    assert index.update(state) == ["a", "b"]
+    assert sorted(calls) == ["b", "c"]
+
+    index.unregister("a")
+    assert index.update(state) == ["b"]
+    assert "a" not in index
+
+
+def _trigger_state(**overrides):
+    state = {
+        "current_location": "cabin",
+        "location_states": {"cabin": {"fire_started": False}},
+        "player_flags": set(),
+        "time": datetime(1995, 10, 14, 23, 0),
+        "board": None,
+        "sanity": 100,
+        "reality": 100,
+    }
+    state.update(overrides)
+    return state
+
+
+def test_trigger_manager_matches_full_scan():
+    triggers = [
+        {"id": "ghost", "location": "cabin", "priority": 10,
+         "conditions": {"time_after": "22:00", "location_flags": {"fire_started": False}}},
+        {"id": "whisper", "once_only": False, "priority": 20,
+         "conditions": {"player_flags": ["saw_ghost"], "sanity_below": 50}},
+        {"id": "odd", "conditions": {"mystery_key": True}},
+    ]
+    indexed = TriggerManager()
+    indexed.triggers = triggers
+
+    states = [
+        _trigger_state(time=datetime(1995, 10, 14, 21, 0)),
+        _trigger_state(),
+        _trigger_state(player_flags={"saw_ghost"}, sanity=40),
+        _trigger_state(player_flags={"saw_ghost"}, sanity=40),
+        _trigger_state(sanity=40),
+    ]
+    fired = [[t["id"] for t in indexed.check_triggers(s)] for s in states]
+    assert fired == [["odd"], ["ghost"], ["whisper"], ["whisper"], []]
+
+
+def test_trigger_manager_respects_loaded_fired_set():
+    tm = TriggerManager()
+    tm.triggers = [{"id": "ghost", "location": "cabin"}]
+    tm.from_dict({"fired_triggers": ["ghost"]})
+    assert tm.check_triggers(_trigger_state()) == []
+
+
+def test_fear_events_cooldown_and_chance_apply_per_check():
+    fm = FearManager()
+    fm.fear_events["dread"] = FearEvent({
+        "id": "dread", "cooldown_minutes": 30,
+        "trigger_conditions": {"location_type": "outdoor", "sanity_below": 60, "chance": 0.5}
+    })
+    state = {"location_data": {"type": "outdoor"}, "sanity": 40, "player_flags": set()}
+
+    with patch("random.random", return_value=0.9):
+        assert fm.check_fear_triggers(state) == []
+    with patch("random.random", return_value=0.1):
+        assert [e["event_id"] for e in fm.check_fear_triggers(state)] == ["dread"]
+        # Cooling down
+        assert fm.check_fear_triggers(state) == []
+        fm.reset_cooldowns()
+        assert len(fm.check_fear_triggers(state)) == 1
+        fm.reset_cooldowns()
+        state["location_data"] = None
+        assert fm.check_fear_triggers(state) == []
+
+
+def test_memories_unlock_once_and_leave_the_index(tmp_path):
+    system = MemorySystem(str(tmp_path / "missing.json"))
+    memory = SuppressedMemory("trauma", "Trauma", "x.json", {"stat_threshold": {"sanity": 20}}, "truth")
+    system.memories["trauma"] = memory
+    system._index_memory(memory)
+
+    player_state = {"sanity": 50}
+    state = {"player_state": player_state, "event_flags": set()}
+    assert system.check_memory_triggers(state) == []
+
+    player_state["sanity"] = 10
+    assert system.check_memory_triggers(state) == ["trauma"]
+    assert "trauma" not in system.index
+    assert system.check_memory_triggers(state) == []
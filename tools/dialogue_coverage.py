@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Dialogue Coverage Analyzer
+--------------------------
+Offline analysis of every dialogue tree in a directory. Trees are loaded
+and analysed in parallel; for each one the report lists:
+
+  * unreachable nodes (no path from the start node)
+  * requirement-gated nodes (only reachable through gated choices or checks)
+  * cycles
+  * per-node reach probability, estimated by Monte Carlo over player skill
+    levels with the game's 2d6 + skill >= DC check model
+
+The hottest nodes across all trees are what the dialogue cache should
+preload first.
+
+Usage:
+  python tools/dialogue_coverage.py [data/dialogues] [--samples N] [--workers N] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Add src to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, "../src")
+sys.path.append(src_path)
+
+try:
+    from content.dialogue_graph import DialogueGraph, EXIT_NODE, compile_requirements
+except ImportError as e:
+    print(f"Error importing game modules: {e}")
+    print("Ensure you are running this from the repo root or tools/ directory.")
+    sys.exit(1)
+
+
+# Authoring keys present in content that DialogueManager does not enforce
+UNENFORCED_CHOICE_KEYS = ("condition", "skill_check")
+
+
+def describe_gates(choice):
+    """
+    Return the gates DialogueManager enforces on a choice, in its evaluation
+    order, as the `gate` tuples of the compiled requirements.
+    """
+    return [check.gate for check in compile_requirements(choice)]
+
+
+def _choice_gates(graph, node_id):
+    """Gate tuples for each choice of a node, read from the graph's compiled requirements."""
+    return [[check.gate for check in checks] for checks in graph.requirements[node_id]]
+
+
+def _format_gate(gate):
+    if gate[0] == "skill":
+        return f"{gate[1]} >= {gate[2]}"
+    return f"{gate[0]}:{gate[1]}"
+
+
+def _bfs(graph, follow_gated):
+    """Nodes reachable from the start node; optionally only through ungated edges."""
+    seen = {graph.start_node}
+    queue = deque([graph.start_node])
+    while queue:
+        node_id = queue.popleft()
+        node = graph.nodes[node_id]
+        if follow_gated:
+            targets = graph.edges(node_id)
+        else:
+            # Automatic checks and gated choices are the gated edges
+            targets = [] if "check" in node else [
+                c.get("next") for c, gates in zip(node.get("choices", []), _choice_gates(graph, node_id))
+                if not gates
+            ]
+        for target in targets:
+            if target in graph.nodes and target not in seen:
+                seen.add(target)
+                queue.append(target)
+    return seen
+
+
+def find_cycles(graph):
+    """Strongly connected components that form cycles (iterative Tarjan)."""
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    cycles = []
+    counter = 0
+
+    for root in graph.nodes:
+        if root in index:
+            continue
+        work = [(root, iter(graph.edges(root)))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node_id, children = work[-1]
+            advanced = False
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph.edges(child))))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    low[node_id] = min(low[node_id], index[child])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node_id])
+            if low[node_id] == index[node_id]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node_id:
+                        break
+                if len(component) > 1 or node_id in graph.edges(node_id):
+                    cycles.append(sorted(component))
+    return cycles
+
+
+def _gate_atom(gate):
+    """
+    The underlying fact a gate tests. A theory requirement and a theory block
+    on the same id read one atom, so a sample can never satisfy both.
+    """
+    if gate[0] == "theory_blocked":
+        return ("theory", gate[1])
+    return gate
+
+
+def simulate_reach(graph, samples, rng, min_level=0, max_level=6, gate_odds=0.5, max_steps=50):
+    """
+    Estimate per-node reach probability.
+
+    Each sample draws a character (a level per skill in [min_level, max_level]
+    and a coin flip per theory, relationship and flag), then walks the tree
+    picking uniformly among enabled choices. Automatic checks roll 2d6 + level
+    against the DC. Typed topics and parser triggers are not modelled.
+    """
+    choice_gates = {node_id: _choice_gates(graph, node_id) for node_id in graph.nodes}
+    visits = Counter()
+    for _ in range(samples):
+        atoms = {}
+
+        def level_of(skill):
+            atom = ("skill", skill)
+            if atom not in atoms:
+                atoms[atom] = rng.randint(min_level, max_level)
+            return atoms[atom]
+
+        def gate_open(gate):
+            if gate[0] == "skill":
+                return level_of(gate[1]) >= gate[2]
+            atom = _gate_atom(gate)
+            if atom not in atoms:
+                atoms[atom] = rng.random() < gate_odds
+            return atoms[atom] != (gate[0] == "theory_blocked")
+
+        seen = set()
+        node_id = graph.start_node
+        for _ in range(max_steps):
+            if node_id not in graph.nodes:
+                break
+            seen.add(node_id)
+            node = graph.nodes[node_id]
+
+            check = node.get("check")
+            if check:
+                roll = rng.randint(1, 6) + rng.randint(1, 6)
+                passed = roll + level_of(check.get("skill")) >= check.get("dc", 0)
+                node_id = check.get("success_next") if passed else check.get("fail_next")
+                continue
+
+            enabled = [
+                c for c, gates in zip(node.get("choices", []), choice_gates[node_id])
+                if all(gate_open(g) for g in gates)
+            ]
+            if not enabled:
+                break
+            node_id = rng.choice(enabled).get("next")
+            if node_id == EXIT_NODE:
+                break
+        visits.update(seen)
+
+    return {node_id: visits[node_id] / samples for node_id in graph.nodes}
+
+
+def analyze_file(path, samples=2000, seed=0, min_level=0, max_level=6, gate_odds=0.5):
+    """Analyse one dialogue file and return a plain-dict report."""
+    dialogue_id = os.path.splitext(os.path.basename(path))[0]
+    report = {"dialogue_id": dialogue_id, "path": path, "error": None}
+    try:
+        graph = DialogueGraph.from_file(dialogue_id, path)
+    except (OSError, ValueError) as e:
+        report["error"] = str(e)
+        return report
+
+    reachable = _bfs(graph, follow_gated=True)
+    freely_reachable = _bfs(graph, follow_gated=False)
+
+    gated = {}
+    exits = set()
+    unenforced = []
+    for node_id, node in graph.nodes.items():
+        check = node.get("check")
+        if check:
+            for key in ("success_next", "fail_next"):
+                target = check.get(key)
+                if target in graph.nodes:
+                    gated.setdefault(target, []).append(
+                        f"{node_id}: {check.get('skill')} check DC {check.get('dc')} ({key.split('_')[0]})"
+                    )
+        # Topics and parser triggers need typed input ("ask about ...", "say ...")
+        for topic in node.get("topics", []):
+            if topic.get("next") in graph.nodes:
+                gated.setdefault(topic["next"], []).append(
+                    f"{node_id}: ask about {'/'.join(topic.get('keywords', []))}"
+                )
+        for keyword, target in node.get("parser_triggers", {}).items():
+            if target in graph.nodes:
+                gated.setdefault(target, []).append(f"{node_id}: typed '{keyword}'")
+        for choice, gates in zip(node.get("choices", []), _choice_gates(graph, node_id)):
+            target = choice.get("next")
+            if target and target != EXIT_NODE and target not in graph.nodes:
+                exits.add(target)
+            if gates and target in graph.nodes:
+                gated.setdefault(target, []).append(
+                    f"{node_id}: " + ", ".join(_format_gate(g) for g in gates)
+                )
+            for key in UNENFORCED_CHOICE_KEYS:
+                if key in choice:
+                    unenforced.append(f"{node_id} -> {target}: '{key}' is not enforced")
+
+    rng = random.Random(seed ^ zlib.crc32(dialogue_id.encode("utf-8")))
+    reach = simulate_reach(graph, samples, rng, min_level, max_level, gate_odds)
+
+    report.update({
+        "start_node": graph.start_node,
+        "node_count": len(graph.nodes),
+        "unreachable": sorted(set(graph.nodes) - reachable),
+        "gated": {node_id: gated.get(node_id, []) for node_id in sorted(reachable - freely_reachable)},
+        "cycles": find_cycles(graph),
+        "scene_exits": sorted(exits),
+        "unenforced": unenforced,
+        "reach": reach,
+    })
+    return report
+
+
+def _analyze_task(args):
+    return analyze_file(*args)
+
+
+def analyze_directory(directory, samples=2000, workers=None, seed=0, min_level=0, max_level=6, gate_odds=0.5):
+    paths = sorted(
+        os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(".json")
+    )
+    tasks = [(p, samples, seed, min_level, max_level, gate_odds) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_analyze_task, tasks))
+
+
+def print_report(reports, elapsed, top=10):
+    hot = []
+    for report in reports:
+        print(f"\n=== {report['dialogue_id']} ===")
+        if report["error"]:
+            print(f"  [ERROR] {report['error']}")
+            continue
+        print(f"  Nodes: {report['node_count']}  Start: {report['start_node']}")
+        for node_id in report["unreachable"]:
+            print(f"  [UNREACHABLE] {node_id}")
+        for node_id, reasons in report["gated"].items():
+            print(f"  [GATED] {node_id} <- {'; '.join(reasons)}")
+        for cycle in report["cycles"]:
+            print(f"  [CYCLE] {' <-> '.join(cycle)}")
+        for exit_id in report["scene_exits"]:
+            print(f"  [EXIT] leaves dialogue to '{exit_id}'")
+        for warning in report["unenforced"]:
+            print(f"  [WARN] {warning}")
+        for node_id, prob in sorted(report["reach"].items(), key=lambda kv: -kv[1]):
+            print(f"    {prob:6.1%}  {node_id}")
+            hot.append((prob, report["dialogue_id"], node_id))
+
+    print("\n=== HOTTEST NODES (preload candidates) ===")
+    for prob, dialogue_id, node_id in sorted(hot, reverse=True)[:top]:
+        print(f"  {prob:6.1%}  {dialogue_id}:{node_id}")
+
+    errors = sum(1 for r in reports if r["error"])
+    unreachable = sum(len(r.get("unreachable", [])) for r in reports)
+    print(f"\nTrees: {len(reports)}  Errors: {errors}  Unreachable nodes: {unreachable}  Elapsed: {elapsed:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dialogue Coverage Analyzer")
+    parser.add_argument("directory", nargs="?", default=os.path.join("data", "dialogues"))
+    parser.add_argument("--samples", type=int, default=2000, help="Monte Carlo walks per tree")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-level", type=int, default=0, help="Lowest sampled skill level")
+    parser.add_argument("--max-level", type=int, default=6, help="Highest sampled skill level")
+    parser.add_argument("--gate-odds", type=float, default=0.5,
+                        help="Chance a theory is active / a relationship or flag gate is open in a sample")
+    parser.add_argument("--top", type=int, default=10, help="Hot nodes to list")
+    parser.add_argument("--json", dest="json_path", help="Also write the full report as JSON")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        print(f"Not a directory: {args.directory}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    reports = analyze_directory(
+        args.directory, samples=args.samples, workers=args.workers, seed=args.seed,
+        min_level=args.min_level, max_level=args.max_level, gate_odds=args.gate_odds
+    )
+    print_report(reports, time.perf_counter() - started, top=args.top)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2)
+        print(f"Report written to {args.json_path}")
+
+    sys.exit(1 if any(r["error"] for r in reports) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Parser Throughput Benchmark
+---------------------------
+Replays a command corpus built from the recorded playtests through the
+three layers every typed command passes:
+
+  1. CommandParser.normalize
+  2. ParserMemory (add_command + trigger activations)
+  3. Game.handle_parser_command, headless, in the scene the command targets
+
+and reports commands/second, p50/p99 latency and allocations for each.
+
+The playtest transcripts record which scenes (and dialogues) a run visited,
+not raw keystrokes, so the corpus is rebuilt from them: every visited
+scene contributes commands against its objects (examine / look at / x /
+interaction verbs / bare nouns / chained / typo'd forms), and
+_temp_parser_commands.txt contributes the typed command words it handles.
+Lines echoed as "> command" are taken verbatim if a transcript has them.
+
+Allocations are measured in a separate tracemalloc pass so tracing does not
+skew the timings: "peak" is the mean per-command peak, "retained" the
+blocks still alive after the whole stage.
+
+Use --save-baseline / --baseline to gate regressions:
+  python tools/parser_benchmark.py --save-baseline bench.json
+  python tools/parser_benchmark.py --baseline bench.json --tolerance 0.25
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+# Add src to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+repo_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(os.path.join(repo_root, "src"))
+sys.path.append(os.path.join(repo_root, "src", "engine"))
+sys.path.append(repo_root)
+
+try:
+    from engine.input_system import CommandParser
+    from engine.parser_memory import ParserMemory
+except ImportError as e:
+    print(f"Error importing game modules: {e}")
+    print("Ensure you are running this from the repo root or tools/ directory.")
+    sys.exit(1)
+
+
+DEFAULT_TRANSCRIPTS = ("playtest_log.txt", "playtest_final*.txt", "playtest_dialogue*.txt")
+DEFAULT_COMMAND_SOURCES = ("_temp_parser_commands.txt",)
+
+ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+SCENE_RE = re.compile(r">>> LOADING: (\S+)")
+DIALOGUE_RE = re.compile(r">>> TESTING DIALOGUE: (\S+)")
+ECHO_RE = re.compile(r"^\s*>\s+([a-zA-Z].*)$")
+# String literals in `clean == '...'`, `clean in [...]` and `.startswith('...')`
+LITERAL_LIST_RE = re.compile(r"clean in \[([^\]]*)\]")
+LITERAL_EQ_RE = re.compile(r"clean == ['\"]([^'\"]+)['\"]")
+LITERAL_PREFIX_RE = re.compile(r"startswith\(['\"]([^'\"]+)['\"]\)")
+QUOTED_RE = re.compile(r"['\"]([^'\"]+)['\"]")
+
+STAGES = ("normalize", "memory", "handler")
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def _expand(root, patterns):
+    paths = []
+    for pattern in patterns:
+        paths.extend(sorted(glob.glob(os.path.join(root, pattern))))
+    return paths
+
+
+def extract_transcript(path):
+    """Return (scene_ids, dialogue_ids, echoed_commands) in the order a transcript saw them."""
+    scenes, dialogues, echoed = [], [], []
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            line = ANSI_RE.sub("", line).rstrip("\n")
+            match = SCENE_RE.search(line)
+            if match:
+                scenes.append(match.group(1))
+                continue
+            match = DIALOGUE_RE.search(line)
+            if match:
+                dialogues.append(match.group(1))
+                continue
+            match = ECHO_RE.match(line)
+            if match:
+                echoed.append(match.group(1).strip())
+    return scenes, dialogues, echoed
+
+
+def extract_command_words(path):
+    """Typed command words from a process_command snippet; prefixes get a placeholder argument."""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        source = f.read()
+    words = []
+    for group in LITERAL_LIST_RE.findall(source):
+        words.extend(QUOTED_RE.findall(group))
+    words.extend(LITERAL_EQ_RE.findall(source))
+    words.extend(f"{prefix.strip()} theory_placeholder" for prefix in LITERAL_PREFIX_RE.findall(source))
+    return words
+
+
+def scene_commands(scene):
+    """Commands a player would type against one scene's objects."""
+    commands = []
+    for obj_id, obj in (scene.get("objects") or {}).items():
+        noun = obj_id.replace("_", " ")
+        commands += [f"examine {noun}", f"look at the {noun}", f"x {noun}", noun,
+                     f"exmaine {noun}", f"examine {noun} then take {noun}"]
+        if isinstance(obj, dict):
+            commands += [f"{verb} {noun}" for verb in (obj.get("interactions") or {})]
+    return commands
+
+
+def build_corpus(root, transcripts=DEFAULT_TRANSCRIPTS, command_sources=DEFAULT_COMMAND_SOURCES, scenes=None):
+    """
+    Build the replay corpus as a list of (scene_id or None, command).
+
+    `scenes` maps scene id -> scene data (Game.scene_manager.scenes); scenes
+    the transcripts visited but the content no longer has are skipped.
+    """
+    visited, echoed, words = [], [], []
+    sources = {"transcripts": [], "command_sources": []}
+    for path in _expand(root, transcripts):
+        scene_ids, _, lines = extract_transcript(path)
+        visited += scene_ids
+        echoed += lines
+        sources["transcripts"].append(os.path.basename(path))
+    for path in _expand(root, command_sources):
+        words += extract_command_words(path)
+        sources["command_sources"].append(os.path.basename(path))
+
+    corpus = []
+    scenes = scenes or {}
+    for scene_id in visited:
+        scene = scenes.get(scene_id)
+        if scene:
+            corpus += [(scene_id, command) for command in scene_commands(scene)]
+    corpus += [(None, command) for command in echoed + words]
+    return corpus, sources
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summarize(latencies_ns, total_ns):
+    ordered = sorted(latencies_ns)
+    return {
+        "commands": len(ordered),
+        "commands_per_sec": len(ordered) / (total_ns / 1e9) if total_ns else 0.0,
+        "p50_us": _percentile(ordered, 50) / 1000.0,
+        "p99_us": _percentile(ordered, 99) / 1000.0,
+    }
+
+
+def _timed(run_one, items):
+    latencies = []
+    clock = time.perf_counter_ns
+    started = clock()
+    for item in items:
+        t0 = clock()
+        run_one(item)
+        latencies.append(clock() - t0)
+    return latencies, clock() - started
+
+
+def _allocations(run_one, items):
+    tracemalloc.start()
+    try:
+        baseline_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        peak_total = 0
+        for item in items:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            run_one(item)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+        retained = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename")) - baseline_blocks
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_bytes_per_command": peak_total / len(items) if items else 0.0,
+        "retained_blocks": retained,
+    }
+
+
+class HeadlessReplay:
+    """A quiet Game that replays parsed commands in the scene they target."""
+
+    def __init__(self, seed=0):
+        with contextlib.redirect_stdout(io.StringIO()):
+            from game import Game
+            from engine.save_storage import MemorySaveStorage
+            self.game = Game(save_storage=MemorySaveStorage())
+            self.game.start_game()
+        self.seed = seed
+        self.scene_id = None
+
+    @property
+    def scenes(self):
+        return self.game.scene_manager.scenes
+
+    def reset(self):
+        random.seed(self.seed)
+        self.game.output.clear()
+
+    def run(self, item):
+        scene_id, command = item
+        game = self.game
+        if scene_id and scene_id != game.scene_manager.current_scene_id:
+            game.scene_manager.load_scene(scene_id)
+        for verb, target in game.parser.normalize(command):
+            game.handle_parser_command(verb, target)
+        # Keep the output buffer from growing across the run
+        game.output.clear()
+
+
+def run_benchmark(corpus, rounds=5, replay=None, measure_allocations=True):
+    """Run every stage `rounds` times over the corpus; returns a report dict."""
+    commands = [command for _, command in corpus]
+    parser = CommandParser()
+    memory = ParserMemory()
+    replay = replay or HeadlessReplay()
+
+    def memory_step(command):
+        memory.add_command(command)
+        memory.pop_activations()
+
+    runners = {
+        "normalize": (parser.normalize, commands),
+        "memory": (memory_step, commands),
+        "handler": (replay.run, corpus),
+    }
+
+    report = {"corpus_size": len(corpus), "rounds": rounds, "stages": {}}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for stage in STAGES:
+            run_one, items = runners[stage]
+            latencies, total = [], 0
+            replay.reset()
+            run_one(items[0]) if items else None  # Warm caches before timing
+            for _ in range(rounds):
+                replay.reset()
+                stage_latencies, stage_total = _timed(run_one, items)
+                latencies += stage_latencies
+                total += stage_total
+            result = _summarize(latencies, total)
+            if measure_allocations and items:
+                replay.reset()
+                result.update(_allocations(run_one, items))
+            report["stages"][stage] = result
+    return report
+
+
+def compare_to_baseline(report, baseline, tolerance):
+    """Regressions beyond `tolerance` (0.25 = 25%) in throughput or p99 latency."""
+    failures = []
+    for stage, current in report["stages"].items():
+        previous = baseline.get("stages", {}).get(stage)
+        if not previous:
+            continue
+        if current["commands_per_sec"] < previous["commands_per_sec"] * (1 - tolerance):
+            failures.append(f"{stage}: {current['commands_per_sec']:.0f} cmd/s "
+                            f"(baseline {previous['commands_per_sec']:.0f})")
+        if current["p99_us"] > previous["p99_us"] * (1 + tolerance):
+            failures.append(f"{stage}: p99 {current['p99_us']:.1f}us "
+                            f"(baseline {previous['p99_us']:.1f}us)")
+    return failures
+
+
+def print_report(report, sources):
+    print("=== PARSER BENCHMARK ===")
+    print(f"Transcripts: {', '.join(sources['transcripts']) or '(none)'}")
+    print(f"Command sources: {', '.join(sources['command_sources']) or '(none)'}")
+    print(f"Corpus: {report['corpus_size']} commands x {report['rounds']} rounds\n")
+    print(f"  {'stage':<10} {'cmd/s':>10} {'p50 us':>9} {'p99 us':>9} {'peak B/cmd':>11} {'retained':>9}")
+    for stage in STAGES:
+        s = report["stages"].get(stage)
+        if not s:
+            continue
+        print(f"  {stage:<10} {s['commands_per_sec']:>10.0f} {s['p50_us']:>9.1f} {s['p99_us']:>9.1f} "
+              f"{s.get('peak_bytes_per_command', 0):>11.0f} {s.get('retained_blocks', 0):>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parser Throughput Benchmark")
+    parser.add_argument("--root", default=repo_root, help="Directory holding the transcripts")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed passes over the corpus per stage")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-alloc", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--json", dest="json_path", help="Also write the report as JSON")
+    parser.add_argument("--save-baseline", help="Write this run as a baseline file")
+    parser.add_argument("--baseline", help="Fail if this run regresses against a baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed regression (fraction)")
+    args = parser.parse_args()
+
+    replay = HeadlessReplay(seed=args.seed)
+    corpus, sources = build_corpus(args.root, scenes=replay.scenes)
+    if not corpus:
+        print(f"No commands could be extracted from {args.root}")
+        sys.exit(1)
+
+    report = run_benchmark(corpus, rounds=args.rounds, replay=replay, measure_allocations=not args.no_alloc)
+    report["sources"] = sources
+    print_report(report, sources)
+
+    for path in filter(None, (args.json_path, args.save_baseline)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            failures = compare_to_baseline(report, json.load(f), args.tolerance)
+        if failures:
+            print("\n[REGRESSION]")
+            for failure in failures:
+                print(f"  {failure}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
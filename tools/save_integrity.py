@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Save Integrity Scanner
+----------------------
+Operator tool that scans a whole saves tree in parallel, verifies save
+hashes, detects truncated / legacy-format files, checks references against
+the content pack and can optionally migrate files to the current format.
+Both file slots (*.json) and SQLite save databases (*.db) are scanned.
+
+Usage:
+  python tools/save_integrity.py scan <saves_root> [--content data] [--workers N]
+  python tools/save_integrity.py repair <saves_root> [--content data] [--workers N] [--dry-run]
+                                       [--accept-legacy-hashes]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Add src to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, "../src")
+sys.path.append(src_path)
+
+try:
+    from engine.save_system import SaveSystem, SAVE_FORMAT_VERSION
+    from engine.save_migrations import SaveData
+except ImportError as e:
+    print(f"Error importing game modules: {e}")
+    print("Ensure you are running this from the repo root or tools/ directory.")
+    sys.exit(1)
+
+
+# Status codes reported per file
+OK = "ok"
+LEGACY = "legacy"              # Valid hash, older format version
+HASH_MISMATCH = "hash_mismatch"  # Wrong or missing hash; every writer signs saves
+# Older format whose hash can't be reproduced: pre-1.2 writers hashed the raw
+# state (sets via str()) but wrote sets to disk as lists
+LEGACY_UNVERIFIED = "legacy_unverified"
+DUPLICATED = "duplicated"      # Two JSON documents concatenated (pre-1.1 writer bug)
+TRUNCATED = "truncated"
+UNREADABLE = "unreadable"
+
+# Per-worker content index, built once by _init_worker
+_CONTENT = None
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+
+def _collect_ids(path, key="id"):
+    """Collect object ids from a JSON file holding either one object or a list."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    if isinstance(data, list):
+        return {item[key] for item in data if isinstance(item, dict) and key in item}
+    if isinstance(data, dict):
+        if key in data:
+            return {data[key]}
+        return set(data.keys())
+    return set()
+
+
+def _collect_dir_ids(directory):
+    ids = set()
+    if not os.path.isdir(directory):
+        return ids
+    for filename in os.listdir(directory):
+        if filename.endswith(".json"):
+            ids |= _collect_ids(os.path.join(directory, filename))
+    return ids
+
+
+def load_content_index(content_root):
+    """Build the set of valid scene, theory and NPC ids for a content pack."""
+    scenes = _collect_dir_ids(os.path.join(content_root, "scenes"))
+    scenes |= _collect_ids(os.path.join(content_root, "scenes.json"))
+
+    theories = _collect_dir_ids(os.path.join(content_root, "theories"))
+    theories_file = os.path.join(content_root, "theories.json")
+    if os.path.exists(theories_file):
+        with open(theories_file, 'r', encoding='utf-8') as f:
+            theories |= set(json.load(f).keys())
+
+    npcs = _collect_dir_ids(os.path.join(content_root, "npcs"))
+    return {"scenes": scenes, "theories": theories, "npcs": npcs}
+
+
+def _init_worker(content_root):
+    global _CONTENT
+    _CONTENT = load_content_index(content_root)
+
+
+def _decode(text):
+    """
+    Decode a save document.
+
+    Returns (data, status) where status is OK, DUPLICATED or TRUNCATED.
+    """
+    decoder = json.JSONDecoder()
+    stripped = text.lstrip()
+    try:
+        data, end = decoder.raw_decode(stripped)
+    except json.JSONDecodeError as e:
+        # Errors at the very end of the file (or a string that never closes)
+        # mean it was cut off mid-write
+        if e.pos >= len(stripped.rstrip()) - 1 or e.msg.startswith("Unterminated string"):
+            return None, TRUNCATED
+        return None, UNREADABLE
+    if stripped[end:].strip():
+        return data, DUPLICATED
+    return data, OK
+
+
+def _check_references(data, content):
+    """Return a list of dangling references in a decoded save."""
+    problems = []
+    if not content:
+        return problems
+
+    scene_ids = set()
+    if data.get("scene"):
+        scene_ids.add(data["scene"])
+    scene_state = data.get("scene_state") or {}
+    if scene_state.get("current_scene_id"):
+        scene_ids.add(scene_state["current_scene_id"])
+    scene_ids.update(scene_state.get("visited_scenes", []))
+    for scene_id in sorted(scene_ids - content["scenes"]):
+        problems.append(f"unknown scene '{scene_id}'")
+
+    theory_ids = set((data.get("board_state") or {}).get("theories", {}).keys())
+    for theory_id in sorted(theory_ids - content["theories"]):
+        problems.append(f"unknown theory '{theory_id}'")
+
+    npc_ids = set(((data.get("additional_systems") or {}).get("npc_system") or {}).keys())
+    for npc_id in sorted(npc_ids - content["npcs"]):
+        problems.append(f"unknown npc '{npc_id}'")
+
+    return problems
+
+
+def migrate_save(data):
+    """Upgrade a decoded save to the current layout and re-sign it."""
+    data = SaveData(data).migrate_all()
+    data["hash"] = SaveSystem._calculate_hash(data)
+    return data
+
+
+def _classify(data, status):
+    """Final status of a decoded document: hashes are checked for duplicated files too."""
+    if not isinstance(data, dict):
+        return UNREADABLE
+    stored_hash = data.get("hash")
+    if not stored_hash:
+        return HASH_MISMATCH
+    if stored_hash != SaveSystem._calculate_hash(data):
+        return LEGACY_UNVERIFIED if data.get("version") != SAVE_FORMAT_VERSION else HASH_MISMATCH
+    if status == OK and data.get("version") != SAVE_FORMAT_VERSION:
+        return LEGACY
+    return status
+
+
+def check_document(text, content=None):
+    """
+    Decode and classify one save payload.
+
+    Returns (data, result) where result holds the size, status and reference
+    problems; data is the decoded save (first document) or None.
+    """
+    result = {"bytes": len(text), "status": OK, "problems": [], "repaired": False}
+    data, status = _decode(text)
+    if data is None:
+        result["status"] = status
+        return None, result
+    result["status"] = _classify(data, status)
+    if isinstance(data, dict):
+        result["problems"] = _check_references(data, content)
+    return data, result
+
+
+def _needs_repair(result, accept_legacy_hashes=False):
+    # Tampered files are reported, never silently re-signed; legacy saves
+    # whose hash can't be checked are re-signed only when the operator asks
+    if result["status"] == LEGACY_UNVERIFIED:
+        return accept_legacy_hashes
+    return result["status"] in (LEGACY, DUPLICATED)
+
+
+def scan_file(path, repair=False, dry_run=False, content=None, accept_legacy_hashes=False):
+    """
+    Scan a single save file.
+
+    Returns a dict with the file path, size, status, reference problems and
+    whether the file was (or would be) repaired. LEGACY_UNVERIFIED files are
+    only repaired with accept_legacy_hashes.
+    """
+    content = content if content is not None else _CONTENT
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return {"path": path, "bytes": 0, "status": UNREADABLE, "problems": [str(e)], "repaired": False}
+
+    data, result = check_document(text, content)
+    result = dict(path=path, **result)
+
+    if repair and _needs_repair(result, accept_legacy_hashes):
+        if not dry_run:
+            migrated = migrate_save(data)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(migrated, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        result["repaired"] = True
+
+    return result
+
+
+def scan_database(path, repair=False, dry_run=False, content=None, accept_legacy_hashes=False):
+    """
+    Scan every slot of every player in a SQLite save database
+    (see engine.save_storage.SQLiteSaveStorage).
+
+    Returns one result per slot; paths read "<db>::<player_id>/<slot_id>".
+    """
+    content = content if content is not None else _CONTENT
+    try:
+        conn = sqlite3.connect(path)
+        rows = conn.execute("SELECT player_id, slot_id, payload FROM saves").fetchall()
+    except sqlite3.Error as e:
+        return [{"path": path, "bytes": 0, "status": UNREADABLE, "problems": [str(e)], "repaired": False}]
+
+    results = []
+    try:
+        for player_id, slot_id, payload in rows:
+            data, result = check_document(payload, content)
+            result = dict(path=f"{path}::{player_id}/{slot_id}", **result)
+            if repair and _needs_repair(result, accept_legacy_hashes):
+                if not dry_run:
+                    conn.execute(
+                        "UPDATE saves SET payload = ? WHERE player_id = ? AND slot_id = ?",
+                        (json.dumps(migrate_save(data), indent=2, ensure_ascii=False), player_id, slot_id)
+                    )
+                result["repaired"] = True
+            results.append(result)
+        conn.commit()
+    finally:
+        conn.close()
+    return results
+
+
+def _is_database(path):
+    if not path.endswith(SQLITE_SUFFIXES):
+        return False
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def _scan_task(args):
+    path, repair, dry_run, accept_legacy_hashes = args
+    if path.endswith(SQLITE_SUFFIXES):
+        return scan_database(path, repair=repair, dry_run=dry_run, accept_legacy_hashes=accept_legacy_hashes)
+    return [scan_file(path, repair=repair, dry_run=dry_run, accept_legacy_hashes=accept_legacy_hashes)]
+
+
+def find_save_files(root):
+    """Yield every save file and save database below root (journal segments are skipped)."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if filename.endswith(".json") or _is_database(path):
+                yield path
+
+
+def scan_tree(root, content_root="data", workers=None, repair=False, dry_run=False, verbose=False,
+              accept_legacy_hashes=False):
+    """Scan a saves tree with a process pool and print throughput and a summary."""
+    paths = list(find_save_files(root))
+    print(f"Scanning {len(paths)} save files and databases under {root} ...")
+
+    started = time.perf_counter()
+    results = []
+    tasks = [(p, repair, dry_run, accept_legacy_hashes) for p in paths]
+    chunksize = max(1, len(tasks) // ((workers or os.cpu_count() or 1) * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(content_root,)) as pool:
+        for file_results in pool.map(_scan_task, tasks, chunksize=chunksize):
+            for result in file_results:
+                results.append(result)
+                if verbose or result["status"] != OK or result["problems"]:
+                    _print_result(result, root)
+    elapsed = max(time.perf_counter() - started, 1e-9)
+
+    _print_summary(results, elapsed)
+    return results
+
+
+def _print_result(result, root):
+    rel = os.path.relpath(result["path"], root)
+    line = f"  [{result['status'].upper()}] {rel}"
+    if result["repaired"]:
+        line += " (migrated)"
+    print(line)
+    for problem in result["problems"]:
+        print(f"      - {problem}")
+
+
+def _print_summary(results, elapsed):
+    statuses = Counter(r["status"] for r in results)
+    total_bytes = sum(r["bytes"] for r in results)
+    dangling = sum(1 for r in results if r["problems"])
+    repaired = sum(1 for r in results if r["repaired"])
+
+    print("\n=== SAVE INTEGRITY SUMMARY ===")
+    print(f"Saves scanned:   {len(results)}")
+    for status in (OK, LEGACY, LEGACY_UNVERIFIED, HASH_MISMATCH, DUPLICATED, TRUNCATED, UNREADABLE):
+        print(f"  {status:<18} {statuses.get(status, 0)}")
+    print(f"Dangling refs:   {dangling} files")
+    print(f"Migrated:        {repaired} files")
+    print(f"Elapsed:         {elapsed:.2f}s")
+    print(f"Throughput:      {len(results) / elapsed:.1f} files/s, {total_bytes / elapsed / 1e6:.2f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Save Integrity Scanner")
+    subparsers = parser.add_subparsers(dest="command")
+
+    for name, help_text in (("scan", "Verify every save in a tree"),
+                            ("repair", "Verify and migrate legacy saves to the current format")):
+        p = subparsers.add_parser(name, help=help_text)
+        p.add_argument("root", help="Root directory of the saves tree")
+        p.add_argument("--content", default="data", help="Content pack used for reference checks")
+        p.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+        p.add_argument("--verbose", action="store_true", help="List healthy files as well")
+        if name == "repair":
+            p.add_argument("--dry-run", action="store_true", help="Report what would be migrated")
+            p.add_argument("--accept-legacy-hashes", action="store_true",
+                           help="Also migrate and re-sign legacy saves whose old-scheme hash can't be verified")
+
+    args = parser.parse_args()
+
+    if args.command in ("scan", "repair"):
+        results = scan_tree(
+            args.root,
+            content_root=args.content,
+            workers=args.workers,
+            repair=args.command == "repair",
+            dry_run=getattr(args, "dry_run", False),
+            verbose=args.verbose,
+            accept_legacy_hashes=getattr(args, "accept_legacy_hashes", False)
+        )
+        bad = [r for r in results if r["status"] in (HASH_MISMATCH, TRUNCATED, UNREADABLE)]
+        sys.exit(1 if bad else 0)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()